@@ -3,8 +3,12 @@ from memu.app.settings import (
     BlobConfig,
     DatabaseConfig,
     DefaultUserModel,
+    EmbeddingBatchConfig,
+    EmbeddingCacheConfig,
     LLMConfig,
     LLMProfilesConfig,
+    LLMRateLimitConfig,
+    LLMRetryConfig,
     MemorizeConfig,
     RetrieveConfig,
     UserConfig,
@@ -20,8 +24,12 @@ __all__ = [
     "BlobConfig",
     "DatabaseConfig",
     "DefaultUserModel",
+    "EmbeddingBatchConfig",
+    "EmbeddingCacheConfig",
     "LLMConfig",
     "LLMProfilesConfig",
+    "LLMRateLimitConfig",
+    "LLMRetryConfig",
     "LocalWorkflowRunner",
     "MemorizeConfig",
     "MemoryService",
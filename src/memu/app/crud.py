@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, cast, get_args
 
 from pydantic import BaseModel
 
+from memu.database.filters import WhereFilter
 from memu.database.models import MemoryCategory, MemoryType
 from memu.prompts.category_patch import CATEGORY_PATCH_PROMPT
 from memu.workflow.step import WorkflowState, WorkflowStep
@@ -17,6 +18,7 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from memu.app.service import Context
     from memu.app.settings import PatchConfig
+    from memu.database.aio import AsyncDatabase
     from memu.database.interfaces import Database
 
 
@@ -25,6 +27,7 @@ class CRUDMixin:
         _run_workflow: Callable[..., Awaitable[WorkflowState]]
         _get_context: Callable[[], Context]
         _get_database: Callable[[], Database]
+        _get_async_database: Callable[[Database], AsyncDatabase]
         _get_step_llm_client: Callable[[Mapping[str, Any] | None], Any]
         _get_step_embedding_client: Callable[[Mapping[str, Any] | None], Any]
         _get_llm_client: Callable[..., Any]
@@ -192,10 +195,13 @@ class CRUDMixin:
             "where",
         }
 
-    def _normalize_where(self, where: Mapping[str, Any] | None) -> dict[str, Any]:
-        """Validate and clean the `where` scope filters against the configured user model."""
+    def _normalize_where(self, where: Mapping[str, Any] | None) -> WhereFilter:
+        """
+        Validate the `where` scope filters against the configured user model and
+        compile them once; the result is shared by every step and repository call.
+        """
         if not where:
-            return {}
+            return WhereFilter()
 
         valid_fields = set(getattr(self.user_model, "model_fields", {}).keys())
         cleaned: dict[str, Any] = {}
@@ -209,19 +215,21 @@ class CRUDMixin:
                 raise ValueError(msg)
             cleaned[raw_key] = value
 
-        return cleaned
+        return WhereFilter(cleaned)
 
-    def _crud_list_memory_items(self, state: WorkflowState, step_context: Any) -> WorkflowState:
+    async def _crud_list_memory_items(self, state: WorkflowState, step_context: Any) -> WorkflowState:
         where_filters = state.get("where") or {}
         store = state["store"]
-        items = store.memory_item_repo.list_items(where_filters)
+        db = self._get_async_database(store)
+        items = await db.memory_item_repo.list_items(where_filters, with_embeddings=False)
         state["items"] = items
         return state
 
-    def _crud_list_memory_categories(self, state: WorkflowState, step_context: Any) -> WorkflowState:
+    async def _crud_list_memory_categories(self, state: WorkflowState, step_context: Any) -> WorkflowState:
         where_filters = state.get("where") or {}
         store = state["store"]
-        categories = store.memory_category_repo.list_categories(where_filters)
+        db = self._get_async_database(store)
+        categories = await db.memory_category_repo.list_categories(where_filters, with_embeddings=False)
         state["categories"] = categories
         return state
 
@@ -243,24 +251,27 @@ class CRUDMixin:
         state["response"] = response
         return state
 
-    def _crud_clear_memory_categories(self, state: WorkflowState, step_context: Any) -> WorkflowState:
+    async def _crud_clear_memory_categories(self, state: WorkflowState, step_context: Any) -> WorkflowState:
         where_filters = state.get("where") or {}
         store = state["store"]
-        deleted = store.memory_category_repo.clear_categories(where_filters)
+        db = self._get_async_database(store)
+        deleted = await db.memory_category_repo.clear_categories(where_filters)
         state["deleted_categories"] = deleted
         return state
 
-    def _crud_clear_memory_items(self, state: WorkflowState, step_context: Any) -> WorkflowState:
+    async def _crud_clear_memory_items(self, state: WorkflowState, step_context: Any) -> WorkflowState:
         where_filters = state.get("where") or {}
         store = state["store"]
-        deleted = store.memory_item_repo.clear_items(where_filters)
+        db = self._get_async_database(store)
+        deleted = await db.memory_item_repo.clear_items(where_filters)
         state["deleted_items"] = deleted
         return state
 
-    def _crud_clear_memory_resources(self, state: WorkflowState, step_context: Any) -> WorkflowState:
+    async def _crud_clear_memory_resources(self, state: WorkflowState, step_context: Any) -> WorkflowState:
         where_filters = state.get("where") or {}
         store = state["store"]
-        deleted = store.resource_repo.clear_resources(where_filters)
+        db = self._get_async_database(store)
+        deleted = await db.resource_repo.clear_resources(where_filters)
         state["deleted_resources"] = deleted
         return state
 
@@ -396,8 +407,8 @@ class CRUDMixin:
                 handler=self._patch_persist_and_index,
                 requires={"category_updates", "ctx", "store"},
                 produces={"categories"},
-                capabilities={"db", "llm"},
-                config={"chat_llm_profile": "default"},
+                capabilities={"db", "llm", "vector"},
+                config={"chat_llm_profile": "default", "embed_llm_profile": "embedding"},
             ),
             WorkflowStep(
                 step_id="build_response",
@@ -436,8 +447,8 @@ class CRUDMixin:
                 handler=self._patch_persist_and_index,
                 requires={"category_updates", "ctx", "store"},
                 produces={"categories"},
-                capabilities={"db", "llm"},
-                config={"chat_llm_profile": "default"},
+                capabilities={"db", "llm", "vector"},
+                config={"chat_llm_profile": "default", "embed_llm_profile": "embedding"},
             ),
             WorkflowStep(
                 step_id="build_response",
@@ -476,8 +487,8 @@ class CRUDMixin:
                 handler=self._patch_persist_and_index,
                 requires={"category_updates", "ctx", "store"},
                 produces={"categories"},
-                capabilities={"db", "llm"},
-                config={"chat_llm_profile": "default"},
+                capabilities={"db", "llm", "vector"},
+                config={"chat_llm_profile": "default", "embed_llm_profile": "embedding"},
             ),
             WorkflowStep(
                 step_id="build_response",
@@ -503,13 +514,14 @@ class CRUDMixin:
         memory_payload = state["memory_payload"]
         ctx = state["ctx"]
         store = state["store"]
+        db = self._get_async_database(store)
         user = state["user"]
         category_memory_updates: dict[str, tuple[Any, Any]] = {}
 
         embed_payload = [memory_payload["content"]]
         content_embedding = (await self._get_step_embedding_client(step_context).embed(embed_payload))[0]
 
-        item = store.memory_item_repo.create_item(
+        item = await db.memory_item_repo.create_item(
             memory_type=memory_payload["type"],
             summary=memory_payload["content"],
             embedding=content_embedding,
@@ -518,7 +530,7 @@ class CRUDMixin:
         cat_names = memory_payload["categories"]
         mapped_cat_ids = self._map_category_names_to_ids(cat_names, ctx)
         for cid in mapped_cat_ids:
-            store.category_item_repo.link_item_category(item.id, cid, user_data=dict(user or {}))
+            await db.category_item_repo.link_item_category(item.id, cid, user_data=dict(user or {}))
             category_memory_updates[cid] = (None, memory_payload["content"])
 
         state.update({
@@ -532,15 +544,16 @@ class CRUDMixin:
         memory_payload = state["memory_payload"]
         ctx = state["ctx"]
         store = state["store"]
+        db = self._get_async_database(store)
         user = state["user"]
         category_memory_updates: dict[str, tuple[Any, Any]] = {}
 
-        item = store.memory_item_repo.get_item(memory_id)
+        item = await db.memory_item_repo.get_item(memory_id)
         if not item:
             msg = f"Memory item with id {memory_id} not found"
             raise ValueError(msg)
         old_content = item.summary
-        old_item_categories = store.category_item_repo.get_item_categories(memory_id)
+        old_item_categories = await db.category_item_repo.get_item_categories(memory_id)
         mapped_old_cat_ids = [cat.category_id for cat in old_item_categories]
 
         if memory_payload["content"]:
@@ -550,7 +563,7 @@ class CRUDMixin:
             content_embedding = None
 
         if memory_payload["type"] or memory_payload["content"]:
-            item = store.memory_item_repo.update_item(
+            item = await db.memory_item_repo.update_item(
                 item_id=memory_id,
                 memory_type=memory_payload["type"],
                 summary=memory_payload["content"],
@@ -562,10 +575,10 @@ class CRUDMixin:
         cats_to_remove = set(mapped_old_cat_ids) - set(mapped_new_cat_ids)
         cats_to_add = set(mapped_new_cat_ids) - set(mapped_old_cat_ids)
         for cid in cats_to_remove:
-            store.category_item_repo.unlink_item_category(memory_id, cid)
+            await db.category_item_repo.unlink_item_category(memory_id, cid)
             category_memory_updates[cid] = (old_content, None)
         for cid in cats_to_add:
-            store.category_item_repo.link_item_category(memory_id, cid, user_data=dict(user or {}))
+            await db.category_item_repo.link_item_category(memory_id, cid, user_data=dict(user or {}))
             category_memory_updates[cid] = (None, item.summary)
 
         if memory_payload["content"]:
@@ -581,16 +594,17 @@ class CRUDMixin:
     async def _patch_delete_memory_item(self, state: WorkflowState, step_context: Any) -> WorkflowState:
         memory_id = state["memory_id"]
         store = state["store"]
+        db = self._get_async_database(store)
         category_memory_updates: dict[str, tuple[Any, Any]] = {}
 
-        item = store.memory_item_repo.get_item(memory_id)
+        item = await db.memory_item_repo.get_item(memory_id)
         if not item:
             msg = f"Memory item with id {memory_id} not found"
             raise ValueError(msg)
-        item_categories = store.category_item_repo.get_item_categories(memory_id)
+        item_categories = await db.category_item_repo.get_item_categories(memory_id)
         for cat in item_categories:
             category_memory_updates[cat.category_id] = (item.summary, None)
-        store.memory_item_repo.delete_item(memory_id)
+        await db.memory_item_repo.delete_item(memory_id)
 
         state.update({
             "memory_item": item,
@@ -605,6 +619,7 @@ class CRUDMixin:
             ctx=state["ctx"],
             store=state["store"],
             llm_client=llm_client,
+            embed_client=self._get_step_embedding_client(step_context),
         )
         return state
 
@@ -641,6 +656,7 @@ class CRUDMixin:
         ctx: Context,
         store: Database,
         llm_client: Any | None = None,
+        embed_client: Any | None = None,
     ) -> None:
         if not updates:
             return
@@ -659,14 +675,25 @@ class CRUDMixin:
         if not tasks:
             return
         patches = await asyncio.gather(*tasks)
+        new_summaries: dict[str, str] = {}
         for cid, patch in zip(target_ids, patches, strict=True):
             need_update, summary = self._parse_category_patch_response(patch)
-            if not need_update:
-                continue
-            cat = store.memory_category_repo.categories.get(cid)
-            store.memory_category_repo.update_category(
+            if need_update:
+                new_summaries[cid] = summary.strip()
+        if not new_summaries:
+            return
+        # Embed the patched summaries in one batch so retrieval can reuse them
+        embed_ids = [cid for cid, summary in new_summaries.items() if summary]
+        summary_embeddings: dict[str, list[float]] = {}
+        if embed_ids:
+            vectors = await (embed_client or self._get_llm_client()).embed([new_summaries[cid] for cid in embed_ids])
+            summary_embeddings = dict(zip(embed_ids, vectors, strict=True))
+        db = self._get_async_database(store)
+        for cid, summary in new_summaries.items():
+            await db.memory_category_repo.update_category(
                 category_id=cid,
-                summary=summary.strip(),
+                summary=summary,
+                summary_embedding=summary_embeddings.get(cid),
             )
 
     def _build_category_patch_prompt(
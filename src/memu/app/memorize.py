@@ -5,6 +5,7 @@ import json
 import logging
 import pathlib
 import re
+from collections import Counter
 from collections.abc import Awaitable, Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any, cast
 from xml.etree.ElementTree import Element
@@ -41,6 +42,7 @@ if TYPE_CHECKING:
     from memu.app.service import Context
     from memu.app.settings import MemorizeConfig
     from memu.blob.local_fs import LocalFS
+    from memu.database.aio import AsyncDatabase
     from memu.database.interfaces import Database
 
 
@@ -54,6 +56,7 @@ class MemorizeMixin:
         _run_workflow: Callable[..., Awaitable[WorkflowState]]
         _get_context: Callable[[], Context]
         _get_database: Callable[[], Database]
+        _get_async_database: Callable[[Database], AsyncDatabase]
         _get_step_llm_client: Callable[[Mapping[str, Any] | None], Any]
         _get_step_embedding_client: Callable[[Mapping[str, Any] | None], Any]
         _get_llm_client: Callable[..., Any]
@@ -151,8 +154,11 @@ class MemorizeMixin:
                 handler=self._memorize_persist_and_index,
                 requires={"category_updates", "ctx", "store"},
                 produces={"categories"},
-                capabilities={"db", "llm"},
-                config={"chat_llm_profile": self.memorize_config.category_update_llm_profile},
+                capabilities={"db", "llm", "vector"},
+                config={
+                    "chat_llm_profile": self.memorize_config.category_update_llm_profile,
+                    "embed_llm_profile": "embedding",
+                },
             ),
             WorkflowStep(
                 step_id="build_response",
@@ -202,24 +208,33 @@ class MemorizeMixin:
         resource_plans: list[dict[str, Any]] = []
         total_segments = len(preprocessed_resources) or 1
 
-        for idx, prep in enumerate(preprocessed_resources):
-            res_url = self._segment_resource_url(state["resource_url"], idx, total_segments)
-            text = prep.get("text")
-            caption = prep.get("caption")
-
-            structured_entries = await self._generate_structured_entries(
-                resource_url=res_url,
-                modality=state["modality"],
-                memory_types=state["memory_types"],
-                text=text,
-                categories_prompt_str=state["categories_prompt_str"],
-                llm_client=llm_client,
-            )
+        res_urls = [
+            self._segment_resource_url(state["resource_url"], idx, total_segments)
+            for idx in range(len(preprocessed_resources))
+        ]
+        # Segments are extracted concurrently; gather keeps results in segment order
+        entries_per_segment = await _gather_bounded(
+            [
+                self._generate_structured_entries(
+                    resource_url=res_url,
+                    modality=state["modality"],
+                    memory_types=state["memory_types"],
+                    text=prep.get("text"),
+                    categories_prompt_str=state["categories_prompt_str"],
+                    llm_client=llm_client,
+                )
+                for res_url, prep in zip(res_urls, preprocessed_resources, strict=True)
+            ],
+            self.memorize_config.segment_concurrency,
+        )
 
+        for res_url, prep, structured_entries in zip(
+            res_urls, preprocessed_resources, entries_per_segment, strict=True
+        ):
             resource_plans.append({
                 "resource_url": res_url,
-                "text": text,
-                "caption": caption,
+                "text": prep.get("text"),
+                "caption": prep.get("caption"),
                 "entries": structured_entries,
             })
 
@@ -287,6 +302,7 @@ class MemorizeMixin:
             ctx=state["ctx"],
             store=state["store"],
             llm_client=llm_client,
+            embed_client=self._get_step_embedding_client(step_context),
         )
         if self.memorize_config.enable_item_references:
             await self._persist_item_references(
@@ -367,7 +383,8 @@ class MemorizeMixin:
         else:
             caption_embedding = None
 
-        res = store.resource_repo.create_resource(
+        db = self._get_async_database(store)
+        res = await db.resource_repo.create_resource(
             url=resource_url,
             modality=modality,
             local_path=local_path,
@@ -594,30 +611,38 @@ class MemorizeMixin:
         summary_payloads = [content for _, content, _ in structured_entries]
         client = embed_client or self._get_llm_client()
         item_embeddings = await client.embed(summary_payloads) if summary_payloads else []
-        items: list[MemoryItem] = []
-        rels: list[CategoryItem] = []
         # Changed: now stores (item_id, summary) tuples for reference support
         category_memory_updates: dict[str, list[tuple[str, str]]] = {}
 
         reinforce = self.memorize_config.enable_item_reinforcement
-        for (memory_type, summary_text, cat_names), emb in zip(structured_entries, item_embeddings, strict=True):
-            item = store.memory_item_repo.create_item(
-                resource_id=resource_id,
-                memory_type=memory_type,
-                summary=summary_text,
-                embedding=emb,
-                user_data=dict(user or {}),
-                reinforce=reinforce,
-            )
-            items.append(item)
-            if reinforce and item.extra.get("reinforcement_count", 1) > 1:
+        db = self._get_async_database(store)
+        items = await db.memory_item_repo.create_items_bulk(
+            resource_id=resource_id,
+            entries=[
+                (memory_type, summary_text, emb)
+                for (memory_type, summary_text, _), emb in zip(structured_entries, item_embeddings, strict=True)
+            ],
+            user_data=dict(user or {}),
+            reinforce=reinforce,
+        )
+
+        occurrences = Counter(item.id for item in items)
+        seen: set[str] = set()
+        pairs: list[tuple[str, str]] = []
+        for (_, summary_text, cat_names), item in zip(structured_entries, items, strict=True):
+            if item.id in seen:
+                # Repeated within this batch: the first occurrence already linked it
+                continue
+            seen.add(item.id)
+            if reinforce and item.extra.get("reinforcement_count", 1) > occurrences[item.id]:
                 # existing item
                 continue
             mapped_cat_ids = self._map_category_names_to_ids(cat_names, ctx)
             for cid in mapped_cat_ids:
-                rels.append(store.category_item_repo.link_item_category(item.id, cid, user_data=dict(user or {})))
+                pairs.append((item.id, cid))
                 # Store (item_id, summary) tuple for reference support
                 category_memory_updates.setdefault(cid, []).append((item.id, summary_text))
+        rels = await db.category_item_repo.link_many(pairs, user_data=dict(user or {}))
 
         return items, rels, category_memory_updates
 
@@ -656,10 +681,11 @@ class MemorizeMixin:
         cat_vecs = await self._get_llm_client("embedding").embed(cat_texts)
         ctx.category_ids = []
         ctx.category_name_to_id = {}
+        db = self._get_async_database(store)
         for cfg, vec in zip(self.category_configs, cat_vecs, strict=True):
             name = cfg.name.strip() or "Untitled"
             description = cfg.description.strip()
-            cat = store.memory_category_repo.get_or_create_category(
+            cat = await db.memory_category_repo.get_or_create_category(
                 name=name, description=description, embedding=vec, user_data=dict(user or {})
             )
             ctx.category_ids.append(cat.id)
@@ -813,7 +839,7 @@ class MemorizeMixin:
         # Generate caption for each segment and return as separate resources
         lines = conversation_text.split("\n")
         max_idx = len(lines) - 1
-        resources: list[dict[str, str | None]] = []
+        segment_texts: list[str] = []
 
         for segment in segments:
             start = int(segment.get("start", 0))
@@ -823,8 +849,16 @@ class MemorizeMixin:
             segment_text = "\n".join(lines[start : end + 1])
 
             if segment_text.strip():
-                caption = await self._summarize_segment(segment_text, llm_client=client)
-                resources.append({"text": segment_text, "caption": caption})
+                segment_texts.append(segment_text)
+
+        captions = await _gather_bounded(
+            [self._summarize_segment(segment_text, llm_client=client) for segment_text in segment_texts],
+            self.memorize_config.segment_concurrency,
+        )
+        resources: list[dict[str, str | None]] = [
+            {"text": segment_text, "caption": caption}
+            for segment_text, caption in zip(segment_texts, captions, strict=True)
+        ]
         return resources if resources else [{"text": conversation_text, "caption": None}]
 
     async def _summarize_segment(self, segment_text: str, llm_client: Any | None = None) -> str | None:
@@ -1028,11 +1062,12 @@ Summary:"""
                 short_id = self._build_item_ref_id(item_id)
                 short_id_to_item_id[short_id] = item_id
 
+        db = self._get_async_database(store)
         # Update extra column for referenced items
         for short_id in referenced_short_ids:
             matched_item_id = short_id_to_item_id.get(short_id)
             if matched_item_id:
-                store.memory_item_repo.update_item(
+                await db.memory_item_repo.update_item(
                     item_id=matched_item_id,
                     extra={"ref_id": short_id},
                 )
@@ -1105,10 +1140,14 @@ Summary:"""
         ctx: Context,
         store: Database,
         llm_client: Any | None = None,
+        embed_client: Any | None = None,
     ) -> dict[str, str]:
         """
         Update category summaries based on new memory items.
 
+        The new summaries are embedded in one batch and stored alongside them, so
+        retrieval can rank categories without re-embedding every summary.
+
         Returns:
             dict mapping category_id -> updated summary text
         """
@@ -1129,15 +1168,22 @@ Summary:"""
             return updated_summaries
         summaries = await asyncio.gather(*tasks)
         for cid, summary in zip(target_ids, summaries, strict=True):
-            cat = store.memory_category_repo.categories.get(cid)
-            if not cat:
-                continue
-            cleaned_summary = summary.replace("```markdown", "").replace("```", "").strip()
-            store.memory_category_repo.update_category(
+            if cid in store.memory_category_repo.categories:
+                updated_summaries[cid] = summary.replace("```markdown", "").replace("```", "").strip()
+        embed_ids = [cid for cid, summary in updated_summaries.items() if summary]
+        summary_embeddings: dict[str, list[float]] = {}
+        if embed_ids:
+            vectors = await (embed_client or self._get_llm_client()).embed([
+                updated_summaries[cid] for cid in embed_ids
+            ])
+            summary_embeddings = dict(zip(embed_ids, vectors, strict=True))
+        db = self._get_async_database(store)
+        for cid, cleaned_summary in updated_summaries.items():
+            await db.memory_category_repo.update_category(
                 category_id=cid,
                 summary=cleaned_summary,
+                summary_embedding=summary_embeddings.get(cid),
             )
-            updated_summaries[cid] = cleaned_summary
         return updated_summaries
 
     def _parse_conversation_preprocess(self, raw: str) -> tuple[str | None, str | None]:
@@ -1330,3 +1376,14 @@ Summary:"""
             return []
         else:
             return result
+
+
+async def _gather_bounded[T](aws: Sequence[Awaitable[T]], limit: int) -> list[T]:
+    """Await ``aws`` with at most ``limit`` running at once; results keep the input order."""
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(_run(aw) for aw in aws))
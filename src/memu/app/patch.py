@@ -17,6 +17,7 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from memu.app.service import Context
     from memu.app.settings import PatchConfig
+    from memu.database.aio import AsyncDatabase
     from memu.database.interfaces import Database
 
 
@@ -26,6 +27,7 @@ class PatchMixin:
         _run_workflow: Callable[..., Awaitable[WorkflowState]]
         _get_context: Callable[[], Context]
         _get_database: Callable[[], Database]
+        _get_async_database: Callable[[Database], AsyncDatabase]
         _get_step_llm_client: Callable[[Mapping[str, Any] | None], Any]
         _get_llm_client: Callable[..., Any]
         _model_dump_without_embeddings: Callable[[BaseModel], dict[str, Any]]
@@ -256,13 +258,14 @@ class PatchMixin:
         memory_payload = state["memory_payload"]
         ctx = state["ctx"]
         store = state["store"]
+        db = self._get_async_database(store)
         user = state["user"]
         category_memory_updates: dict[str, tuple[Any, Any]] = {}
 
         embed_payload = [memory_payload["content"]]
         content_embedding = (await self._get_llm_client().embed(embed_payload))[0]
 
-        item = store.memory_item_repo.create_item(
+        item = await db.memory_item_repo.create_item(
             memory_type=memory_payload["type"],
             summary=memory_payload["content"],
             embedding=content_embedding,
@@ -271,7 +274,7 @@ class PatchMixin:
         cat_names = memory_payload["categories"]
         mapped_cat_ids = self._map_category_names_to_ids(cat_names, ctx)
         for cid in mapped_cat_ids:
-            store.category_item_repo.link_item_category(item.id, cid, user_data=dict(user or {}))
+            await db.category_item_repo.link_item_category(item.id, cid, user_data=dict(user or {}))
             category_memory_updates[cid] = (None, memory_payload["content"])
 
         state.update({
@@ -285,15 +288,16 @@ class PatchMixin:
         memory_payload = state["memory_payload"]
         ctx = state["ctx"]
         store = state["store"]
+        db = self._get_async_database(store)
         user = state["user"]
         category_memory_updates: dict[str, tuple[Any, Any]] = {}
 
-        item = store.memory_item_repo.get_item(memory_id)
+        item = await db.memory_item_repo.get_item(memory_id)
         if not item:
             msg = f"Memory item with id {memory_id} not found"
             raise ValueError(msg)
         old_content = item.summary
-        old_item_categories = store.category_item_repo.get_item_categories(memory_id)
+        old_item_categories = await db.category_item_repo.get_item_categories(memory_id)
         mapped_old_cat_ids = [cat.category_id for cat in old_item_categories]
 
         if memory_payload["content"]:
@@ -303,7 +307,7 @@ class PatchMixin:
             content_embedding = None
 
         if memory_payload["type"] or memory_payload["content"]:
-            item = store.memory_item_repo.update_item(
+            item = await db.memory_item_repo.update_item(
                 item_id=memory_id,
                 memory_type=memory_payload["type"],
                 summary=memory_payload["content"],
@@ -315,10 +319,10 @@ class PatchMixin:
         cats_to_remove = set(mapped_old_cat_ids) - set(mapped_new_cat_ids)
         cats_to_add = set(mapped_new_cat_ids) - set(mapped_old_cat_ids)
         for cid in cats_to_remove:
-            store.category_item_repo.unlink_item_category(memory_id, cid)
+            await db.category_item_repo.unlink_item_category(memory_id, cid)
             category_memory_updates[cid] = (old_content, None)
         for cid in cats_to_add:
-            store.category_item_repo.link_item_category(memory_id, cid, user_data=dict(user or {}))
+            await db.category_item_repo.link_item_category(memory_id, cid, user_data=dict(user or {}))
             category_memory_updates[cid] = (None, item.summary)
 
         if memory_payload["content"]:
@@ -334,16 +338,17 @@ class PatchMixin:
     async def _patch_delete_memory_item(self, state: WorkflowState, step_context: Any) -> WorkflowState:
         memory_id = state["memory_id"]
         store = state["store"]
+        db = self._get_async_database(store)
         category_memory_updates: dict[str, tuple[Any, Any]] = {}
 
-        item = store.memory_item_repo.get_item(memory_id)
+        item = await db.memory_item_repo.get_item(memory_id)
         if not item:
             msg = f"Memory item with id {memory_id} not found"
             raise ValueError(msg)
-        item_categories = store.category_item_repo.get_item_categories(memory_id)
+        item_categories = await db.category_item_repo.get_item_categories(memory_id)
         for cat in item_categories:
             category_memory_updates[cat.category_id] = (item.summary, None)
-        store.memory_item_repo.delete_item(memory_id)
+        await db.memory_item_repo.delete_item(memory_id)
 
         state.update({
             "memory_item": item,
@@ -394,6 +399,7 @@ class PatchMixin:
         ctx: Context,
         store: Database,
         llm_client: Any | None = None,
+        embed_client: Any | None = None,
     ) -> None:
         if not updates:
             return
@@ -412,14 +418,25 @@ class PatchMixin:
         if not tasks:
             return
         patches = await asyncio.gather(*tasks)
+        new_summaries: dict[str, str] = {}
         for cid, patch in zip(target_ids, patches, strict=True):
             need_update, summary = self._parse_category_patch_response(patch)
-            if not need_update:
-                continue
-            cat = store.memory_category_repo.categories.get(cid)
-            store.memory_category_repo.update_category(
+            if need_update:
+                new_summaries[cid] = summary.strip()
+        if not new_summaries:
+            return
+        # Embed the patched summaries in one batch so retrieval can reuse them
+        embed_ids = [cid for cid, summary in new_summaries.items() if summary]
+        summary_embeddings: dict[str, list[float]] = {}
+        if embed_ids:
+            vectors = await (embed_client or self._get_llm_client()).embed([new_summaries[cid] for cid in embed_ids])
+            summary_embeddings = dict(zip(embed_ids, vectors, strict=True))
+        db = self._get_async_database(store)
+        for cid, summary in new_summaries.items():
+            await db.memory_category_repo.update_category(
                 category_id=cid,
-                summary=summary.strip(),
+                summary=summary,
+                summary_embedding=summary_embeddings.get(cid),
             )
 
     def _build_category_patch_prompt(
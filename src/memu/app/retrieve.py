@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 from pydantic import BaseModel
 
+from memu.database.filters import WhereFilter
 from memu.database.inmemory.vector import cosine_topk
 from memu.prompts.retrieve.llm_category_ranker import PROMPT as LLM_CATEGORY_RANKER_PROMPT
 from memu.prompts.retrieve.llm_item_ranker import PROMPT as LLM_ITEM_RANKER_PROMPT
@@ -21,6 +22,7 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from memu.app.service import Context
     from memu.app.settings import RetrieveConfig
+    from memu.database.aio import AsyncDatabase
     from memu.database.interfaces import Database
 
 
@@ -30,6 +32,7 @@ class RetrieveMixin:
         _run_workflow: Callable[..., Awaitable[WorkflowState]]
         _get_context: Callable[[], Context]
         _get_database: Callable[[], Database]
+        _get_async_database: Callable[[Database], AsyncDatabase]
         _ensure_categories_ready: Callable[[Context, Database], Awaitable[None]]
         _get_step_llm_client: Callable[[Mapping[str, Any] | None], Any]
         _get_step_embedding_client: Callable[[Mapping[str, Any] | None], Any]
@@ -84,10 +87,13 @@ class RetrieveMixin:
             raise RuntimeError(msg)
         return response
 
-    def _normalize_where(self, where: Mapping[str, Any] | None) -> dict[str, Any]:
-        """Validate and clean the `where` scope filters against the configured user model."""
+    def _normalize_where(self, where: Mapping[str, Any] | None) -> WhereFilter:
+        """
+        Validate the `where` scope filters against the configured user model and
+        compile them once; the result is shared by every step and repository call.
+        """
         if not where:
-            return {}
+            return WhereFilter()
 
         valid_fields = set(getattr(self.user_model, "model_fields", {}).keys())
         cleaned: dict[str, Any] = {}
@@ -101,7 +107,7 @@ class RetrieveMixin:
                 raise ValueError(msg)
             cleaned[raw_key] = value
 
-        return cleaned
+        return WhereFilter(cleaned)
 
     def _build_rag_retrieve_workflow(self) -> list[WorkflowStep]:
         steps = [
@@ -204,7 +210,7 @@ class RetrieveMixin:
                 handler=self._rag_build_context,
                 requires={"needs_retrieval", "original_query", "rewritten_query", "ctx", "store", "where"},
                 produces={"response"},
-                capabilities=set(),
+                capabilities={"db"},
             ),
         ]
         return steps
@@ -266,8 +272,9 @@ class RetrieveMixin:
 
         embed_client = self._get_step_embedding_client(step_context)
         store = state["store"]
+        db = self._get_async_database(store)
         where_filters = state.get("where") or {}
-        category_pool = store.memory_category_repo.list_categories(where_filters)
+        category_pool = await db.memory_category_repo.list_categories(where_filters)
         qvec = (await embed_client.embed([state["active_query"]]))[0]
         hits, summary_lookup = await self._rank_categories_by_summary(
             qvec,
@@ -295,8 +302,9 @@ class RetrieveMixin:
 
         retrieved_content = ""
         store = state["store"]
+        db = self._get_async_database(store)
         where_filters = state.get("where") or {}
-        category_pool = state.get("category_pool") or store.memory_category_repo.list_categories(where_filters)
+        category_pool = state.get("category_pool") or await db.memory_category_repo.list_categories(where_filters)
         hits = state.get("category_hits") or []
         if hits:
             retrieved_content = self._format_category_content(
@@ -349,21 +357,23 @@ class RetrieveMixin:
             return state
 
         store = state["store"]
+        db = self._get_async_database(store)
         where_filters = state.get("where") or {}
-        items_pool = store.memory_item_repo.list_items(where_filters)
         qvec = state.get("query_vector")
         if qvec is None:
             embed_client = self._get_step_embedding_client(step_context)
             qvec = (await embed_client.embed([state["active_query"]]))[0]
             state["query_vector"] = qvec
-        state["item_hits"] = store.memory_item_repo.vector_search_items(
+        item_hits = await db.memory_item_repo.vector_search_items(
             qvec,
             self.retrieve_config.item.top_k,
             where=where_filters,
             ranking=self.retrieve_config.item.ranking,
             recency_decay_days=self.retrieve_config.item.recency_decay_days,
         )
-        state["item_pool"] = items_pool
+        state["item_hits"] = item_hits
+        # Later steps only read the hits, so fetch those records instead of the scoped pool
+        state["item_pool"] = await db.memory_item_repo.get_items([iid for iid, _ in item_hits], with_embeddings=False)
         return state
 
     async def _rag_item_sufficiency(self, state: WorkflowState, step_context: Any) -> WorkflowState:
@@ -375,10 +385,9 @@ class RetrieveMixin:
             return state
 
         store = state["store"]
-        where_filters = state.get("where") or {}
-        items_pool = state.get("item_pool") or store.memory_item_repo.list_items(where_filters)
         retrieved_content = ""
         hits = state.get("item_hits") or []
+        items_pool = await self._hit_item_pool(state, store, hits)
         if hits:
             retrieved_content = self._format_item_content(hits, store, items=items_pool)
 
@@ -407,8 +416,9 @@ class RetrieveMixin:
             return state
 
         store = state["store"]
+        db = self._get_async_database(store)
         where_filters = state.get("where") or {}
-        resource_pool = store.resource_repo.list_resources(where_filters)
+        resource_pool = await db.resource_repo.list_resources(where_filters)
         state["resource_pool"] = resource_pool
         corpus = self._resource_caption_corpus(store, resources=resource_pool)
         if not corpus:
@@ -423,7 +433,7 @@ class RetrieveMixin:
         state["resource_hits"] = cosine_topk(qvec, corpus, k=self.retrieve_config.resource.top_k)
         return state
 
-    def _rag_build_context(self, state: WorkflowState, _: Any) -> WorkflowState:
+    async def _rag_build_context(self, state: WorkflowState, _: Any) -> WorkflowState:
         response = {
             "needs_retrieval": bool(state.get("needs_retrieval")),
             "original_query": state["original_query"],
@@ -435,22 +445,40 @@ class RetrieveMixin:
         }
         if state.get("needs_retrieval"):
             store = state["store"]
+            db = self._get_async_database(store)
             where_filters = state.get("where") or {}
-            categories_pool = state.get("category_pool") or store.memory_category_repo.list_categories(where_filters)
-            items_pool = state.get("item_pool") or store.memory_item_repo.list_items(where_filters)
-            resources_pool = state.get("resource_pool") or store.resource_repo.list_resources(where_filters)
-            response["categories"] = self._materialize_hits(
-                state.get("category_hits", []),
-                categories_pool,
-            )
-            response["items"] = self._materialize_hits(state.get("item_hits", []), items_pool)
-            response["resources"] = self._materialize_hits(
-                state.get("resource_hits", []),
-                resources_pool,
-            )
+            category_hits = state.get("category_hits", [])
+            item_hits = state.get("item_hits", [])
+            resource_hits = state.get("resource_hits", [])
+            # Pools are only loaded here when a step produced hits without leaving its pool behind
+            categories_pool = state.get("category_pool")
+            if categories_pool is None:
+                categories_pool = (
+                    await db.memory_category_repo.list_categories(where_filters, with_embeddings=False)
+                    if category_hits
+                    else {}
+                )
+            resources_pool = state.get("resource_pool")
+            if resources_pool is None:
+                resources_pool = (
+                    await db.resource_repo.list_resources(where_filters, with_embeddings=False) if resource_hits else {}
+                )
+            response["categories"] = self._materialize_hits(category_hits, categories_pool)
+            response["items"] = self._materialize_hits(item_hits, await self._hit_item_pool(state, store, item_hits))
+            response["resources"] = self._materialize_hits(resource_hits, resources_pool)
         state["response"] = response
         return state
 
+    async def _hit_item_pool(
+        self, state: WorkflowState, store: Database, hits: Sequence[tuple[str, float]]
+    ) -> Mapping[str, Any]:
+        """The items behind ``hits``, reusing the records fetched by the recall step when present."""
+        pool = state.get("item_pool")
+        if pool is not None and all(iid in pool for iid, _ in hits):
+            return cast(Mapping[str, Any], pool)
+        db = self._get_async_database(store)
+        return await db.memory_item_repo.get_items([iid for iid, _ in hits], with_embeddings=False)
+
     def _build_llm_retrieve_workflow(self) -> list[WorkflowStep]:
         steps = [
             WorkflowStep(
@@ -573,8 +601,9 @@ class RetrieveMixin:
             return state
         llm_client = self._get_step_llm_client(step_context)
         store = state["store"]
+        db = self._get_async_database(store)
         where_filters = state.get("where") or {}
-        category_pool = store.memory_category_repo.list_categories(where_filters)
+        category_pool = await db.memory_category_repo.list_categories(where_filters, with_embeddings=False)
         hits = await self._llm_rank_categories(
             state["active_query"],
             self.retrieve_config.category.top_k,
@@ -622,6 +651,7 @@ class RetrieveMixin:
         category_ids = [cat["id"] for cat in category_hits]
         llm_client = self._get_step_llm_client(step_context)
         store = state["store"]
+        db = self._get_async_database(store)
 
         use_refs = getattr(self.retrieve_config.item, "use_category_references", False)
         ref_ids: list[str] = []
@@ -634,12 +664,15 @@ class RetrieveMixin:
                 ref_ids.extend(extract_references(summary))
         if ref_ids:
             # Query items by ref_ids
-            items_pool = store.memory_item_repo.list_items_by_ref_ids(ref_ids, where_filters)
+            items_pool = await db.memory_item_repo.list_items_by_ref_ids(ref_ids, where_filters, with_embeddings=False)
         else:
-            items_pool = store.memory_item_repo.list_items(where_filters)
+            items_pool = await db.memory_item_repo.list_items(where_filters, with_embeddings=False)
 
-        relations = store.category_item_repo.list_relations(where_filters)
-        category_pool = state.get("category_pool") or store.memory_category_repo.list_categories(where_filters)
+        # Only the links of the hit categories are needed to gather their items
+        relations = await db.category_item_repo.list_items_for_categories(category_ids, where_filters)
+        category_pool = state.get("category_pool") or await db.memory_category_repo.list_categories(
+            where_filters, with_embeddings=False
+        )
         state["item_hits"] = await self._llm_rank_items(
             state["active_query"],
             self.retrieve_config.item.top_k,
@@ -688,9 +721,12 @@ class RetrieveMixin:
 
         llm_client = self._get_step_llm_client(step_context)
         store = state["store"]
+        db = self._get_async_database(store)
         where_filters = state.get("where") or {}
-        resource_pool = store.resource_repo.list_resources(where_filters)
-        items_pool = state.get("item_pool") or store.memory_item_repo.list_items(where_filters)
+        resource_pool = await db.resource_repo.list_resources(where_filters, with_embeddings=False)
+        items_pool = state.get("item_pool") or await db.memory_item_repo.list_items(
+            where_filters, with_embeddings=False
+        )
         state["resource_hits"] = await self._llm_rank_resources(
             state["active_query"],
             self.retrieve_config.resource.top_k,
@@ -732,15 +768,21 @@ class RetrieveMixin:
         categories: Mapping[str, Any] | None = None,
     ) -> tuple[list[tuple[str, float]], dict[str, str]]:
         category_pool = categories if categories is not None else store.memory_category_repo.categories
-        entries = [(cid, cat.summary) for cid, cat in category_pool.items() if cat.summary]
-        if not entries:
+        summary_lookup: dict[str, str] = {cid: cat.summary for cid, cat in category_pool.items() if cat.summary}
+        if not summary_lookup:
             return [], {}
-        summary_texts = [summary for _, summary in entries]
-        client = embed_client or self._get_llm_client()
-        summary_embeddings = await client.embed(summary_texts)
-        corpus = [(cid, emb) for (cid, _), emb in zip(entries, summary_embeddings, strict=True)]
+        # Summary embeddings are stored when summaries are written; only embed (and
+        # persist) the ones that are missing, e.g. summaries written before this existed
+        missing = [cid for cid in summary_lookup if category_pool[cid].summary_embedding is None]
+        db = self._get_async_database(store)
+        if missing:
+            client = embed_client or self._get_llm_client()
+            summary_embeddings = await client.embed([summary_lookup[cid] for cid in missing])
+            for cid, emb in zip(missing, summary_embeddings, strict=True):
+                await db.memory_category_repo.update_category(category_id=cid, summary_embedding=emb)
+                category_pool[cid].summary_embedding = emb
+        corpus = [(cid, category_pool[cid].summary_embedding) for cid in summary_lookup]
         hits = cosine_topk(query_vec, corpus, k=top_k)
-        summary_lookup = dict(entries)
         return hits, summary_lookup
 
     async def _decide_if_retrieval_needed(
@@ -876,9 +918,8 @@ class RetrieveMixin:
     ) -> dict[str, Any]:
         """Embedding-based retrieval with query rewriting and judging at each tier"""
         where_filters = self._normalize_where(where)
-        category_pool = store.memory_category_repo.list_categories(where_filters)
-        items_pool = store.memory_item_repo.list_items(where_filters)
-        resource_pool = store.resource_repo.list_resources(where_filters)
+        db = self._get_async_database(store)
+        category_pool = await db.memory_category_repo.list_categories(where_filters)
         client = llm_client or self._get_llm_client()
         current_query = query
         qvec = (await client.embed([current_query]))[0]
@@ -913,8 +954,9 @@ class RetrieveMixin:
             qvec = (await client.embed([current_query]))[0]
 
         # Tier 2: Items
-        item_hits = store.memory_item_repo.vector_search_items(qvec, top_k, where=where_filters)
+        item_hits = await db.memory_item_repo.vector_search_items(qvec, top_k, where=where_filters)
         if item_hits:
+            items_pool = await db.memory_item_repo.get_items([iid for iid, _ in item_hits], with_embeddings=False)
             response["items"] = self._materialize_hits(item_hits, items_pool)
             content_sections.append(self._format_item_content(item_hits, store, items=items_pool))
 
@@ -931,6 +973,7 @@ class RetrieveMixin:
             qvec = (await client.embed([current_query]))[0]
 
         # Tier 3: Resources
+        resource_pool = await db.resource_repo.list_resources(where_filters)
         resource_corpus = self._resource_caption_corpus(store, resources=resource_pool)
         if resource_corpus:
             res_hits = cosine_topk(qvec, resource_corpus, k=top_k)
@@ -940,7 +983,7 @@ class RetrieveMixin:
 
         return response
 
-    def _materialize_hits(self, hits: Sequence[tuple[str, float]], pool: dict[str, Any]) -> list[dict[str, Any]]:
+    def _materialize_hits(self, hits: Sequence[tuple[str, float]], pool: Mapping[str, Any]) -> list[dict[str, Any]]:
         out = []
         for _id, score in hits:
             obj = pool.get(_id)
@@ -995,9 +1038,9 @@ class RetrieveMixin:
 
     def _resource_caption_corpus(
         self, store: Database, resources: Mapping[str, Any] | None = None
-    ) -> list[tuple[str, list[float]]]:
+    ) -> list[tuple[str, Sequence[float]]]:
         resource_pool = resources if resources is not None else store.resource_repo.resources
-        corpus: list[tuple[str, list[float]]] = []
+        corpus: list[tuple[str, Sequence[float]]] = []
         for rid, res in resource_pool.items():
             if res.embedding:
                 corpus.append((rid, res.embedding))
@@ -1038,10 +1081,12 @@ class RetrieveMixin:
         3. If needs more, search resources related to context
         """
         where_filters = self._normalize_where(where)
-        category_pool = store.memory_category_repo.list_categories(where_filters)
-        items_pool = store.memory_item_repo.list_items(where_filters)
-        relations = store.category_item_repo.list_relations(where_filters)
-        resource_pool = store.resource_repo.list_resources(where_filters)
+        db = self._get_async_database(store)
+        # LLM ranking reads text only, so the embedding columns are not loaded
+        category_pool = await db.memory_category_repo.list_categories(where_filters, with_embeddings=False)
+        items_pool = await db.memory_item_repo.list_items(where_filters, with_embeddings=False)
+        relations = await db.category_item_repo.list_relations(where_filters)
+        resource_pool = await db.resource_repo.list_resources(where_filters, with_embeddings=False)
         current_query = query
         client = llm_client or self._get_llm_client()
         response: dict[str, Any] = {"resources": [], "items": [], "categories": [], "next_step_query": None}
@@ -1157,8 +1202,9 @@ class RetrieveMixin:
 
         if category_ids:
             # Get items that belong to the specified categories
+            wanted_categories = set(category_ids)
             for rel in relation_pool:
-                if rel.category_id in category_ids:
+                if rel.category_id in wanted_categories:
                     item = item_pool.get(rel.item_id)
                     if item and item.id not in seen_item_ids:
                         items_to_format.append(item)
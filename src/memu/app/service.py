@@ -5,6 +5,7 @@ from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from typing import Any, Literal, TypeVar
 
+import httpx
 from pydantic import BaseModel
 
 from memu.app.crud import CRUDMixin
@@ -21,9 +22,15 @@ from memu.app.settings import (
     UserConfig,
 )
 from memu.blob.local_fs import LocalFS
+from memu.database.aio import AsyncDatabase, RepoExecutor, resolve_io_workers
 from memu.database.factory import build_database
 from memu.database.interfaces import Database
+from memu.database.item_cache import ItemCache, ItemCacheStats
+from memu.llm.embedding_batcher import EmbeddingBatcher
+from memu.llm.embedding_cache import EmbeddingCache, EmbeddingCacheStats
 from memu.llm.http_client import HTTPLLMClient
+from memu.llm.rate_limit import LLMRateLimiter
+from memu.llm.retry import RetryPolicy
 from memu.llm.wrapper import (
     LLMCallMetadata,
     LLMClientWrapper,
@@ -78,11 +85,16 @@ class MemoryService(MemorizeMixin, RetrieveMixin, CRUDMixin):
             config=self.database_config,
             user_model=self.user_model,
         )
+        # Blocking repository calls made from async workflow steps run on this pool
+        self._db_executor = RepoExecutor(resolve_io_workers(self.database_config.metadata_store))
         # We need the concrete user scope (user_id: xxx) to initialize the categories
         # self._start_category_initialization(self._context, self.database)
 
         # Initialize client caches (lazy creation on first use)
         self._llm_clients: dict[str, Any] = {}
+        self._embedding_caches: dict[str, EmbeddingCache | None] = {}
+        self._embedding_batchers: dict[str, EmbeddingBatcher | None] = {}
+        self._rate_limiters: dict[str, LLMRateLimiter | None] = {}
         self._llm_interceptors = LLMInterceptorRegistry()
         self._workflow_interceptors = WorkflowInterceptorRegistry()
 
@@ -107,6 +119,11 @@ class MemoryService(MemorizeMixin, RetrieveMixin, CRUDMixin):
                 chat_model=cfg.chat_model,
                 embed_model=cfg.embed_model,
                 embed_batch_size=cfg.embed_batch_size,
+                embed_concurrency=cfg.embed_concurrency,
+                # Retries follow cfg.retry: LLMClientWrapper retries chat calls, the client
+                # retries each embedding chunk so a failed chunk does not resend the others
+                max_retries=0,
+                retry_policy=self._retry_policy_for(cfg),
             )
         elif backend == "httpx":
             return HTTPLLMClient(
@@ -116,6 +133,14 @@ class MemoryService(MemorizeMixin, RetrieveMixin, CRUDMixin):
                 provider=cfg.provider,
                 endpoint_overrides=cfg.endpoint_overrides,
                 embed_model=cfg.embed_model,
+                timeout=cfg.http_client.timeout,
+                connect_timeout=cfg.http_client.connect_timeout,
+                limits=httpx.Limits(
+                    max_connections=cfg.http_client.max_connections,
+                    max_keepalive_connections=cfg.http_client.max_keepalive_connections,
+                    keepalive_expiry=cfg.http_client.keepalive_expiry,
+                ),
+                http2=cfg.http_client.http2,
             )
         elif backend == "lazyllm_backend":
             from memu.llm.lazyllm_client import LazyLLMClient
@@ -150,6 +175,90 @@ class MemoryService(MemorizeMixin, RetrieveMixin, CRUDMixin):
         self._llm_clients[name] = client
         return client
 
+    def _get_embedding_cache(self, profile: str | None = None) -> EmbeddingCache | None:
+        """
+        Return the embedding cache of a profile, created on first use; None when caching is disabled.
+        """
+        name = profile or "default"
+        if name in self._embedding_caches:
+            return self._embedding_caches[name]
+        cfg: LLMConfig | None = self.llm_profiles.profiles.get(name)
+        cache = None
+        if cfg is not None and cfg.embed_cache.enabled:
+            cache = EmbeddingCache(
+                max_entries=cfg.embed_cache.max_entries,
+                persist_path=cfg.embed_cache.persist_path,
+            )
+        self._embedding_caches[name] = cache
+        return cache
+
+    def _get_embedding_batcher(self, client: Any, profile: str | None = None) -> EmbeddingBatcher | None:
+        """
+        Return the micro-batcher coalescing concurrent embed() calls of a profile; None when disabled.
+        """
+        name = profile or "default"
+        if name in self._embedding_batchers:
+            return self._embedding_batchers[name]
+        cfg: LLMConfig | None = self.llm_profiles.profiles.get(name)
+        batcher = None
+        if cfg is not None and cfg.embed_batching.enabled and hasattr(client, "embed"):
+            limiter = self._get_rate_limiter(name)
+            # Each coalesced provider request is admitted once by the profile's limiter
+            embed = limiter.limit_embed(client.embed) if limiter is not None else client.embed
+            batcher = EmbeddingBatcher(
+                embed,
+                max_batch_size=cfg.embed_batching.max_batch_size,
+                max_wait_ms=cfg.embed_batching.max_wait_ms,
+            )
+        self._embedding_batchers[name] = batcher
+        return batcher
+
+    def _get_rate_limiter(self, profile: str | None = None) -> LLMRateLimiter | None:
+        """
+        Return the shared concurrency/RPM/TPM limiter of a profile; None when no limit is configured.
+        """
+        name = profile or "default"
+        if name in self._rate_limiters:
+            return self._rate_limiters[name]
+        cfg: LLMConfig | None = self.llm_profiles.profiles.get(name)
+        limiter = None
+        if cfg is not None:
+            limiter = LLMRateLimiter(
+                max_concurrency=cfg.rate_limit.max_concurrency,
+                requests_per_minute=cfg.rate_limit.requests_per_minute,
+                tokens_per_minute=cfg.rate_limit.tokens_per_minute,
+            )
+            if not limiter.enabled:
+                limiter = None
+        self._rate_limiters[name] = limiter
+        return limiter
+
+    def _retry_policy(self, profile: str | None = None) -> RetryPolicy | None:
+        return self._retry_policy_for(self.llm_profiles.profiles.get(profile or "default"))
+
+    @staticmethod
+    def _retry_policy_for(cfg: LLMConfig | None) -> RetryPolicy | None:
+        if cfg is None or cfg.retry.max_attempts <= 1:
+            return None
+        return RetryPolicy(
+            max_attempts=cfg.retry.max_attempts,
+            initial_backoff=cfg.retry.initial_backoff,
+            max_backoff=cfg.retry.max_backoff,
+            multiplier=cfg.retry.multiplier,
+            jitter=cfg.retry.jitter,
+            retry_status_codes=frozenset(cfg.retry.retry_status_codes),
+            respect_retry_after=cfg.retry.respect_retry_after,
+        )
+
+    def embedding_cache_stats(self) -> dict[str, EmbeddingCacheStats]:
+        """Hit/miss counters of the embedding caches created so far, keyed by LLM profile."""
+        return {name: cache.stats for name, cache in self._embedding_caches.items() if cache is not None}
+
+    def item_cache_stats(self) -> ItemCacheStats | None:
+        """Hit/miss counters of the SQL backends' memory item cache (None for the in-memory store)."""
+        items = self.database.items
+        return items.stats if isinstance(items, ItemCache) else None
+
     @staticmethod
     def _llm_call_metadata(profile: str, step_context: Mapping[str, Any] | None) -> LLMCallMetadata:
         if not isinstance(step_context, Mapping):
@@ -182,6 +291,10 @@ class MemoryService(MemorizeMixin, RetrieveMixin, CRUDMixin):
             provider=provider,
             chat_model=getattr(client, "chat_model", None),
             embed_model=getattr(client, "embed_model", None),
+            embed_cache=self._get_embedding_cache(profile),
+            embed_batcher=self._get_embedding_batcher(client, profile),
+            rate_limiter=self._get_rate_limiter(profile),
+            retry_policy=self._retry_policy(profile),
         )
 
     def _get_llm_client(self, profile: str | None = None, step_context: Mapping[str, Any] | None = None) -> Any:
@@ -193,6 +306,21 @@ class MemoryService(MemorizeMixin, RetrieveMixin, CRUDMixin):
         """Default LLM client (lazy)."""
         return self._get_llm_client()
 
+    async def aclose(self) -> None:
+        """Release pooled connections of the LLM clients, the database thread pool and persistent embedding caches."""
+        clients = list(self._llm_clients.values())
+        self._llm_clients.clear()
+        for client in clients:
+            close = getattr(client, "aclose", None)
+            if close is not None:
+                await close()
+        for cache in self._embedding_caches.values():
+            if cache is not None:
+                cache.close()
+        self._embedding_caches.clear()
+        self._embedding_batchers.clear()
+        self._db_executor.shutdown(wait=False)
+
     @property
     def workflow_runner(self) -> WorkflowRunner:
         """Current workflow runner backend."""
@@ -300,6 +428,10 @@ class MemoryService(MemorizeMixin, RetrieveMixin, CRUDMixin):
     def _get_database(self) -> Database:
         return self.database
 
+    def _get_async_database(self, store: Database) -> AsyncDatabase:
+        """Awaitable view of ``store`` whose repository calls run off the event loop."""
+        return AsyncDatabase(store, self._db_executor)
+
     def _provider_summary(self) -> dict[str, Any]:
         vector_provider = None
         if self.database_config.vector_index:
@@ -373,7 +505,7 @@ class MemoryService(MemorizeMixin, RetrieveMixin, CRUDMixin):
         return value.replace("{", "{{").replace("}", "}}")
 
     def _model_dump_without_embeddings(self, obj: BaseModel) -> dict[str, Any]:
-        data = obj.model_dump(exclude={"embedding"})
+        data = obj.model_dump(exclude={"embedding", "summary_embedding"})
         return data
 
     @staticmethod
@@ -99,6 +99,56 @@ class LazyLLMSource(BaseModel):
     stt_model: str = Field(default="qwen-audio-turbo", description="Speech-to-text model for lazyllm client backend")
 
 
+class HTTPClientConfig(BaseModel):
+    timeout: float = Field(default=60, gt=0, description="Read/write/pool timeout in seconds for HTTP requests.")
+    connect_timeout: float | None = Field(default=None, description="Connect timeout in seconds; defaults to timeout.")
+    max_connections: int | None = Field(default=100, description="Maximum concurrent connections per profile.")
+    max_keepalive_connections: int | None = Field(default=20, description="Idle connections kept open for reuse.")
+    keepalive_expiry: float | None = Field(default=30.0, description="Seconds an idle connection is kept alive.")
+    http2: bool = Field(default=False, description="Enable HTTP/2 (requires the 'h2' package).")
+
+
+class EmbeddingCacheConfig(BaseModel):
+    enabled: bool = Field(
+        default=False,
+        description="Reuse embeddings of identical texts instead of re-requesting them. Vectors are held as float32.",
+    )
+    max_entries: int = Field(default=4096, gt=0, description="Maximum number of vectors held in the in-memory LRU.")
+    persist_path: str | None = Field(
+        default=None,
+        description="Optional SQLite file used as a persistent second tier shared across restarts.",
+    )
+
+
+class EmbeddingBatchConfig(BaseModel):
+    enabled: bool = Field(default=True, description="Coalesce concurrent embed() calls into shared provider requests.")
+    max_batch_size: int = Field(default=64, gt=0, description="Flush as soon as this many texts are queued.")
+    max_wait_ms: float = Field(default=2.0, ge=0, description="How long the first queued request waits for company.")
+
+
+class LLMRateLimitConfig(BaseModel):
+    max_concurrency: int | None = Field(default=None, gt=0, description="Maximum in-flight requests per profile.")
+    requests_per_minute: int | None = Field(default=None, gt=0, description="Request budget per minute.")
+    tokens_per_minute: int | None = Field(
+        default=None,
+        gt=0,
+        description="Token budget per minute, charged with an estimate of each request's input size.",
+    )
+
+
+class LLMRetryConfig(BaseModel):
+    max_attempts: int = Field(default=3, ge=1, description="Total attempts per call, including the first one.")
+    initial_backoff: float = Field(default=0.5, ge=0, description="Delay in seconds before the first retry.")
+    max_backoff: float = Field(default=30.0, ge=0, description="Upper bound in seconds for a single delay.")
+    multiplier: float = Field(default=2.0, ge=1, description="Backoff growth factor between attempts.")
+    jitter: float = Field(default=0.5, ge=0, le=1, description="Fraction of each delay that is randomized.")
+    retry_status_codes: list[int] = Field(
+        default_factory=lambda: [408, 409, 429, 500, 502, 503, 504],
+        description="HTTP status codes treated as transient; timeouts and connection errors always are.",
+    )
+    respect_retry_after: bool = Field(default=True, description="Wait as long as a Retry-After header asks.")
+
+
 class LLMConfig(BaseModel):
     provider: str = Field(
         default="openai",
@@ -124,6 +174,25 @@ class LLMConfig(BaseModel):
         default=1,
         description="Maximum batch size for embedding API calls (used by SDK client backends).",
     )
+    embed_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="Maximum embedding chunks of one call sent concurrently (used by SDK client backends).",
+    )
+    embed_cache: EmbeddingCacheConfig = Field(default_factory=EmbeddingCacheConfig)
+    embed_batching: EmbeddingBatchConfig = Field(default_factory=EmbeddingBatchConfig)
+    rate_limit: LLMRateLimitConfig = Field(
+        default_factory=LLMRateLimitConfig,
+        description="Per-profile concurrency and RPM/TPM limits applied to every provider call.",
+    )
+    retry: LLMRetryConfig = Field(
+        default_factory=LLMRetryConfig,
+        description="Retry policy for transient provider errors (429/5xx/timeouts), applied to every backend.",
+    )
+    http_client: HTTPClientConfig = Field(
+        default_factory=HTTPClientConfig,
+        description="Connection pool settings for the 'httpx' client backend.",
+    )
 
     @model_validator(mode="after")
     def set_provider_defaults(self) -> "LLMConfig":
@@ -217,6 +286,11 @@ class MemorizeConfig(BaseModel):
         description="User prompt overrides for each memory type extraction.",
     )
     memory_extract_llm_profile: str = Field(default="default", description="LLM profile for memory extract.")
+    segment_concurrency: int = Field(
+        default=8,
+        gt=0,
+        description="Maximum conversation segments captioned or extracted concurrently during memorize.",
+    )
     memory_categories: list[CategoryConfig] = Field(
         default_factory=_default_memory_categories,
         description="Global memory category definitions embedded at service startup.",
@@ -296,15 +370,91 @@ class LLMProfilesConfig(RootModel[dict[Key, LLMConfig]]):
         return self.root.get("default", LLMConfig())
 
 
+class ConnectionPoolConfig(BaseModel):
+    size: int = Field(default=5, gt=0, description="Connections kept open in the engine's pool.")
+    max_overflow: int = Field(default=10, ge=0, description="Extra connections opened beyond size under load.")
+    timeout: float = Field(default=30.0, gt=0, description="Seconds to wait for a free pooled connection.")
+    recycle: int = Field(
+        default=-1, description="Seconds after which a pooled connection is replaced (-1 keeps connections)."
+    )
+    pre_ping: bool = Field(default=True, description="Check Postgres connections for liveness before each checkout.")
+
+
+class SQLitePragmaConfig(BaseModel):
+    journal_mode: Annotated[Literal["wal", "delete", "truncate", "persist", "memory", "off"], Normalize] = Field(
+        default="wal", description="WAL lets readers proceed while a writer commits."
+    )
+    synchronous: Annotated[Literal["off", "normal", "full", "extra"], Normalize] = Field(
+        default="normal", description="fsync level; normal is durable across crashes in WAL mode."
+    )
+    mmap_size: int = Field(default=268_435_456, ge=0, description="Bytes of the database file memory-mapped (0 = off).")
+    cache_size: int = Field(
+        default=-65_536, description="Page cache per connection; negative values are KiB, positive values pages."
+    )
+    busy_timeout: int = Field(default=5000, ge=0, description="Milliseconds to wait on a locked database.")
+
+
+class ItemCacheConfig(BaseModel):
+    max_entries: int | None = Field(
+        default=10_000, gt=0, description="Memory items kept in the SQL backends' LRU (None = unbounded)."
+    )
+    ttl_seconds: float | None = Field(default=None, gt=0, description="Drop cached items older than this many seconds.")
+    version_column: str | None = Field(
+        default=None,
+        description=(
+            "Item column (e.g. 'updated_at') re-read on cache hits so rows changed by other processes are reloaded. "
+            "Postgres only serves reads from the cache when this is set."
+        ),
+    )
+
+
 class MetadataStoreConfig(BaseModel):
     provider: Annotated[Literal["inmemory", "postgres", "sqlite"], Normalize] = "inmemory"
     ddl_mode: Annotated[Literal["create", "validate"], Normalize] = "create"
     dsn: str | None = Field(default=None, description="Database connection string (required for postgres/sqlite).")
+    io_workers: int | None = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Threads that run blocking repository calls off the event loop (0 runs them inline). "
+            "Defaults to 4 for postgres and inline for inmemory; sqlite always uses a single thread."
+        ),
+    )
+    pool: ConnectionPoolConfig = Field(
+        default_factory=ConnectionPoolConfig, description="Connection pool of the postgres/sqlite engine."
+    )
+    item_cache: ItemCacheConfig = Field(
+        default_factory=ItemCacheConfig, description="Bounded cache of memory items for the postgres/sqlite backends."
+    )
+    sqlite_pragmas: SQLitePragmaConfig = Field(
+        default_factory=SQLitePragmaConfig, description="PRAGMAs applied to every new SQLite connection."
+    )
+    compact_embeddings: bool = Field(
+        default=False,
+        description=(
+            "Keep the embeddings of inmemory records as float32 arrays instead of lists of Python floats "
+            "(~1/8 of the memory). The postgres/sqlite backends already read embeddings this way."
+        ),
+    )
 
 
 class VectorIndexConfig(BaseModel):
     provider: Annotated[Literal["bruteforce", "pgvector", "none"], Normalize] = "bruteforce"
     dsn: str | None = Field(default=None, description="Postgres connection string when provider=pgvector.")
+    dimensions: int | None = Field(
+        default=None,
+        description="Embedding dimension. With pgvector, typed vector(n) columns and ANN indexes are created.",
+    )
+    index_type: Annotated[Literal["hnsw", "ivfflat", "none"], Normalize] = Field(
+        default="hnsw", description="pgvector ANN index method (requires dimensions)."
+    )
+    m: int = Field(default=16, gt=0, description="HNSW max connections per layer.")
+    ef_construction: int = Field(default=64, gt=0, description="HNSW candidate list size at build time.")
+    lists: int = Field(default=100, gt=0, description="IVFFlat number of inverted lists.")
+    ef_search: int | None = Field(
+        default=None, gt=0, description="HNSW candidate list size at query time (hnsw.ef_search)."
+    )
+    probes: int | None = Field(default=None, gt=0, description="IVFFlat lists probed at query time (ivfflat.probes).")
 
 
 class DatabaseConfig(BaseModel):
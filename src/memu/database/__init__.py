@@ -1,6 +1,9 @@
 """Storage backends for MemU."""
 
+from memu.database.aio import AsyncDatabase, RepoExecutor
+from memu.database.embedding import CompactEmbedding, LazyEmbedding
 from memu.database.factory import build_database
+from memu.database.filters import WhereFilter
 from memu.database.interfaces import (
     CategoryItemRecord,
     Database,
@@ -8,18 +11,39 @@ from memu.database.interfaces import (
     MemoryItemRecord,
     ResourceRecord,
 )
-from memu.database.repositories import CategoryItemRepo, MemoryCategoryRepo, MemoryItemRepo, ResourceRepo
+from memu.database.item_cache import ItemCache, ItemCacheStats
+from memu.database.repositories import (
+    AsyncCategoryItemRepo,
+    AsyncMemoryCategoryRepo,
+    AsyncMemoryItemRepo,
+    AsyncResourceRepo,
+    CategoryItemRepo,
+    MemoryCategoryRepo,
+    MemoryItemRepo,
+    ResourceRepo,
+)
 
 __all__ = [
+    "AsyncCategoryItemRepo",
+    "AsyncDatabase",
+    "AsyncMemoryCategoryRepo",
+    "AsyncMemoryItemRepo",
+    "AsyncResourceRepo",
     "CategoryItemRecord",
     "CategoryItemRepo",
+    "CompactEmbedding",
     "Database",
+    "ItemCache",
+    "ItemCacheStats",
+    "LazyEmbedding",
     "MemoryCategoryRecord",
     "MemoryCategoryRepo",
     "MemoryItemRecord",
     "MemoryItemRepo",
+    "RepoExecutor",
     "ResourceRecord",
     "ResourceRepo",
+    "WhereFilter",
     "build_database",
     "inmemory",
     "postgres",
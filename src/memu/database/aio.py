@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from memu.app.settings import MetadataStoreConfig
+from memu.database.interfaces import Database
+from memu.database.models import CategoryItem, Embedding, MemoryCategory, MemoryItem, MemoryType, Resource
+from memu.database.repositories import CategoryItemRepo, MemoryCategoryRepo, MemoryItemRepo, ResourceRepo
+
+# Thread count used when `MetadataStoreConfig.io_workers` is unset
+DEFAULT_IO_WORKERS = {"inmemory": 0, "sqlite": 1, "postgres": 4}
+
+
+def resolve_io_workers(config: MetadataStoreConfig) -> int:
+    """
+    Number of threads that run blocking repository calls for ``config``.
+
+    In-memory calls never block on I/O and default to running inline (0). SQLite
+    is pinned to one thread: it has a single writer and its repositories share a
+    process-local vector index that is not thread-safe.
+    """
+    if config.provider == "sqlite":
+        return 1
+    if config.io_workers is not None:
+        return config.io_workers
+    return DEFAULT_IO_WORKERS.get(config.provider, 1)
+
+
+class RepoExecutor:
+    """
+    Runs blocking repository calls on a bounded thread pool so they do not stall the event loop.
+
+    With ``max_workers=0`` calls run inline on the loop thread. The pool is created
+    on first use and re-created after `shutdown`, so one executor can outlive
+    several event loops (e.g. repeated ``asyncio.run`` calls).
+    """
+
+    def __init__(self, max_workers: int, *, thread_name_prefix: str = "memu-db") -> None:
+        if max_workers < 0:
+            msg = f"max_workers must be >= 0, got {max_workers}"
+            raise ValueError(msg)
+        self.max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._pool: ThreadPoolExecutor | None = None
+
+    async def run[R](self, fn: Callable[..., R], /, *args: Any, **kwargs: Any) -> R:
+        if self.max_workers == 0:
+            return fn(*args, **kwargs)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self._thread_name_prefix)
+        loop = asyncio.get_running_loop()
+        # Carry context variables (e.g. tracing or request scope) into the worker thread
+        call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+        return await loop.run_in_executor(self._pool, call)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+class _OffloadedRepo[RepoT]:
+    def __init__(self, repo: RepoT, executor: RepoExecutor) -> None:
+        self.repo = repo
+        self._executor = executor
+
+
+class AsyncResourceRepoAdapter(_OffloadedRepo[ResourceRepo]):
+    async def list_resources(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, Resource]:
+        return await self._executor.run(self.repo.list_resources, where, with_embeddings=with_embeddings)
+
+    async def clear_resources(self, where: Mapping[str, Any] | None = None) -> dict[str, Resource]:
+        return await self._executor.run(self.repo.clear_resources, where)
+
+    async def create_resource(
+        self,
+        *,
+        url: str,
+        modality: str,
+        local_path: str,
+        caption: str | None,
+        embedding: Embedding | None,
+        user_data: dict[str, Any],
+    ) -> Resource:
+        return await self._executor.run(
+            self.repo.create_resource,
+            url=url,
+            modality=modality,
+            local_path=local_path,
+            caption=caption,
+            embedding=embedding,
+            user_data=user_data,
+        )
+
+
+class AsyncMemoryCategoryRepoAdapter(_OffloadedRepo[MemoryCategoryRepo]):
+    async def list_categories(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryCategory]:
+        return await self._executor.run(self.repo.list_categories, where, with_embeddings=with_embeddings)
+
+    async def clear_categories(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryCategory]:
+        return await self._executor.run(self.repo.clear_categories, where)
+
+    async def get_or_create_category(
+        self, *, name: str, description: str, embedding: Embedding, user_data: dict[str, Any]
+    ) -> MemoryCategory:
+        return await self._executor.run(
+            self.repo.get_or_create_category,
+            name=name,
+            description=description,
+            embedding=embedding,
+            user_data=user_data,
+        )
+
+    async def update_category(
+        self,
+        *,
+        category_id: str,
+        name: str | None = None,
+        description: str | None = None,
+        embedding: Embedding | None = None,
+        summary: str | None = None,
+        summary_embedding: Embedding | None = None,
+    ) -> MemoryCategory:
+        return await self._executor.run(
+            self.repo.update_category,
+            category_id=category_id,
+            name=name,
+            description=description,
+            embedding=embedding,
+            summary=summary,
+            summary_embedding=summary_embedding,
+        )
+
+
+class AsyncMemoryItemRepoAdapter(_OffloadedRepo[MemoryItemRepo]):
+    async def get_item(self, item_id: str) -> MemoryItem | None:
+        return await self._executor.run(self.repo.get_item, item_id)
+
+    async def get_items(self, item_ids: Sequence[str], *, with_embeddings: bool = True) -> dict[str, MemoryItem]:
+        return await self._executor.run(self.repo.get_items, item_ids, with_embeddings=with_embeddings)
+
+    async def list_items(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryItem]:
+        return await self._executor.run(self.repo.list_items, where, with_embeddings=with_embeddings)
+
+    async def clear_items(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryItem]:
+        return await self._executor.run(self.repo.clear_items, where)
+
+    async def create_item(
+        self,
+        *,
+        resource_id: str | None = None,
+        memory_type: MemoryType,
+        summary: str,
+        embedding: Embedding,
+        user_data: dict[str, Any],
+        reinforce: bool = False,
+    ) -> MemoryItem:
+        return await self._executor.run(
+            self.repo.create_item,
+            resource_id=resource_id,
+            memory_type=memory_type,
+            summary=summary,
+            embedding=embedding,
+            user_data=user_data,
+            reinforce=reinforce,
+        )
+
+    async def create_items_bulk(
+        self,
+        *,
+        resource_id: str,
+        entries: Sequence[tuple[MemoryType, str, Embedding]],
+        user_data: dict[str, Any],
+        reinforce: bool = False,
+    ) -> list[MemoryItem]:
+        return await self._executor.run(
+            self.repo.create_items_bulk,
+            resource_id=resource_id,
+            entries=entries,
+            user_data=user_data,
+            reinforce=reinforce,
+        )
+
+    async def update_item(
+        self,
+        *,
+        item_id: str,
+        memory_type: MemoryType | None = None,
+        summary: str | None = None,
+        embedding: Embedding | None = None,
+        extra: dict[str, Any] | None = None,
+    ) -> MemoryItem:
+        return await self._executor.run(
+            self.repo.update_item,
+            item_id=item_id,
+            memory_type=memory_type,
+            summary=summary,
+            embedding=embedding,
+            extra=extra,
+        )
+
+    async def delete_item(self, item_id: str) -> None:
+        await self._executor.run(self.repo.delete_item, item_id)
+
+    async def list_items_by_ref_ids(
+        self, ref_ids: list[str], where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryItem]:
+        return await self._executor.run(
+            self.repo.list_items_by_ref_ids, ref_ids, where, with_embeddings=with_embeddings
+        )
+
+    async def vector_search_items(
+        self,
+        query_vec: list[float],
+        top_k: int,
+        where: Mapping[str, Any] | None = None,
+        *,
+        ranking: str = "similarity",
+        recency_decay_days: float = 30.0,
+    ) -> list[tuple[str, float]]:
+        return await self._executor.run(
+            self.repo.vector_search_items,
+            query_vec,
+            top_k,
+            where,
+            ranking=ranking,
+            recency_decay_days=recency_decay_days,
+        )
+
+
+class AsyncCategoryItemRepoAdapter(_OffloadedRepo[CategoryItemRepo]):
+    async def list_relations(self, where: Mapping[str, Any] | None = None) -> list[CategoryItem]:
+        return await self._executor.run(self.repo.list_relations, where)
+
+    async def list_items_for_categories(
+        self, category_ids: Sequence[str], where: Mapping[str, Any] | None = None
+    ) -> list[CategoryItem]:
+        return await self._executor.run(self.repo.list_items_for_categories, category_ids, where)
+
+    async def link_item_category(self, item_id: str, cat_id: str, user_data: dict[str, Any]) -> CategoryItem:
+        return await self._executor.run(self.repo.link_item_category, item_id, cat_id, user_data)
+
+    async def link_many(self, pairs: Sequence[tuple[str, str]], user_data: dict[str, Any]) -> list[CategoryItem]:
+        return await self._executor.run(self.repo.link_many, pairs, user_data)
+
+    async def unlink_item_category(self, item_id: str, cat_id: str) -> None:
+        await self._executor.run(self.repo.unlink_item_category, item_id, cat_id)
+
+    async def get_item_categories(self, item_id: str) -> list[CategoryItem]:
+        return await self._executor.run(self.repo.get_item_categories, item_id)
+
+
+class AsyncDatabase:
+    """
+    Awaitable view of a `Database` whose repository calls run on a `RepoExecutor`.
+
+    Repository methods are resolved when called, and building the view is cheap, so
+    callers can wrap whichever store a request carries.
+    """
+
+    def __init__(self, database: Database, executor: RepoExecutor) -> None:
+        self.database = database
+        self.executor = executor
+        self.resource_repo = AsyncResourceRepoAdapter(database.resource_repo, executor)
+        self.memory_category_repo = AsyncMemoryCategoryRepoAdapter(database.memory_category_repo, executor)
+        self.memory_item_repo = AsyncMemoryItemRepoAdapter(database.memory_item_repo, executor)
+        self.category_item_repo = AsyncCategoryItemRepoAdapter(database.category_item_repo, executor)
+
+
+__all__ = [
+    "DEFAULT_IO_WORKERS",
+    "AsyncCategoryItemRepoAdapter",
+    "AsyncDatabase",
+    "AsyncMemoryCategoryRepoAdapter",
+    "AsyncMemoryItemRepoAdapter",
+    "AsyncResourceRepoAdapter",
+    "RepoExecutor",
+    "resolve_io_workers",
+]
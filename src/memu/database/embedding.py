@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Sequence
+from typing import Any, overload
+
+import numpy as np
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+
+
+class CompactEmbedding(Sequence[float]):
+    """
+    Embedding held as one read-only float32 NumPy array.
+
+    A 1536-dim ``list[float]`` boxes every element (~50 KB); this keeps the 6 KB
+    buffer. It reads like a sequence of floats and compares equal to one, hands
+    its array to ``np.asarray`` without copying, and serializes as a plain list
+    of floats. Records accept it, a float32-convertible ``ndarray`` or an
+    ``array('f')`` wherever they accept ``list[float]``.
+    """
+
+    __slots__ = ("_array",)
+
+    def __init__(self, values: Sequence[float] | np.ndarray | array) -> None:
+        self._array: np.ndarray = self._freeze(values)
+
+    @staticmethod
+    def _freeze(values: Any, *, owned: bool = False) -> np.ndarray:
+        array_ = np.asarray(values, dtype=np.float32)
+        if array_.ndim != 1:
+            msg = f"Embedding must be one-dimensional, got shape {array_.shape}"
+            raise ValueError(msg)
+        if array_.flags.writeable:
+            if not owned and (array_ is values or array_.base is not None):
+                # Still the caller's buffer: take a copy rather than alias memory they can mutate
+                array_ = array_.copy()
+            array_.flags.writeable = False
+        return array_
+
+    @property
+    def array(self) -> np.ndarray:
+        """Read-only float32 view of the vector."""
+        return self._array
+
+    def tolist(self) -> list[float]:
+        return list(self.array.tolist())
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        array_ = self.array
+        if dtype is not None and np.dtype(dtype) != array_.dtype:
+            return array_.astype(dtype)
+        return array_.copy() if copy else array_
+
+    def __len__(self) -> int:
+        return int(self.array.shape[0])
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[float]: ...
+
+    def __getitem__(self, index: int | slice) -> float | list[float]:
+        if isinstance(index, slice):
+            return list(self.array[index].tolist())
+        return float(self.array[index])
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.tolist())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactEmbedding):
+            return bool(np.array_equal(self.array, other.array))
+        if isinstance(other, Sequence | np.ndarray) and not isinstance(other, str | bytes):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(dim={len(self)})"
+
+    @classmethod
+    def _validate(cls, value: Any) -> CompactEmbedding:
+        if isinstance(value, CompactEmbedding):
+            return value
+        if isinstance(value, np.ndarray | array):
+            return CompactEmbedding(value)
+        # Anything else (lists included) is left to the next member of the union
+        msg = "expected a float32 embedding, ndarray or array('f')"
+        raise ValueError(msg)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: value.tolist(), return_schema=core_schema.list_schema(core_schema.float_schema())
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return handler(core_schema.list_schema(core_schema.float_schema()))
+
+
+class LazyEmbedding(CompactEmbedding):
+    """
+    Embedding read from storage, kept in its stored form until it is used.
+
+    SQLite rows hold the raw little-endian float32 BLOB and pgvector rows the
+    array the driver returned; either is decoded at most once, on first access,
+    into a read-only float32 NumPy view (`array`). ``np.asarray`` and the vector
+    search helpers use that view directly, so listing records never builds
+    per-element Python floats. It serializes as a plain list of floats.
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: bytes | np.ndarray) -> None:
+        # `_array` stays unset until the raw bytes are decoded
+        self._raw: bytes | None = None
+        if isinstance(raw, np.ndarray):
+            self._array = self._freeze(raw, owned=True)
+        else:
+            self._raw = bytes(raw)
+
+    @property
+    def decoded(self) -> bool:
+        return self._raw is None
+
+    @property
+    def array(self) -> np.ndarray:
+        """Read-only float32 view of the vector (decoded on first access)."""
+        if self._raw is not None:
+            self._array = np.frombuffer(self._raw, dtype="<f4")
+            self._raw = None
+        return self._array
+
+    def __len__(self) -> int:
+        if self._raw is not None:
+            return len(self._raw) // 4
+        return int(self._array.shape[0])
+
+    def __repr__(self) -> str:
+        state = "decoded" if self.decoded else "encoded"
+        return f"LazyEmbedding(dim={len(self)}, {state})"
+
+
+@overload
+def as_compact(values: None) -> None: ...
+
+
+@overload
+def as_compact(values: Sequence[float] | np.ndarray) -> CompactEmbedding: ...
+
+
+def as_compact(values: Sequence[float] | np.ndarray | None) -> CompactEmbedding | None:
+    """``values`` as a `CompactEmbedding`, returned unchanged when it already is one."""
+    if values is None or isinstance(values, CompactEmbedding):
+        return values
+    return CompactEmbedding(values)
+
+
+__all__ = ["CompactEmbedding", "LazyEmbedding", "as_compact"]
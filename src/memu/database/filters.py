@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Iterator, Mapping
+from typing import Any, NamedTuple
+
+
+class _Clause(NamedTuple):
+    field: str
+    value: Any
+    is_in: bool
+    # Hashable members of an `__in` value, for set membership and index lookups
+    members: frozenset[Any] | None
+
+
+class WhereFilter(Mapping[str, Any]):
+    """
+    A ``where`` scope filter (``field`` / ``field__in`` keys) parsed once per request.
+
+    It is the read-only mapping it was built from (``None`` values dropped), so it
+    can be passed anywhere a ``where`` dict is accepted, and it carries the compiled
+    forms each backend needs: `matches` for in-memory records, `sql_clauses` for
+    SQLAlchemy models (cached per model) and `lookups` for hash indexes.
+    """
+
+    __slots__ = ("_clauses", "_raw", "_sql_cache")
+
+    def __init__(self, where: Mapping[str, Any] | None = None) -> None:
+        self._raw = {key: value for key, value in (where or {}).items() if value is not None}
+        self._clauses = tuple(_compile_clause(key, value) for key, value in self._raw.items())
+        self._sql_cache: dict[Any, tuple[Any, ...]] = {}
+
+    @classmethod
+    def of(cls, where: Mapping[str, Any] | None) -> WhereFilter:
+        """Return ``where`` if it is already compiled, otherwise compile it."""
+        return where if isinstance(where, WhereFilter) else cls(where)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._raw[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return f"WhereFilter({self._raw!r})"
+
+    @property
+    def empty(self) -> bool:
+        return not self._clauses
+
+    @property
+    def fields(self) -> set[str]:
+        return {clause.field for clause in self._clauses}
+
+    @property
+    def lookups(self) -> list[tuple[str, tuple[Any, ...]]]:
+        """``(field, accepted_values)`` pairs usable against a hash index."""
+        result: list[tuple[str, tuple[Any, ...]]] = []
+        for clause in self._clauses:
+            if clause.is_in:
+                if clause.members is not None:
+                    result.append((clause.field, tuple(clause.members)))
+            elif _is_hashable(clause.value):
+                result.append((clause.field, (clause.value,)))
+        return result
+
+    def matches(self, obj: Any) -> bool:
+        for clause in self._clauses:
+            actual = getattr(obj, clause.field, None)
+            if not clause.is_in:
+                if actual != clause.value:
+                    return False
+                continue
+            try:
+                expected = clause.members if clause.members is not None else clause.value
+                if actual not in expected:
+                    return False
+            except TypeError:
+                return False
+        return True
+
+    def sql_clauses(self, model: Any) -> list[Any]:
+        """SQLAlchemy filter expressions against ``model``'s columns (a fresh list per call)."""
+        cached = self._sql_cache.get(model)
+        if cached is None:
+            expressions: list[Any] = []
+            for clause in self._clauses:
+                column = getattr(model, clause.field, None)
+                if column is None:
+                    msg = f"Unknown filter field '{clause.field}' for model '{model.__name__}'"
+                    raise ValueError(msg)
+                if not clause.is_in:
+                    expressions.append(column == clause.value)
+                else:
+                    # `members` holds the values even when `value` was a one-shot iterator
+                    expressions.append(column.in_(clause.members if clause.members is not None else clause.value))
+            cached = self._sql_cache[model] = tuple(expressions)
+        return list(cached)
+
+
+def _compile_clause(raw_key: str, value: Any) -> _Clause:
+    field, _, op = raw_key.partition("__")
+    if op != "in" or isinstance(value, str):
+        # A plain string given to `__in` means that single value
+        return _Clause(field, value, is_in=False, members=None)
+    members: frozenset[Any] | None = None
+    # Non-iterable or unhashable values are matched by `in` as given
+    with contextlib.suppress(TypeError):
+        members = frozenset(value)
+    return _Clause(field, value, is_in=True, members=members)
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+__all__ = ["WhereFilter"]
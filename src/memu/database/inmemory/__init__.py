@@ -19,6 +19,7 @@ def build_inmemory_database(
         memory_item_model=memory_item_model,
         memory_category_model=memory_category_model,
         category_item_model=category_item_model,
+        compact_embeddings=config.metadata_store.compact_embeddings,
     )
 
 
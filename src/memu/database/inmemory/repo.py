@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import MutableMapping
 from typing import Any
 
 from pydantic import BaseModel
@@ -27,6 +28,7 @@ class InMemoryStore(Database):
         memory_category_model: type[Any] | None = None,
         category_item_model: type[Any] | None = None,
         state: InMemoryState | None = None,
+        compact_embeddings: bool = False,
     ) -> None:
         self.scope_model = scope_model or BaseModel
         (
@@ -38,7 +40,7 @@ class InMemoryStore(Database):
 
         self.state = state or InMemoryState()
         self.resources: dict[str, Resource] = self.state.resources
-        self.items: dict[str, MemoryItem] = self.state.items
+        self.items: MutableMapping[str, MemoryItem] = self.state.items
         self.categories: dict[str, MemoryCategory] = self.state.categories
         self.relations: list[CategoryItem] = self.state.relations
 
@@ -47,11 +49,15 @@ class InMemoryStore(Database):
         memory_category_model = memory_category_model or default_memory_category_model or MemoryCategory
         category_item_model = category_item_model or default_category_item_model or CategoryItem
 
-        self.resource_repo: ResourceRepo = InMemoryResourceRepository(state=self.state, resource_model=resource_model)
+        self.resource_repo: ResourceRepo = InMemoryResourceRepository(
+            state=self.state, resource_model=resource_model, compact_embeddings=compact_embeddings
+        )
         self.memory_category_repo: MemoryCategoryRepo = InMemoryMemoryCategoryRepository(
-            state=self.state, memory_category_model=memory_category_model
+            state=self.state, memory_category_model=memory_category_model, compact_embeddings=compact_embeddings
+        )
+        self.memory_item_repo = InMemoryMemoryItemRepository(
+            state=self.state, memory_item_model=memory_item_model, compact_embeddings=compact_embeddings
         )
-        self.memory_item_repo = InMemoryMemoryItemRepository(state=self.state, memory_item_model=memory_item_model)
         self.category_item_repo = InMemoryCategoryItemRepository(
             state=self.state, category_item_model=category_item_model
         )
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import uuid
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any, override
 
-from memu.database.inmemory.repositories.filter import matches_where
+from memu.database.filters import WhereFilter
 from memu.database.inmemory.state import InMemoryState
 from memu.database.models import CategoryItem
 from memu.database.repositories.category_item import CategoryItemRepo
@@ -15,31 +15,64 @@ class InMemoryCategoryItemRepository(CategoryItemRepo):
         self._state = state
         self.category_item_model = category_item_model
         self.relations: list[CategoryItem] = self._state.relations
+        # Adjacency indexes over `relations`, so lookups by item or category skip the full list
+        self._by_item = self._state.relations_by_item
+        self._by_category = self._state.relations_by_category
+        if self.relations and not self._by_item:
+            for rel in self.relations:
+                self._index(rel)
 
     def list_relations(self, where: Mapping[str, Any] | None = None) -> list[CategoryItem]:
-        if not where:
+        compiled = WhereFilter.of(where)
+        if compiled.empty:
             return list(self.relations)
-        return [rel for rel in self.relations if matches_where(rel, where)]
+        return [rel for rel in self.relations if compiled.matches(rel)]
+
+    def list_items_for_categories(
+        self, category_ids: Sequence[str], where: Mapping[str, Any] | None = None
+    ) -> list[CategoryItem]:
+        compiled = WhereFilter.of(where)
+        result: list[CategoryItem] = []
+        for cat_id in dict.fromkeys(category_ids):
+            result.extend(rel for rel in self._by_category.get(cat_id, {}).values() if compiled.matches(rel))
+        return result
 
     def link_item_category(self, item_id: str, cat_id: str, user_data: dict[str, Any]) -> CategoryItem:
-        _ = item_id  # enforced by caller via existing state
-        for rel in self.relations:
-            if rel.item_id == item_id and rel.category_id == cat_id:
-                return rel
+        existing = self._by_item.get(item_id, {}).get(cat_id)
+        if existing is not None:
+            return existing
         rel = self.category_item_model(id=str(uuid.uuid4()), item_id=item_id, category_id=cat_id, **user_data)
         self.relations.append(rel)
+        self._index(rel)
         return rel
 
+    def link_many(self, pairs: Sequence[tuple[str, str]], user_data: dict[str, Any]) -> list[CategoryItem]:
+        return [self.link_item_category(item_id, cat_id, user_data) for item_id, cat_id in pairs]
+
     def load_existing(self) -> None:
         return None
 
     @override
     def get_item_categories(self, item_id: str) -> list[CategoryItem]:
-        return [rel for rel in self.relations if rel.item_id == item_id]
+        return list(self._by_item.get(item_id, {}).values())
 
     @override
     def unlink_item_category(self, item_id: str, cat_id: str) -> None:
-        self.relations = [rel for rel in self.relations if not (rel.item_id == item_id and rel.category_id == cat_id)]
+        rel = self._by_item.get(item_id, {}).pop(cat_id, None)
+        if rel is None:
+            return
+        if not self._by_item[item_id]:
+            del self._by_item[item_id]
+        category_rels = self._by_category.get(cat_id, {})
+        category_rels.pop(item_id, None)
+        if not category_rels:
+            self._by_category.pop(cat_id, None)
+        # Remove in place: `relations` is shared with the store state
+        self.relations.remove(rel)
+
+    def _index(self, rel: CategoryItem) -> None:
+        self._by_item.setdefault(rel.item_id, {})[rel.category_id] = rel
+        self._by_category.setdefault(rel.category_id, {})[rel.item_id] = rel
 
 
 __all__ = ["InMemoryCategoryItemRepository"]
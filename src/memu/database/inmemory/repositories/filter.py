@@ -3,30 +3,31 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
+from memu.database.filters import WhereFilter
+from memu.database.scope_index import ScopeIndex
+
+
+def select_where[T](
+    records: Mapping[str, T], where: Mapping[str, Any] | None, index: ScopeIndex | None = None
+) -> dict[str, T]:
+    """Records matching ``where``, narrowed through ``index`` when it covers a clause."""
+    compiled = WhereFilter.of(where)
+    if compiled.empty:
+        return dict(records)
+    ids = index.candidates(compiled.lookups) if index is not None else None
+    if ids is None:
+        return {rid: record for rid, record in records.items() if compiled.matches(record)}
+    result: dict[str, T] = {}
+    for rid in ids:
+        record = records.get(rid)
+        if record is not None and compiled.matches(record):
+            result[rid] = record
+    return result
+
 
 def matches_where(obj: Any, where: Mapping[str, Any] | None) -> bool:
     """Basic field/`__in` matcher for in-memory repos."""
-    if not where:
-        return True
-    for raw_key, expected in where.items():
-        if expected is None:
-            continue
-        field, op = [*raw_key.split("__", 1), None][:2]
-        actual = getattr(obj, str(field), None)
-        if op == "in":
-            if isinstance(expected, str):
-                if actual != expected:
-                    return False
-            else:
-                try:
-                    if actual not in expected:
-                        return False
-                except TypeError:
-                    return False
-        else:
-            if actual != expected:
-                return False
-    return True
-
-
-__all__ = ["matches_where"]
+    return WhereFilter.of(where).matches(obj)
+
+
+__all__ = ["matches_where", "select_where"]
@@ -6,36 +6,52 @@ from typing import Any
 
 import pendulum
 
-from memu.database.inmemory.repositories.filter import matches_where
+from memu.database.embedding import as_compact
+from memu.database.inmemory.repositories.filter import select_where
 from memu.database.inmemory.state import InMemoryState
-from memu.database.models import MemoryCategory
+from memu.database.models import Embedding, MemoryCategory
 from memu.database.repositories.memory_category import MemoryCategoryRepo as MemoryCategoryRepoProtocol
+from memu.database.scope_index import scope_fields_of
 
 
 class InMemoryMemoryCategoryRepository(MemoryCategoryRepoProtocol):
-    def __init__(self, *, state: InMemoryState, memory_category_model: type[MemoryCategory]) -> None:
+    def __init__(
+        self, *, state: InMemoryState, memory_category_model: type[MemoryCategory], compact_embeddings: bool = False
+    ) -> None:
         self._state = state
         self.memory_category_model = memory_category_model
+        self._compact_embeddings = compact_embeddings
         self.categories: dict[str, MemoryCategory] = self._state.categories
+        self._scopes = self._state.category_scopes
+        self._scopes.configure(scope_fields_of(memory_category_model, MemoryCategory), self.categories)
 
-    def list_categories(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryCategory]:
-        if not where:
-            return dict(self.categories)
-        return {cid: cat for cid, cat in self.categories.items() if matches_where(cat, where)}
+    def list_categories(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryCategory]:
+        # Records are resident, so there is nothing to skip for `with_embeddings=False`
+        return select_where(self.categories, where, self._scopes)
 
     def clear_categories(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryCategory]:
         if not where:
             matches = self.categories.copy()
             self.categories.clear()
+            self._scopes.clear()
             return matches
-        matches = {cid: cat for cid, cat in self.categories.items() if matches_where(cat, where)}
-        self.categories = {cid: cat for cid, cat in self.categories.items() if cid not in matches}
+        matches = select_where(self.categories, where, self._scopes)
+        # Remove in place: `categories` is shared with the store state
+        for cid, cat in matches.items():
+            del self.categories[cid]
+            self._scopes.remove(cid, cat)
         return matches
 
     def get_or_create_category(
-        self, *, name: str, description: str, embedding: list[float], user_data: dict[str, Any]
+        self, *, name: str, description: str, embedding: Embedding, user_data: dict[str, Any]
     ) -> MemoryCategory:
-        for c in self.categories.values():
+        if self._compact_embeddings:
+            embedding = as_compact(embedding)
+        # Only the categories of this scope are visited, via the scope index
+        scoped = select_where(self.categories, user_data, self._scopes)
+        for c in scoped.values():
             if c.name == name and all(getattr(c, k) == v for k, v in user_data.items()):
                 now = pendulum.now("UTC")
                 if c.embedding is None:
@@ -48,6 +64,7 @@ class InMemoryMemoryCategoryRepository(MemoryCategoryRepoProtocol):
         cid = str(uuid.uuid4())
         cat = self.memory_category_model(id=cid, name=name, description=description, embedding=embedding, **user_data)
         self.categories[cid] = cat
+        self._scopes.add(cid, cat)
         return cat
 
     def update_category(
@@ -56,13 +73,17 @@ class InMemoryMemoryCategoryRepository(MemoryCategoryRepoProtocol):
         category_id: str,
         name: str | None = None,
         description: str | None = None,
-        embedding: list[float] | None = None,
+        embedding: Embedding | None = None,
         summary: str | None = None,
+        summary_embedding: Embedding | None = None,
     ) -> MemoryCategory:
         cat = self.categories.get(category_id)
         if cat is None:
             msg = f"Category with id {category_id} not found"
             raise KeyError(msg)
+        if self._compact_embeddings:
+            embedding = as_compact(embedding)
+            summary_embedding = as_compact(summary_embedding)
 
         if name is not None:
             cat.name = name
@@ -71,7 +92,11 @@ class InMemoryMemoryCategoryRepository(MemoryCategoryRepoProtocol):
         if embedding is not None:
             cat.embedding = embedding
         if summary is not None:
+            if summary != cat.summary:
+                cat.summary_embedding = None
             cat.summary = summary
+        if summary_embedding is not None:
+            cat.summary_embedding = summary_embedding
 
         cat.updated_at = pendulum.now("UTC")
         return cat
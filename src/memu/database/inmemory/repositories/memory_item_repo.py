@@ -1,37 +1,54 @@
 from __future__ import annotations
 
 import uuid
-from collections.abc import Mapping
+from collections.abc import Mapping, MutableMapping, Sequence
 from typing import Any, override
 
 import pendulum
 
-from memu.database.inmemory.repositories.filter import matches_where
+from memu.database.embedding import as_compact
+from memu.database.filters import WhereFilter
+from memu.database.inmemory.repositories.filter import select_where
 from memu.database.inmemory.state import InMemoryState
-from memu.database.inmemory.vector import cosine_topk, cosine_topk_salience
-from memu.database.models import MemoryItem, MemoryType, compute_content_hash
+from memu.database.models import Embedding, MemoryItem, MemoryType, compute_content_hash
 from memu.database.repositories.memory_item import MemoryItemRepo
+from memu.database.scope_index import scope_fields_of
 
 
 class InMemoryMemoryItemRepository(MemoryItemRepo):
-    def __init__(self, *, state: InMemoryState, memory_item_model: type[MemoryItem]) -> None:
+    def __init__(
+        self, *, state: InMemoryState, memory_item_model: type[MemoryItem], compact_embeddings: bool = False
+    ) -> None:
         self._state = state
         self.memory_item_model = memory_item_model
-        self.items: dict[str, MemoryItem] = self._state.items
+        self._compact_embeddings = compact_embeddings
+        self.items: MutableMapping[str, MemoryItem] = self._state.items
+        self._vectors = self._state.item_vectors
+        self._hashes = self._state.item_hashes
+        self._scopes = self._state.item_scopes
+        self._scopes.configure(scope_fields_of(memory_item_model, MemoryItem), self.items)
+        if self.items and not len(self._vectors):
+            for item in self.items.values():
+                self._index_item(item)
+        if self.items and not self._hashes:
+            for item in self.items.values():
+                self._index_hash(item)
 
-    def list_items(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryItem]:
-        if not where:
-            return dict(self.items)
-        return {mid: item for mid, item in self.items.items() if matches_where(item, where)}
+    def list_items(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryItem]:
+        # Records are resident, so there is nothing to skip for `with_embeddings=False`
+        return select_where(self.items, where, self._scopes)
 
     def list_items_by_ref_ids(
-        self, ref_ids: list[str], where: Mapping[str, Any] | None = None
+        self, ref_ids: list[str], where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
     ) -> dict[str, MemoryItem]:
         """List items by their ref_id in the extra column.
 
         Args:
             ref_ids: List of ref_ids to query.
             where: Additional filter conditions.
+            with_embeddings: Accepted for the repository contract; records are returned whole.
 
         Returns:
             Dict mapping item_id -> MemoryItem for items whose extra.ref_id is in ref_ids.
@@ -40,10 +57,8 @@ class InMemoryMemoryItemRepository(MemoryItemRepo):
             return {}
         ref_id_set = set(ref_ids)
         result: dict[str, MemoryItem] = {}
-        for mid, item in self.items.items():
-            # Check where filter first
-            if where and not matches_where(item, where):
-                continue
+        # Apply the where filter first, narrowed by the scope index
+        for mid, item in select_where(self.items, where, self._scopes).items():
             # Check if ref_id is in the requested set
             item_ref_id = (item.extra or {}).get("ref_id")
             if item_ref_id and item_ref_id in ref_id_set:
@@ -52,11 +67,18 @@ class InMemoryMemoryItemRepository(MemoryItemRepo):
 
     def clear_items(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryItem]:
         if not where:
-            matches = self.items.copy()
+            matches = dict(self.items)
             self.items.clear()
+            self._vectors.clear()
+            self._hashes.clear()
+            self._scopes.clear()
             return matches
-        matches = {mid: item for mid, item in self.items.items() if matches_where(item, where)}
-        self.items = {mid: item for mid, item in self.items.items() if mid not in matches}
+        matches = select_where(self.items, where, self._scopes)
+        for mid, item in matches.items():
+            del self.items[mid]
+            self._vectors.remove(mid)
+            self._unindex_hash(item)
+            self._scopes.remove(mid, item)
         return matches
 
     def _find_by_hash(self, content_hash: str, user_data: dict[str, Any]) -> MemoryItem | None:
@@ -64,25 +86,44 @@ class InMemoryMemoryItemRepository(MemoryItemRepo):
         Find existing item by content hash within the same user scope.
 
         This enables deduplication: if the same content exists for the same user,
-        we reinforce it instead of creating a duplicate.
+        we reinforce it instead of creating a duplicate. Only the items sharing the
+        hash are visited, via the hash -> ids index.
         """
-        for item in self.items.values():
-            # Read content_hash from extra dict
-            item_hash = (item.extra or {}).get("content_hash")
-            if item_hash != content_hash:
+        scope = WhereFilter.of(user_data)
+        for mid in self._hashes.get(content_hash, ()):
+            item = self.items.get(mid)
+            # Skip entries gone stale through direct writes to the shared items dict
+            if item is None or (item.extra or {}).get("content_hash") != content_hash:
                 continue
             # Check scope match (user_id, agent_id, etc.)
-            if matches_where(item, user_data):
+            if scope.matches(item):
                 return item
         return None
 
+    def _index_hash(self, item: MemoryItem) -> None:
+        content_hash = (item.extra or {}).get("content_hash")
+        if content_hash:
+            ids = self._hashes.setdefault(content_hash, [])
+            if item.id not in ids:
+                ids.append(item.id)
+
+    def _unindex_hash(self, item: MemoryItem) -> None:
+        content_hash = (item.extra or {}).get("content_hash")
+        if not content_hash or content_hash not in self._hashes:
+            return
+        ids = self._hashes[content_hash]
+        if item.id in ids:
+            ids.remove(item.id)
+        if not ids:
+            del self._hashes[content_hash]
+
     def create_item(
         self,
         *,
-        resource_id: str,
+        resource_id: str | None = None,
         memory_type: MemoryType,
         summary: str,
-        embedding: list[float],
+        embedding: Embedding,
         user_data: dict[str, Any],
         reinforce: bool = False,
     ) -> MemoryItem:
@@ -101,19 +142,21 @@ class InMemoryMemoryItemRepository(MemoryItemRepo):
             resource_id=resource_id,
             memory_type=memory_type,
             summary=summary,
-            embedding=embedding,
+            embedding=as_compact(embedding) if self._compact_embeddings else embedding,
             **user_data,
         )
         self.items[mid] = it
+        self._index_item(it)
+        self._scopes.add(mid, it)
         return it
 
     def create_item_reinforce(
         self,
         *,
-        resource_id: str,
+        resource_id: str | None,
         memory_type: MemoryType,
         summary: str,
-        embedding: list[float],
+        embedding: Embedding,
         user_data: dict[str, Any],
         reinforce: bool = False,
     ) -> MemoryItem:
@@ -131,6 +174,7 @@ class InMemoryMemoryItemRepository(MemoryItemRepo):
                 "last_reinforced_at": pendulum.now("UTC").isoformat(),
             }
             existing.updated_at = pendulum.now("UTC")
+            self._index_item(existing)
             return existing
 
         # Create new item with salience tracking in extra
@@ -147,13 +191,37 @@ class InMemoryMemoryItemRepository(MemoryItemRepo):
             resource_id=resource_id,
             memory_type=memory_type,
             summary=summary,
-            embedding=embedding,
+            embedding=as_compact(embedding) if self._compact_embeddings else embedding,
             extra=item_extra,
             **user_data,
         )
         self.items[mid] = it
+        self._index_item(it)
+        self._index_hash(it)
+        self._scopes.add(mid, it)
         return it
 
+    def create_items_bulk(
+        self,
+        *,
+        resource_id: str,
+        entries: Sequence[tuple[MemoryType, str, Embedding]],
+        user_data: dict[str, Any],
+        reinforce: bool = False,
+    ) -> list[MemoryItem]:
+        # Items live in a dict already, so bulk creation is the per-item path without I/O
+        return [
+            self.create_item(
+                resource_id=resource_id,
+                memory_type=memory_type,
+                summary=summary,
+                embedding=embedding,
+                user_data=dict(user_data),
+                reinforce=reinforce,
+            )
+            for memory_type, summary, embedding in entries
+        ]
+
     def vector_search_items(
         self,
         query_vec: list[float],
@@ -163,25 +231,29 @@ class InMemoryMemoryItemRepository(MemoryItemRepo):
         ranking: str = "similarity",
         recency_decay_days: float = 30.0,
     ) -> list[tuple[str, float]]:
-        pool = self.list_items(where)
+        compiled = WhereFilter.of(where)
+        candidates = None if compiled.empty else select_where(self.items, compiled, self._scopes).keys()
 
         if ranking == "salience":
-            # Salience-aware ranking: similarity x reinforcement x recency
-            # Read values from extra dict
-            corpus = [
-                (
-                    i.id,
-                    i.embedding,
-                    (i.extra or {}).get("reinforcement_count", 1),
-                    self._parse_datetime((i.extra or {}).get("last_reinforced_at")),
-                )
-                for i in pool.values()
-            ]
-            return cosine_topk_salience(query_vec, corpus, k=top_k, recency_decay_days=recency_decay_days)
-
-        # Default: pure cosine similarity (backward compatible)
-        hits = cosine_topk(query_vec, [(i.id, i.embedding) for i in pool.values()], k=top_k)
-        return hits
+            # Salience-aware ranking: similarity x reinforcement x recency, using the
+            # reinforcement columns precomputed from each item's extra dict
+            return self._vectors.salience_search(
+                query_vec, top_k, candidates=candidates, recency_decay_days=recency_decay_days
+            )
+
+        # Default: pure cosine similarity against the persistent embedding matrix
+        return self._vectors.search(query_vec, top_k, candidates=candidates)
+
+    def _index_item(self, item: MemoryItem) -> None:
+        """Sync an item's embedding and salience columns into the shared vector index."""
+        extra = item.extra or {}
+        last_reinforced_at = self._parse_datetime(extra.get("last_reinforced_at"))
+        self._vectors.upsert(
+            item.id,
+            item.embedding,
+            reinforcement_count=extra.get("reinforcement_count", 1),
+            last_reinforced_ts=None if last_reinforced_at is None else last_reinforced_at.timestamp(),
+        )
 
     def load_existing(self) -> None:
         return None
@@ -189,6 +261,9 @@ class InMemoryMemoryItemRepository(MemoryItemRepo):
     def get_item(self, item_id: str) -> MemoryItem | None:
         return self.items.get(item_id)
 
+    def get_items(self, item_ids: Sequence[str], *, with_embeddings: bool = True) -> dict[str, MemoryItem]:
+        return {mid: self.items[mid] for mid in item_ids if mid in self.items}
+
     @staticmethod
     def _parse_datetime(dt_str: str | None) -> pendulum.DateTime | None:
         """Parse ISO datetime string from extra dict."""
@@ -205,8 +280,11 @@ class InMemoryMemoryItemRepository(MemoryItemRepo):
 
     @override
     def delete_item(self, item_id: str) -> None:
-        if item_id in self.items:
-            del self.items[item_id]
+        item = self.items.pop(item_id, None)
+        if item is not None:
+            self._unindex_hash(item)
+            self._scopes.remove(item_id, item)
+        self._vectors.remove(item_id)
 
     @override
     def update_item(
@@ -215,7 +293,7 @@ class InMemoryMemoryItemRepository(MemoryItemRepo):
         item_id: str,
         memory_type: MemoryType | None = None,
         summary: str | None = None,
-        embedding: list[float] | None = None,
+        embedding: Embedding | None = None,
         extra: dict[str, Any] | None = None,
     ) -> MemoryItem:
         item = self.items.get(item_id)
@@ -228,14 +306,18 @@ class InMemoryMemoryItemRepository(MemoryItemRepo):
         if summary is not None:
             item.summary = summary
         if embedding is not None:
-            item.embedding = embedding
+            item.embedding = as_compact(embedding) if self._compact_embeddings else embedding
         if extra is not None:
             # Incremental update: merge new keys into existing extra dict
+            self._unindex_hash(item)
             current_extra = item.extra or {}
             merged_extra = {**current_extra, **extra}
             item.extra = merged_extra
+            self._index_hash(item)
 
         self.items[item_id] = item
+        if embedding is not None or extra is not None:
+            self._index_item(item)
         return item
 
 
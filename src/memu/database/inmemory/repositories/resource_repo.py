@@ -4,30 +4,42 @@ import uuid
 from collections.abc import Mapping
 from typing import Any
 
-from memu.database.inmemory.repositories.filter import matches_where
+from memu.database.embedding import as_compact
+from memu.database.inmemory.repositories.filter import select_where
 from memu.database.inmemory.state import InMemoryState
-from memu.database.models import Resource
+from memu.database.models import Embedding, Resource
 from memu.database.repositories.resource import ResourceRepo as ResourceRepoProtocol
+from memu.database.scope_index import scope_fields_of
 
 
 class InMemoryResourceRepository(ResourceRepoProtocol):
-    def __init__(self, *, state: InMemoryState, resource_model: type[Resource]) -> None:
+    def __init__(
+        self, *, state: InMemoryState, resource_model: type[Resource], compact_embeddings: bool = False
+    ) -> None:
         self._state = state
         self.resource_model = resource_model
+        self._compact_embeddings = compact_embeddings
         self.resources: dict[str, Resource] = self._state.resources
+        self._scopes = self._state.resource_scopes
+        self._scopes.configure(scope_fields_of(resource_model, Resource), self.resources)
 
-    def list_resources(self, where: Mapping[str, Any] | None = None) -> dict[str, Resource]:
-        if not where:
-            return dict(self.resources)
-        return {rid: res for rid, res in self.resources.items() if matches_where(res, where)}
+    def list_resources(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, Resource]:
+        # Records are resident, so there is nothing to skip for `with_embeddings=False`
+        return select_where(self.resources, where, self._scopes)
 
     def clear_resources(self, where: Mapping[str, Any] | None = None) -> dict[str, Resource]:
         if not where:
             matches = self.resources.copy()
             self.resources.clear()
+            self._scopes.clear()
             return matches
-        matches = {rid: res for rid, res in self.resources.items() if matches_where(res, where)}
-        self.resources = {rid: res for rid, res in self.resources.items() if rid not in matches}
+        matches = select_where(self.resources, where, self._scopes)
+        # Remove in place: `resources` is shared with the store state
+        for rid, res in matches.items():
+            del self.resources[rid]
+            self._scopes.remove(rid, res)
         return matches
 
     def create_resource(
@@ -37,7 +49,7 @@ class InMemoryResourceRepository(ResourceRepoProtocol):
         modality: str,
         local_path: str,
         caption: str | None,
-        embedding: list[float] | None,
+        embedding: Embedding | None,
         user_data: dict[str, Any],
     ) -> Resource:
         rid = str(uuid.uuid4())
@@ -47,10 +59,11 @@ class InMemoryResourceRepository(ResourceRepoProtocol):
             modality=modality,
             local_path=local_path,
             caption=caption,
-            embedding=embedding,
+            embedding=as_compact(embedding) if self._compact_embeddings else embedding,
             **user_data,
         )
         self.resources[rid] = res
+        self._scopes.add(rid, res)
         return res
 
     def load_existing(self) -> None:
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Iterable
-from datetime import datetime
-from typing import cast
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
 
 import numpy as np
 
+from memu.database.vector_index import salience_scores, select_topk
+
 
 def _cosine(a: np.ndarray, b: np.ndarray) -> float:
     denom = (np.linalg.norm(a) * np.linalg.norm(b)) + 1e-9
@@ -47,30 +48,31 @@ def salience_score(
     else:
         now = datetime.now(last_reinforced_at.tzinfo) if last_reinforced_at.tzinfo else datetime.utcnow()
         days_ago = (now - last_reinforced_at).total_seconds() / 86400
-        # 0.693 = ln(2), gives us proper half-life decay
-        recency_factor = math.exp(-0.693 * days_ago / recency_decay_days)
+        # ln(2) gives us proper half-life decay
+        recency_factor = math.exp(-math.log(2) * days_ago / recency_decay_days)
 
     return similarity * reinforcement_factor * recency_factor
 
 
 def cosine_topk(
-    query_vec: list[float],
-    corpus: Iterable[tuple[str, list[float] | None]],
+    query_vec: Sequence[float],
+    corpus: Iterable[tuple[str, Sequence[float] | None]],
     k: int = 5,
 ) -> list[tuple[str, float]]:
     # Filter out None vectors and collect valid entries
     ids: list[str] = []
-    vecs: list[list[float]] = []
+    vecs: list[Sequence[float]] = []
     for _id, vec in corpus:
         if vec is not None:
             ids.append(_id)
-            vecs.append(cast(list[float], vec))
+            vecs.append(vec)
 
     if not vecs:
         return []
 
-    # Vectorized computation: stack all vectors into a matrix
-    q = np.array(query_vec, dtype=np.float32)
+    # Vectorized computation: stack all vectors into a matrix (float32 embeddings
+    # such as `CompactEmbedding` are copied in as buffers, lists element by element)
+    q = np.asarray(query_vec, dtype=np.float32)
     matrix = np.array(vecs, dtype=np.float32)  # shape: (n, dim)
 
     # Compute all cosine similarities at once
@@ -79,21 +81,13 @@ def cosine_topk(
     scores = matrix @ q / (vec_norms * q_norm + 1e-9)
 
     # Use argpartition for O(n) topk selection instead of O(n log n) sort
-    n = len(scores)
-    actual_k = min(k, n)
-    if actual_k == n:
-        topk_indices = np.argsort(scores)[::-1]
-    else:
-        # Get indices of top k elements (unordered), then sort only those
-        topk_indices = np.argpartition(scores, -actual_k)[-actual_k:]
-        topk_indices = topk_indices[np.argsort(scores[topk_indices])[::-1]]
-
+    topk_indices = select_topk(scores, k)
     return [(ids[i], float(scores[i])) for i in topk_indices]
 
 
 def cosine_topk_salience(
-    query_vec: list[float],
-    corpus: Iterable[tuple[str, list[float] | None, int, datetime | None]],
+    query_vec: Sequence[float],
+    corpus: Iterable[tuple[str, Sequence[float] | None, int, datetime | None]],
     k: int = 5,
     recency_decay_days: float = 30.0,
 ) -> list[tuple[str, float]]:
@@ -111,27 +105,50 @@ def cosine_topk_salience(
     Returns:
         List of (id, salience_score) tuples, sorted by score descending
     """
-    q = np.array(query_vec, dtype=np.float32)
-    scored: list[tuple[str, float]] = []
-
+    ids: list[str] = []
+    vecs: list[Sequence[float]] = []
+    counts: list[int] = []
+    timestamps: list[float] = []
     for _id, vec, reinforcement_count, last_reinforced_at in corpus:
         if vec is None:
             continue
-        vec_list = cast(list[float], vec)
-        v = np.array(vec_list, dtype=np.float32)
-        similarity = _cosine(q, v)
-        score = salience_score(similarity, reinforcement_count, last_reinforced_at, recency_decay_days)
-        scored.append((_id, score))
+        ids.append(_id)
+        vecs.append(vec)
+        counts.append(reinforcement_count)
+        timestamps.append(to_epoch_seconds(last_reinforced_at))
+
+    if not vecs:
+        return []
+
+    # Similarity for the whole corpus in one matrix product
+    q = np.asarray(query_vec, dtype=np.float32)
+    matrix = np.array(vecs, dtype=np.float32)
+    similarities = matrix @ q / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(q) + 1e-9)
+
+    scores = salience_scores(
+        similarities,
+        np.array(counts, dtype=np.float64),
+        np.array(timestamps, dtype=np.float64),
+        recency_decay_days,
+    )
+    topk_indices = select_topk(scores, k)
+    return [(ids[i], float(scores[i])) for i in topk_indices]
+
 
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return scored[:k]
+def to_epoch_seconds(dt: datetime | None) -> float:
+    """Epoch seconds for salience columns; naive datetimes are treated as UTC, None maps to NaN."""
+    if dt is None:
+        return math.nan
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.timestamp()
 
 
-def query_cosine(query_vec: list[float], vecs: list[list[float]]) -> list[tuple[int, float]]:
+def query_cosine(query_vec: Sequence[float], vecs: Sequence[Sequence[float]]) -> list[tuple[int, float]]:
     res: list[tuple[int, float]] = []
-    q = np.array(query_vec, dtype=np.float32)
+    q = np.asarray(query_vec, dtype=np.float32)
     for i, v in enumerate(vecs):
-        vec_array = np.array(v, dtype=np.float32)
+        vec_array = np.asarray(v, dtype=np.float32)
         res.append((i, _cosine(q, vec_array)))
     res.sort(key=lambda x: x[1], reverse=True)
     return res
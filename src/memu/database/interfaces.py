@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import MutableMapping
 from typing import Protocol, runtime_checkable
 
 from memu.database.models import CategoryItem as CategoryItemRecord
@@ -19,7 +20,7 @@ class Database(Protocol):
     category_item_repo: CategoryItemRepo
 
     resources: dict[str, ResourceRecord]
-    items: dict[str, MemoryItemRecord]
+    items: MutableMapping[str, MemoryItemRecord]
     categories: dict[str, MemoryCategoryRecord]
     relations: list[CategoryItemRecord]
 
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, ItemsView, Iterator, MutableMapping, ValuesView
+from dataclasses import dataclass
+
+from memu.database.models import MemoryItem
+
+
+@dataclass
+class ItemCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+
+class ItemCache(MutableMapping[str, MemoryItem]):
+    """
+    Thread-safe bounded LRU of memory items read or written by a SQL repository.
+
+    It stands in for the plain ``state.items`` dict of the SQL backends, so at most
+    ``max_entries`` rows stay resident; entries older than ``ttl_seconds`` are
+    dropped on access. Plain mapping access does not touch `stats`; repositories
+    count their cache reads through `lookup`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = 10_000,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries is not None and max_entries <= 0:
+            msg = "max_entries must be positive"
+            raise ValueError(msg)
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            msg = "ttl_seconds must be positive"
+            raise ValueError(msg)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = ItemCacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[MemoryItem, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, item_id: str) -> MemoryItem | None:
+        """Cached item for ``item_id`` (refreshing its LRU position), counted as a hit or miss."""
+        with self._lock:
+            item = self._get(item_id)
+            if item is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+            return item
+
+    def invalidate(self, item_id: str) -> None:
+        """Drop an entry found to be stale, e.g. changed by another process."""
+        with self._lock:
+            if self._entries.pop(item_id, None) is not None:
+                self.stats.invalidations += 1
+
+    def __getitem__(self, item_id: str) -> MemoryItem:
+        with self._lock:
+            item = self._get(item_id)
+        if item is None:
+            raise KeyError(item_id)
+        return item
+
+    def __setitem__(self, item_id: str, item: MemoryItem) -> None:
+        with self._lock:
+            self._entries[item_id] = (item, self._clock())
+            self._entries.move_to_end(item_id)
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.stats.evictions += 1
+
+    def __delitem__(self, item_id: str) -> None:
+        with self._lock:
+            del self._entries[item_id]
+
+    def __contains__(self, item_id: object) -> bool:
+        if not isinstance(item_id, str):
+            return False
+        with self._lock:
+            return self._get(item_id, touch=False) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            self._expire_all()
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire_all()
+            return len(self._entries)
+
+    def items(self) -> ItemsView[str, MemoryItem]:
+        return self.snapshot().items()
+
+    def values(self) -> ValuesView[MemoryItem]:
+        return self.snapshot().values()
+
+    def snapshot(self) -> dict[str, MemoryItem]:
+        """Unexpired entries, least recently used first, as a plain dict."""
+        with self._lock:
+            self._expire_all()
+            return {item_id: item for item_id, (item, _) in self._entries.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, item_id: str, *, touch: bool = True) -> MemoryItem | None:
+        entry = self._entries.get(item_id)
+        if entry is None:
+            return None
+        item, stored_at = entry
+        if self._expired(stored_at):
+            del self._entries[item_id]
+            self.stats.expirations += 1
+            return None
+        if touch:
+            self._entries.move_to_end(item_id)
+        return item
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds is not None and self._clock() - stored_at > self.ttl_seconds
+
+    def _expire_all(self) -> None:
+        if self.ttl_seconds is None:
+            return
+        expired = [item_id for item_id, (_, stored_at) in self._entries.items() if self._expired(stored_at)]
+        for item_id in expired:
+            del self._entries[item_id]
+        self.stats.expirations += len(expired)
+
+
+__all__ = ["ItemCache", "ItemCacheStats"]
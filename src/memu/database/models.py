@@ -3,13 +3,20 @@ from __future__ import annotations
 import hashlib
 import uuid
 from datetime import datetime
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
 import pendulum
 from pydantic import BaseModel, ConfigDict, Field
 
+from memu.database.embedding import CompactEmbedding
+
 MemoryType = Literal["profile", "event", "knowledge", "behavior", "skill"]
 
+# Embeddings are plain float lists or compact float32 arrays (`CompactEmbedding`, which
+# ndarray and array('f') values are wrapped in, or a `LazyEmbedding` read from storage).
+# Matching left to right keeps pydantic from iterating, and so boxing, a compact one.
+Embedding = Annotated[CompactEmbedding | list[float], Field(union_mode="left_to_right")]
+
 
 def compute_content_hash(summary: str, memory_type: str) -> str:
     """
@@ -44,14 +51,14 @@ class Resource(BaseRecord):
     modality: str
     local_path: str
     caption: str | None = None
-    embedding: list[float] | None = None
+    embedding: Embedding | None = None
 
 
 class MemoryItem(BaseRecord):
     resource_id: str | None
     memory_type: str
     summary: str
-    embedding: list[float] | None = None
+    embedding: Embedding | None = None
     happened_at: datetime | None = None
     extra: dict[str, Any] = {}
     # extra may contains:
@@ -66,8 +73,10 @@ class MemoryItem(BaseRecord):
 class MemoryCategory(BaseRecord):
     name: str
     description: str
-    embedding: list[float] | None = None
+    embedding: Embedding | None = None
     summary: str | None = None
+    # embedding of `summary`, cleared whenever the summary changes without a new one
+    summary_embedding: Embedding | None = None
 
 
 class CategoryItem(BaseRecord):
@@ -107,6 +116,7 @@ def build_scoped_models(
 __all__ = [
     "BaseRecord",
     "CategoryItem",
+    "Embedding",
     "MemoryCategory",
     "MemoryItem",
     "MemoryType",
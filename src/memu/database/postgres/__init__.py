@@ -4,7 +4,7 @@ from pydantic import BaseModel
 
 from memu.app.settings import DatabaseConfig
 from memu.database.postgres.postgres import PostgresStore
-from memu.database.postgres.schema import SQLAModels, get_sqlalchemy_models
+from memu.database.postgres.schema import SQLAModels, VectorIndexOptions, get_sqlalchemy_models
 
 
 def build_postgres_database(
@@ -17,19 +17,34 @@ def build_postgres_database(
         msg = "Postgres metadata_store requires a DSN"
         raise ValueError(msg)
 
-    vector_provider = config.vector_index.provider if config.vector_index else None
-    sqla_models: SQLAModels = get_sqlalchemy_models(scope_model=user_model)
+    vector_config = config.vector_index
+    vector_provider = vector_config.provider if vector_config else None
+    vector_index = None
+    if vector_config is not None and vector_provider == "pgvector":
+        vector_index = VectorIndexOptions(
+            dimensions=vector_config.dimensions,
+            index_type=vector_config.index_type,
+            m=vector_config.m,
+            ef_construction=vector_config.ef_construction,
+            lists=vector_config.lists,
+        )
+    sqla_models: SQLAModels = get_sqlalchemy_models(scope_model=user_model, vector_index=vector_index)
 
     return PostgresStore(
         dsn=dsn,
         ddl_mode=config.metadata_store.ddl_mode,
         vector_provider=vector_provider,
+        vector_index=vector_index,
+        ef_search=vector_config.ef_search if vector_config else None,
+        probes=vector_config.probes if vector_config else None,
         scope_model=user_model,
         resource_model=sqla_models.Resource,
         memory_category_model=sqla_models.MemoryCategory,
         memory_item_model=sqla_models.MemoryItem,
         category_item_model=sqla_models.CategoryItem,
         sqla_models=sqla_models,
+        pool=config.metadata_store.pool,
+        item_cache=config.metadata_store.item_cache,
     )
 
 
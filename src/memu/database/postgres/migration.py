@@ -4,9 +4,10 @@ import logging
 from pathlib import Path
 from typing import Any, Literal
 
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import MetaData, create_engine, inspect, text
+from sqlalchemy.engine import Engine
 
-from memu.database.postgres.schema import get_metadata
+from memu.database.postgres.schema import VectorIndexOptions, get_metadata
 
 try:  # Optional dependency for Postgres backend
     from alembic import command
@@ -20,15 +21,96 @@ logger = logging.getLogger(__name__)
 DDLMode = Literal["create", "validate"]
 
 
-def make_alembic_config(*, dsn: str, scope_model: type[Any]) -> AlembicConfig:
+def make_alembic_config(
+    *, dsn: str, scope_model: type[Any], vector_index: VectorIndexOptions | None = None
+) -> AlembicConfig:
     cfg = AlembicConfig()
     cfg.set_main_option("script_location", str(Path(__file__).with_name("migrations")))
     cfg.set_main_option("sqlalchemy.url", dsn)
     cfg.attributes["scope_model"] = scope_model
+    cfg.attributes["vector_index"] = vector_index
     return cfg
 
 
-def run_migrations(*, dsn: str, scope_model: type[Any], ddl_mode: DDLMode = "create") -> None:
+def _add_missing_columns(engine: Engine, metadata: MetaData) -> None:
+    """Add nullable columns that were introduced after a table was first created."""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {col["name"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS {column.name} {column_type}"))
+                logger.info("Added column %s.%s", table.name, column.name)
+
+
+def _ensure_vector_indexes(engine: Engine, metadata: MetaData) -> None:
+    """
+    Bring pre-existing tables up to the configured vector schema.
+
+    ``create_all`` skips tables that already exist, so untyped ``vector`` columns
+    are converted to ``vector(n)`` and missing ANN indexes are created here.
+    """
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            for column in table.columns:
+                dim = getattr(column.type, "dim", None)
+                if dim is None:
+                    continue
+                current = conn.execute(
+                    text(
+                        "SELECT format_type(atttypid, atttypmod) FROM pg_attribute "
+                        "WHERE attrelid = to_regclass(:table) AND attname = :column AND NOT attisdropped"
+                    ),
+                    {"table": table.name, "column": column.name},
+                ).scalar()
+                if current == "vector":
+                    conn.execute(
+                        text(
+                            f"ALTER TABLE {table.name} ALTER COLUMN {column.name} "
+                            f"TYPE vector({dim}) USING {column.name}::vector({dim})"
+                        )
+                    )
+                    logger.info("Converted %s.%s to vector(%d)", table.name, column.name, dim)
+                elif current is not None and current != f"vector({dim})":
+                    msg = f"{table.name}.{column.name} is {current}, but the configured embedding dimension is {dim}"
+                    raise RuntimeError(msg)
+            for index in table.indexes:
+                if index.dialect_options["postgresql"].get("using") in ("hnsw", "ivfflat"):
+                    index.create(conn, checkfirst=True)
+
+
+def _migrate_content_hash(engine: Engine, metadata: MetaData) -> None:
+    """Backfill ``content_hash`` from the JSONB ``extra`` column and create its scoped index."""
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            if "content_hash" not in table.c or "extra" not in table.c:
+                continue
+            extra_hash = table.c.extra["content_hash"].astext
+            result = conn.execute(
+                table
+                .update()
+                .where(table.c.content_hash.is_(None), extra_hash.isnot(None))
+                .values(content_hash=extra_hash)
+            )
+            if result.rowcount:
+                logger.info("Backfilled content_hash for %d rows in %s", result.rowcount, table.name)
+            for index in table.indexes:
+                if "content_hash" in index.columns:
+                    index.create(conn, checkfirst=True)
+
+
+def run_migrations(
+    *,
+    dsn: str,
+    scope_model: type[Any],
+    ddl_mode: DDLMode = "create",
+    vector_index: VectorIndexOptions | None = None,
+) -> None:
     """
     Run database migrations based on the ddl_mode setting.
 
@@ -36,8 +118,9 @@ def run_migrations(*, dsn: str, scope_model: type[Any], ddl_mode: DDLMode = "cre
         dsn: Database connection string
         scope_model: User scope model for scoped tables
         ddl_mode: "create" to create missing tables, "validate" to only check schema
+        vector_index: Embedding dimension and ANN index settings for vector columns
     """
-    metadata = get_metadata(scope_model)
+    metadata = get_metadata(scope_model, vector_index)
     engine = create_engine(dsn)
 
     if ddl_mode == "create":
@@ -61,6 +144,9 @@ def run_migrations(*, dsn: str, scope_model: type[Any], ddl_mode: DDLMode = "cre
 
         # Create all tables that don't exist
         metadata.create_all(engine)
+        _add_missing_columns(engine, metadata)
+        _ensure_vector_indexes(engine, metadata)
+        _migrate_content_hash(engine, metadata)
         logger.info("Database tables created/verified")
     elif ddl_mode == "validate":
         # Validate that all expected tables exist
@@ -75,7 +161,7 @@ def run_migrations(*, dsn: str, scope_model: type[Any], ddl_mode: DDLMode = "cre
         logger.info("Database schema validated successfully")
 
     # Run any pending Alembic migrations
-    cfg = make_alembic_config(dsn=dsn, scope_model=scope_model)
+    cfg = make_alembic_config(dsn=dsn, scope_model=scope_model, vector_index=vector_index)
     command.upgrade(cfg, "head")
 
 
@@ -15,7 +15,8 @@ if config.config_file_name is not None:  # pragma: no cover - alembic bootstrap
 
 def get_target_metadata() -> MetaData | None:
     scope_model = config.attributes.get("scope_model")
-    return get_metadata(scope_model)
+    vector_index = config.attributes.get("vector_index")
+    return get_metadata(scope_model, vector_index)
 
 
 target_metadata: MetaData | None = get_target_metadata()
@@ -16,6 +16,7 @@ from pydantic import BaseModel
 from sqlalchemy import ForeignKey, MetaData, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Column, DateTime, Field, Index, SQLModel, func
+from sqlmodel.main import get_column_from_field
 
 from memu.database.models import CategoryItem, MemoryCategory, MemoryItem, MemoryType, Resource
 
@@ -58,6 +59,8 @@ class MemoryItemModel(BaseModelMixin, MemoryItem):
     embedding: list[float] | None = Field(default=None, sa_column=Column(Vector(), nullable=True))
     happened_at: datetime | None = Field(default=None, sa_column=Column(DateTime, nullable=True))
     extra: dict[str, Any] = Field(default={}, sa_column=Column(JSONB, nullable=True))
+    # Copy of extra["content_hash"] as a real column, so reinforcement lookups hit an index
+    content_hash: str | None = Field(default=None, sa_column=Column(String, nullable=True))
 
 
 class MemoryCategoryModel(BaseModelMixin, MemoryCategory):
@@ -65,6 +68,7 @@ class MemoryCategoryModel(BaseModelMixin, MemoryCategory):
     description: str = Field(sa_column=Column(Text, nullable=False))
     embedding: list[float] | None = Field(default=None, sa_column=Column(Vector(), nullable=True))
     summary: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
+    summary_embedding: list[float] | None = Field(default=None, sa_column=Column(Vector(), nullable=True))
 
 
 class CategoryItemModel(BaseModelMixin, CategoryItem):
@@ -89,6 +93,47 @@ def _normalize_table_args(table_args: Any) -> tuple[list[Any], dict[str, Any]]:
     return args, kwargs
 
 
+def _own_table_arg(arg: Any) -> Any:
+    # An Index belongs to the first Table it is attached to, so each built model gets its own
+    if isinstance(arg, Index):
+        columns = [getattr(expr, "name", expr) for expr in arg.expressions]
+        return Index(arg.name, *columns, unique=arg.unique, **dict(arg.dialect_kwargs))
+    return arg
+
+
+def _own_columns(core_model: type[SQLModel]) -> dict[str, Any]:
+    """Fresh copies of the core model's explicit ``sa_column`` fields; a Column belongs to a single Table."""
+    fields: dict[str, Any] = {}
+    for name, field in core_model.model_fields.items():
+        column = get_column_from_field(field)
+        # Only an explicit sa_column comes back as the same object; other fields get a new Column each time
+        if column is get_column_from_field(field):
+            default: dict[str, Any] = (
+                {"default_factory": field.default_factory} if field.default_factory else {"default": field.default}
+            )
+            fields[name] = Field(**default, sa_column=column._copy())
+    return fields
+
+
+def _scoped_indexes(
+    tablename: str,
+    scope_fields: list[str],
+    *,
+    unique_with_scope: list[str] | None,
+    index_with_scope: list[str] | None,
+) -> list[Index]:
+    indexes: list[Index] = []
+    if scope_fields:
+        indexes.append(Index(f"ix_{tablename}__scope", *scope_fields))
+    if unique_with_scope:
+        unique_cols = [*unique_with_scope, *scope_fields]
+        indexes.append(Index(f"ix_{tablename}__unique_scoped", *unique_cols, unique=True))
+    if index_with_scope:
+        index_cols = [*index_with_scope, *scope_fields]
+        indexes.append(Index(f"ix_{tablename}__{'_'.join(index_with_scope)}_scoped", *index_cols))
+    return indexes
+
+
 def _merge_models(
     user_model: type[BaseModel],
     core_model: type[SQLModel],
@@ -116,6 +161,8 @@ def build_table_model(
     metadata: MetaData | None = None,
     extra_table_args: tuple[Any, ...] | None = None,
     unique_with_scope: list[str] | None = None,
+    index_with_scope: list[str] | None = None,
+    embedding_dim: int | None = None,
 ) -> type[SQLModel]:
     overlap = set(user_model.model_fields) & set(core_model.model_fields)
     if overlap:
@@ -124,14 +171,12 @@ def build_table_model(
 
     scope_fields = list(user_model.model_fields.keys())
     base_table_args, table_kwargs = _normalize_table_args(getattr(core_model, "__table_args__", None))
-    table_args = list(base_table_args)
+    table_args = [_own_table_arg(arg) for arg in base_table_args]
     if extra_table_args:
         table_args.extend(extra_table_args)
-    if scope_fields:
-        table_args.append(Index(f"ix_{tablename}__scope", *scope_fields))
-    if unique_with_scope:
-        unique_cols = [*unique_with_scope, *scope_fields]
-        table_args.append(Index(f"ix_{tablename}__unique_scoped", *unique_cols, unique=True))
+    table_args.extend(
+        _scoped_indexes(tablename, scope_fields, unique_with_scope=unique_with_scope, index_with_scope=index_with_scope)
+    )
 
     base_attrs: dict[str, Any] = {"__module__": core_model.__module__, "__tablename__": tablename}
     if metadata is not None:
@@ -146,6 +191,16 @@ def build_table_model(
 
     # Use type() instead of create_model to properly preserve SQLModel table behavior
     table_attrs: dict[str, Any] = {"__module__": core_model.__module__}
+    # Building models for several scopes or vector settings must not share Column objects between tables
+    columns = _own_columns(core_model)
+    table_attrs["__annotations__"] = {name: core_model.model_fields[name].annotation for name in columns}
+    table_attrs.update(columns)
+    if embedding_dim is not None:
+        # Fixed-dimension vector(n) columns, required for pgvector ANN indexes
+        vector_fields = [name for name in ("embedding", "summary_embedding") if name in core_model.model_fields]
+        for name in vector_fields:
+            table_attrs["__annotations__"][name] = list[float] | None
+            table_attrs[name] = Field(default=None, sa_column=Column(Vector(embedding_dim), nullable=True))
     return type(
         f"{user_model.__name__}{core_model.__name__}Table",
         (base,),
@@ -164,7 +219,9 @@ def build_scoped_models(
     memory_category_model = build_table_model(
         user_model, MemoryCategoryModel, tablename="memory_categories", unique_with_scope=["name"]
     )
-    memory_item_model = build_table_model(user_model, MemoryItemModel, tablename="memory_items")
+    memory_item_model = build_table_model(
+        user_model, MemoryItemModel, tablename="memory_items", index_with_scope=["content_hash"]
+    )
     category_item_model = build_table_model(user_model, CategoryItemModel, tablename="category_items")
     return resource_model, memory_category_model, memory_item_model, category_item_model
 
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import MutableMapping
 from typing import Any
 
 from pydantic import BaseModel
 
+from memu.app.settings import ConnectionPoolConfig, ItemCacheConfig
 from memu.database.interfaces import Database
+from memu.database.item_cache import ItemCache
 from memu.database.models import CategoryItem, MemoryCategory, MemoryItem, Resource
 from memu.database.postgres.migration import DDLMode, run_migrations
 from memu.database.postgres.repositories.category_item_repo import PostgresCategoryItemRepo
 from memu.database.postgres.repositories.memory_category_repo import PostgresMemoryCategoryRepo
 from memu.database.postgres.repositories.memory_item_repo import PostgresMemoryItemRepo
 from memu.database.postgres.repositories.resource_repo import PostgresResourceRepo
-from memu.database.postgres.schema import SQLAModels, get_sqlalchemy_models, require_sqlalchemy
+from memu.database.postgres.schema import (
+    SQLAModels,
+    VectorIndexOptions,
+    get_sqlalchemy_models,
+    require_sqlalchemy,
+)
 from memu.database.postgres.session import SessionManager
 from memu.database.repositories import CategoryItemRepo, MemoryCategoryRepo, MemoryItemRepo, ResourceRepo
 from memu.database.state import DatabaseState
@@ -26,7 +34,7 @@ class PostgresStore(Database):
     memory_item_repo: MemoryItemRepo
     category_item_repo: CategoryItemRepo
     resources: dict[str, Resource]
-    items: dict[str, MemoryItem]
+    items: MutableMapping[str, MemoryItem]
     categories: dict[str, MemoryCategory]
     relations: list[CategoryItem]
 
@@ -36,6 +44,9 @@ class PostgresStore(Database):
         dsn: str,
         ddl_mode: DDLMode = "create",
         vector_provider: str | None = None,
+        vector_index: VectorIndexOptions | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
         scope_model: type[BaseModel] | None = None,
         base_model: type[BaseModel] | None = None,
         resource_model: type[Any] | None = None,
@@ -43,18 +54,26 @@ class PostgresStore(Database):
         memory_item_model: type[Any] | None = None,
         category_item_model: type[Any] | None = None,
         sqla_models: SQLAModels | None = None,
+        pool: ConnectionPoolConfig | None = None,
+        item_cache: ItemCacheConfig | None = None,
     ) -> None:
         require_sqlalchemy()
         self.dsn = dsn
         self.ddl_mode = ddl_mode
         self.vector_provider = vector_provider
         self._use_vector_type = vector_provider == "pgvector"
+        self.vector_index = vector_index
         self._scope_model: type[BaseModel] = scope_model or base_model or BaseModel
         self._scope_fields = list(getattr(self._scope_model, "model_fields", {}).keys())
-        self._state = DatabaseState()
-        self._sessions = SessionManager(dsn=self.dsn)
-        self._sqla_models: SQLAModels = sqla_models or get_sqlalchemy_models(scope_model=self._scope_model)
-        run_migrations(dsn=self.dsn, scope_model=self._scope_model, ddl_mode=self.ddl_mode)
+        item_cache = item_cache or ItemCacheConfig()
+        self._state = DatabaseState(
+            items=ItemCache(max_entries=item_cache.max_entries, ttl_seconds=item_cache.ttl_seconds)
+        )
+        self._sessions = SessionManager(dsn=self.dsn, pool=pool)
+        self._sqla_models: SQLAModels = sqla_models or get_sqlalchemy_models(
+            scope_model=self._scope_model, vector_index=vector_index
+        )
+        run_migrations(dsn=self.dsn, scope_model=self._scope_model, ddl_mode=self.ddl_mode, vector_index=vector_index)
 
         resource_model = resource_model or self._sqla_models.Resource
         memory_category_model = memory_category_model or self._sqla_models.MemoryCategory
@@ -82,6 +101,9 @@ class PostgresStore(Database):
             sessions=self._sessions,
             scope_fields=self._scope_fields,
             use_vector=self._use_vector_type,
+            ef_search=ef_search,
+            probes=probes,
+            version_column=item_cache.version_column,
         )
         self.category_item_repo = PostgresCategoryItemRepo(
             state=self._state,
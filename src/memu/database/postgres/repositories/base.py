@@ -4,13 +4,19 @@ import logging
 from collections.abc import Mapping
 from typing import Any
 
+import numpy as np
 import pendulum
 
+from memu.database.embedding import CompactEmbedding, LazyEmbedding
+from memu.database.filters import WhereFilter
+from memu.database.models import Embedding
 from memu.database.postgres.session import SessionManager
 from memu.database.state import DatabaseState
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_COLUMNS = ("embedding", "summary_embedding")
+
 
 class PostgresRepoBase:
     def __init__(
@@ -31,9 +37,14 @@ class PostgresRepoBase:
     def _scope_kwargs_from(self, obj: Any) -> dict[str, Any]:
         return {field: getattr(obj, field, None) for field in self._scope_fields}
 
-    def _normalize_embedding(self, embedding: Any) -> list[float] | None:
+    def _normalize_embedding(self, embedding: Any) -> Embedding | None:
         if embedding is None:
             return None
+        if isinstance(embedding, CompactEmbedding):
+            return embedding
+        if isinstance(embedding, np.ndarray):
+            # pgvector hands back float32 arrays: keep them instead of boxing every element
+            return LazyEmbedding(embedding)
         if hasattr(embedding, "to_list"):
             try:
                 return [float(x) for x in embedding.to_list()]
@@ -51,9 +62,22 @@ class PostgresRepoBase:
             logger.debug("Could not normalize embedding %s", embedding)
             return None
 
-    def _prepare_embedding(self, embedding: list[float] | None) -> Any:
+    @staticmethod
+    def _without_embeddings(session: Any, row: Any) -> Any:
+        """Detach a row read with deferred embedding columns and blank them without loading."""
+        session.expunge(row)
+        for name in EMBEDDING_COLUMNS:
+            if hasattr(type(row), name):
+                setattr(row, name, None)
+        return row
+
+    def _prepare_embedding(self, embedding: Embedding | None) -> Any:
         if embedding is None:
             return None
+        if isinstance(embedding, CompactEmbedding | np.ndarray):
+            # pgvector binds float32 arrays as they are; JSON columns need plain lists
+            vector = np.asarray(embedding, dtype=np.float32)
+            return vector if self._use_vector else vector.tolist()
         return embedding
 
     def _merge_and_commit(self, obj: Any) -> None:
@@ -64,50 +88,17 @@ class PostgresRepoBase:
     def _now(self) -> pendulum.DateTime:
         return pendulum.now("UTC")
 
-    def _build_filters(self, model: Any, where: Mapping[str, Any] | None) -> list[Any]:
-        if not where:
-            return []
-        filters: list[Any] = []
-        for raw_key, expected in where.items():
-            if expected is None:
-                continue
-            field, op = [*raw_key.split("__", 1), None][:2]
-            column = getattr(model, str(field), None)
-            if column is None:
-                msg = f"Unknown filter field '{field}' for model '{model.__name__}'"
-                raise ValueError(msg)
-            if op == "in":
-                if isinstance(expected, str):
-                    filters.append(column == expected)
-                else:
-                    filters.append(column.in_(expected))
-            else:
-                filters.append(column == expected)
-        return filters
+    def _select_rows(self, model: Any, *, with_embeddings: bool = True) -> Any:
+        from sqlalchemy.orm import defer
+        from sqlmodel import select
 
-    @staticmethod
-    def _matches_where(obj: Any, where: Mapping[str, Any] | None) -> bool:
-        if not where:
-            return True
-        for raw_key, expected in where.items():
-            if expected is None:
-                continue
-            field, op = [*raw_key.split("__", 1), None][:2]
-            actual = getattr(obj, str(field), None)
-            if op == "in":
-                if isinstance(expected, str):
-                    if actual != expected:
-                        return False
-                else:
-                    try:
-                        if actual not in expected:
-                            return False
-                    except TypeError:
-                        return False
-            else:
-                if actual != expected:
-                    return False
-        return True
+        stmt = select(model)
+        if not with_embeddings:
+            stmt = stmt.options(*(defer(getattr(model, name)) for name in EMBEDDING_COLUMNS if hasattr(model, name)))
+        return stmt
+
+    def _build_filters(self, model: Any, where: Mapping[str, Any] | None) -> list[Any]:
+        return WhereFilter.of(where).sql_clauses(model)
 
 
 __all__ = ["PostgresRepoBase"]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 from memu.database.models import CategoryItem
@@ -32,6 +32,20 @@ class PostgresCategoryItemRepo(PostgresRepoBase, CategoryItemRepo):
             rows = session.scalars(select(self._sqla_models.CategoryItem).where(*filters)).all()
         return [self._cache_relation(row) for row in rows]
 
+    def list_items_for_categories(
+        self, category_ids: Sequence[str], where: Mapping[str, Any] | None = None
+    ) -> list[CategoryItem]:
+        from sqlmodel import select
+
+        if not category_ids:
+            return []
+        model = self._sqla_models.CategoryItem
+        filters = self._build_filters(model, where)
+        filters.append(model.category_id.in_(set(category_ids)))
+        with self._sessions.session() as session:
+            rows = session.scalars(select(model).where(*filters)).all()
+        return [self._cache_relation(row) for row in rows]
+
     def link_item_category(self, item_id: str, cat_id: str, user_data: dict[str, Any]) -> CategoryItem:
         from sqlmodel import select
 
@@ -65,6 +79,51 @@ class PostgresCategoryItemRepo(PostgresRepoBase, CategoryItemRepo):
 
         return self._cache_relation(new_rel)
 
+    def link_many(self, pairs: Sequence[tuple[str, str]], user_data: dict[str, Any]) -> list[CategoryItem]:
+        """Link many (item_id, category_id) pairs with one lookup and one multi-row INSERT."""
+        from sqlmodel import select
+
+        if not pairs:
+            return []
+
+        model = self._sqla_models.CategoryItem
+        by_pair: dict[tuple[str, str], CategoryItem] = {(rel.item_id, rel.category_id): rel for rel in self.relations}
+        missing = {pair for pair in pairs if pair not in by_pair}
+        if missing:
+            with self._sessions.session() as session:
+                existing_rows = session.scalars(
+                    select(model).where(
+                        model.item_id.in_({item_id for item_id, _ in missing}),
+                        model.category_id.in_({cat_id for _, cat_id in missing}),
+                    )
+                ).all()
+                for row in existing_rows:
+                    pair = (row.item_id, row.category_id)
+                    if pair in missing:
+                        by_pair[pair] = self._cache_relation(row)
+
+                now = self._now()
+                new_rows: list[CategoryItem] = []
+                for pair in pairs:
+                    if pair in by_pair:
+                        continue
+                    row = self._category_item_model(
+                        item_id=pair[0],
+                        category_id=pair[1],
+                        **user_data,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                    session.add(row)
+                    by_pair[pair] = row
+                    new_rows.append(row)
+                if new_rows:
+                    session.commit()
+            for row in new_rows:
+                self._cache_relation(row)
+
+        return [by_pair[pair] for pair in pairs]
+
     def unlink_item_category(self, item_id: str, cat_id: str) -> None:
         from sqlmodel import delete
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
-from memu.database.models import MemoryCategory
+from memu.database.models import Embedding, MemoryCategory
 from memu.database.postgres.repositories.base import PostgresRepoBase
 from memu.database.postgres.session import SessionManager
 from memu.database.repositories.memory_category import MemoryCategoryRepo
@@ -24,15 +24,19 @@ class PostgresMemoryCategoryRepo(PostgresRepoBase, MemoryCategoryRepo):
         self._memory_category_model = memory_category_model
         self.categories: dict[str, MemoryCategory] = self._state.categories
 
-    def list_categories(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryCategory]:
-        from sqlmodel import select
-
-        filters = self._build_filters(self._sqla_models.MemoryCategory, where)
+    def list_categories(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryCategory]:
+        model = self._sqla_models.MemoryCategory
+        filters = self._build_filters(model, where)
         with self._sessions.session() as session:
-            rows = session.scalars(select(self._sqla_models.MemoryCategory).where(*filters)).all()
+            rows = session.scalars(self._select_rows(model, with_embeddings=with_embeddings).where(*filters)).all()
             result: dict[str, MemoryCategory] = {}
             for row in rows:
-                row.embedding = self._normalize_embedding(row.embedding)
+                if not with_embeddings:
+                    result[row.id] = self._without_embeddings(session, row)
+                    continue
+                self._normalize_category(row)
                 cat = self._cache_category(row)
                 result[cat.id] = cat
         return result
@@ -46,7 +50,7 @@ class PostgresMemoryCategoryRepo(PostgresRepoBase, MemoryCategoryRepo):
             rows = session.scalars(select(self._sqla_models.MemoryCategory).where(*filters)).all()
             deleted: dict[str, MemoryCategory] = {}
             for row in rows:
-                row.embedding = self._normalize_embedding(row.embedding)
+                self._normalize_category(row)
                 deleted[row.id] = row
 
             if not deleted:
@@ -67,7 +71,7 @@ class PostgresMemoryCategoryRepo(PostgresRepoBase, MemoryCategoryRepo):
         *,
         name: str,
         description: str,
-        embedding: list[float],
+        embedding: Embedding,
         user_data: dict[str, Any],
     ) -> MemoryCategory:
         from sqlmodel import select
@@ -114,8 +118,9 @@ class PostgresMemoryCategoryRepo(PostgresRepoBase, MemoryCategoryRepo):
         category_id: str,
         name: str | None = None,
         description: str | None = None,
-        embedding: list[float] | None = None,
+        embedding: Embedding | None = None,
         summary: str | None = None,
+        summary_embedding: Embedding | None = None,
     ) -> MemoryCategory:
         from sqlmodel import select
 
@@ -135,13 +140,17 @@ class PostgresMemoryCategoryRepo(PostgresRepoBase, MemoryCategoryRepo):
             if embedding is not None:
                 cat.embedding = self._prepare_embedding(embedding)
             if summary is not None:
+                if summary != cat.summary:
+                    cat.summary_embedding = None
                 cat.summary = summary
+            if summary_embedding is not None:
+                cat.summary_embedding = self._prepare_embedding(summary_embedding)
 
             cat.updated_at = now
             session.add(cat)
             session.commit()
             session.refresh(cat)
-            cat.embedding = self._normalize_embedding(cat.embedding)
+            self._normalize_category(cat)
 
         return self._cache_category(cat)
 
@@ -151,9 +160,13 @@ class PostgresMemoryCategoryRepo(PostgresRepoBase, MemoryCategoryRepo):
         with self._sessions.session() as session:
             rows = session.scalars(select(self._sqla_models.MemoryCategory)).all()
             for row in rows:
-                row.embedding = self._normalize_embedding(row.embedding)
+                self._normalize_category(row)
                 self._cache_category(row)
 
+    def _normalize_category(self, cat: Any) -> None:
+        cat.embedding = self._normalize_embedding(cat.embedding)
+        cat.summary_embedding = self._normalize_embedding(cat.summary_embedding)
+
     def _cache_category(self, cat: MemoryCategory) -> MemoryCategory:
         self.categories[cat.id] = cat
         return cat
@@ -1,36 +1,70 @@
 from __future__ import annotations
 
+import json
 import math
-from collections.abc import Mapping
+from collections.abc import Mapping, MutableMapping, Sequence
 from datetime import datetime
 from typing import Any
 
-from memu.database.models import MemoryItem, MemoryType, compute_content_hash
+from memu.database.inmemory.vector import cosine_topk, cosine_topk_salience
+from memu.database.item_cache import ItemCache
+from memu.database.models import Embedding, MemoryItem, MemoryType, compute_content_hash
 from memu.database.postgres.repositories.base import PostgresRepoBase
 from memu.database.postgres.session import SessionManager
 from memu.database.state import DatabaseState
 
 
 class PostgresMemoryItemRepo(PostgresRepoBase):
+    # Salience ranking re-scores an ANN candidate set of max(top_k * factor, min) nearest rows
+    SALIENCE_CANDIDATE_FACTOR = 10
+    SALIENCE_MIN_CANDIDATES = 100
+    # Upper bound pgvector accepts for hnsw.ef_search
+    MAX_EF_SEARCH = 1000
+    # ISO 8601 timestamps as written by reinforcement; anything else is unknown recency
+    _ISO_TIMESTAMP_PATTERN = (
+        r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])"
+        r"([T ]([01]\d|2[0-3]):[0-5]\d(:[0-5]\d(\.\d+)?)?)?(Z|[+-]([01]\d|2[0-3])(:?[0-5]\d)?)?$"
+    )
+
     def __init__(
         self,
         *,
         state: DatabaseState,
-        memory_item_model: type[MemoryItem],
+        memory_item_model: type[Any],
         sqla_models: Any,
         sessions: SessionManager,
         scope_fields: list[str],
         use_vector: bool,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        version_column: str | None = None,
     ) -> None:
         super().__init__(
             state=state, sqla_models=sqla_models, sessions=sessions, scope_fields=scope_fields, use_vector=use_vector
         )
         self._memory_item_model = memory_item_model
-        self.items: dict[str, MemoryItem] = self._state.items
+        self._ef_search = ef_search
+        self._probes = probes
+        if version_column is not None and (
+            version_column not in MemoryItem.model_fields or not hasattr(memory_item_model, version_column)
+        ):
+            msg = f"Unknown item cache version column '{version_column}'"
+            raise ValueError(msg)
+        # Reads are served from the cache only when a version column can verify the hit
+        self._version_column = version_column
+        items = self._state.items
+        if not isinstance(items, ItemCache):
+            items = self._state.items = ItemCache()
+        self._cache = items
+        self.items: MutableMapping[str, MemoryItem] = items
 
     def get_item(self, memory_id: str) -> MemoryItem | None:
         from sqlmodel import select
 
+        if self._version_column is not None:
+            cached = self._cache.lookup(memory_id)
+            if cached is not None and self._current({memory_id: cached}):
+                return cached
         with self._sessions.session() as session:
             row = session.scalar(
                 select(self._sqla_models.MemoryItem).where(self._sqla_models.MemoryItem.id == memory_id)
@@ -40,27 +74,49 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
                 return self._cache_item(row)
         return None
 
-    def list_items(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryItem]:
-        from sqlmodel import select
+    def get_items(self, item_ids: Sequence[str], *, with_embeddings: bool = True) -> dict[str, MemoryItem]:
+        if not item_ids:
+            return {}
+        model = self._sqla_models.MemoryItem
+        by_id: dict[str, MemoryItem] = {}
+        if self._version_column is not None:
+            for item_id in dict.fromkeys(item_ids):
+                cached = self._cache.lookup(item_id)
+                if cached is not None:
+                    by_id[item_id] = cached
+            by_id = self._current(by_id)
+        missing = {item_id for item_id in item_ids if item_id not in by_id}
+        if not missing:
+            return {item_id: by_id[item_id] for item_id in item_ids}
+        with self._sessions.session() as session:
+            stmt = self._select_rows(model, with_embeddings=with_embeddings).where(model.id.in_(missing))
+            rows = session.scalars(stmt).all()
+            for row in rows:
+                by_id[row.id] = self._load_row(session, row, with_embeddings=with_embeddings)
+        return {item_id: by_id[item_id] for item_id in item_ids if item_id in by_id}
 
-        filters = self._build_filters(self._sqla_models.MemoryItem, where)
+    def list_items(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryItem]:
+        model = self._sqla_models.MemoryItem
+        filters = self._build_filters(model, where)
         with self._sessions.session() as session:
-            rows = session.scalars(select(self._sqla_models.MemoryItem).where(*filters)).all()
+            rows = session.scalars(self._select_rows(model, with_embeddings=with_embeddings).where(*filters)).all()
             result: dict[str, MemoryItem] = {}
             for row in rows:
-                row.embedding = self._normalize_embedding(row.embedding)
-                item = self._cache_item(row)
+                item = self._load_row(session, row, with_embeddings=with_embeddings)
                 result[item.id] = item
         return result
 
     def list_items_by_ref_ids(
-        self, ref_ids: list[str], where: Mapping[str, Any] | None = None
+        self, ref_ids: list[str], where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
     ) -> dict[str, MemoryItem]:
         """List items by their ref_id in the extra column.
 
         Args:
             ref_ids: List of ref_ids to query.
             where: Additional filter conditions.
+            with_embeddings: Load the embedding column; when False, items carry ``embedding=None``.
 
         Returns:
             Dict mapping item_id -> MemoryItem for items whose extra->>'ref_id' is in ref_ids.
@@ -68,20 +124,18 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
         if not ref_ids:
             return {}
 
-        from sqlmodel import select
-
-        filters = self._build_filters(self._sqla_models.MemoryItem, where)
+        model = self._sqla_models.MemoryItem
+        filters = self._build_filters(model, where)
         # Add filter for extra->>'ref_id' IN ref_ids (only rows with ref_id key)
-        ref_id_col = self._sqla_models.MemoryItem.extra["ref_id"].astext
+        ref_id_col = model.extra["ref_id"].astext
         filters.append(ref_id_col.isnot(None))
         filters.append(ref_id_col.in_(ref_ids))
 
         with self._sessions.session() as session:
-            rows = session.scalars(select(self._sqla_models.MemoryItem).where(*filters)).all()
+            rows = session.scalars(self._select_rows(model, with_embeddings=with_embeddings).where(*filters)).all()
             result: dict[str, MemoryItem] = {}
             for row in rows:
-                row.embedding = self._normalize_embedding(row.embedding)
-                item = self._cache_item(row)
+                item = self._load_row(session, row, with_embeddings=with_embeddings)
                 result[item.id] = item
         return result
 
@@ -116,7 +170,7 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
         resource_id: str | None = None,
         memory_type: MemoryType,
         summary: str,
-        embedding: list[float],
+        embedding: Embedding,
         user_data: dict[str, Any],
         reinforce: bool = False,
     ) -> MemoryItem:
@@ -144,8 +198,7 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
             session.commit()
             session.refresh(item)
 
-        self.items[item.id] = item
-        return item
+        return self._cache_item(item)
 
     def create_item_reinforce(
         self,
@@ -153,7 +206,7 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
         resource_id: str | None = None,
         memory_type: MemoryType,
         summary: str,
-        embedding: list[float],
+        embedding: Embedding,
         user_data: dict[str, Any],
     ) -> MemoryItem:
         from sqlmodel import select
@@ -161,10 +214,10 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
         content_hash = compute_content_hash(summary, memory_type)
 
         with self._sessions.session() as session:
-            # Check for existing item with same hash in same scope (deduplication)
-            # Use extra->>'content_hash' for query performance
-            content_hash_col = self._sqla_models.MemoryItem.extra["content_hash"].astext
-            filters = [content_hash_col == content_hash]
+            self._lock_content_hashes(session, [content_hash], user_data)
+            # Check for existing item with same hash in same scope (deduplication),
+            # served by the (content_hash, *scope) index
+            filters = [self._sqla_models.MemoryItem.content_hash == content_hash]
             filters.extend(self._build_filters(self._sqla_models.MemoryItem, user_data))
 
             existing = session.scalar(select(self._sqla_models.MemoryItem).where(*filters))
@@ -201,14 +254,112 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
                     "reinforcement_count": 1,
                     "last_reinforced_at": now.isoformat(),
                 },
+                content_hash=content_hash,
             )
 
             session.add(item)
             session.commit()
             session.refresh(item)
 
-        self.items[item.id] = item
-        return item
+        return self._cache_item(item)
+
+    def create_items_bulk(
+        self,
+        *,
+        resource_id: str | None = None,
+        entries: Sequence[tuple[MemoryType, str, Embedding]],
+        user_data: dict[str, Any],
+        reinforce: bool = False,
+    ) -> list[MemoryItem]:
+        """Create many items in one transaction, flushed as a multi-row INSERT.
+
+        With ``reinforce``, hashes already present in the scope (looked up with one
+        query) or earlier in the batch reinforce that item instead of inserting a duplicate.
+        """
+        from sqlmodel import select
+
+        if not entries:
+            return []
+
+        now = self._now()
+        scope = dict(user_data)
+        hashes = [compute_content_hash(summary, memory_type) for memory_type, summary, _ in entries]
+        rows: list[Any] = []
+
+        with self._sessions.session() as session:
+            by_hash: dict[str, Any] = {}
+            if reinforce:
+                self._lock_content_hashes(session, hashes, scope)
+                filters = [self._sqla_models.MemoryItem.content_hash.in_(set(hashes))]
+                filters.extend(self._build_filters(self._sqla_models.MemoryItem, scope))
+                for existing in session.scalars(select(self._sqla_models.MemoryItem).where(*filters)).all():
+                    by_hash.setdefault(existing.content_hash, existing)
+
+            row: Any
+            for (memory_type, summary, embedding), content_hash in zip(entries, hashes, strict=True):
+                if not reinforce:
+                    row = self._memory_item_model(
+                        resource_id=resource_id,
+                        memory_type=memory_type,
+                        summary=summary,
+                        embedding=self._prepare_embedding(embedding),
+                        **scope,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                elif (row := by_hash.get(content_hash)) is not None:
+                    current_extra = row.extra or {}
+                    row.extra = {
+                        **current_extra,
+                        "reinforcement_count": current_extra.get("reinforcement_count", 1) + 1,
+                        "last_reinforced_at": now.isoformat(),
+                    }
+                    row.updated_at = now
+                else:
+                    row = self._memory_item_model(
+                        resource_id=resource_id,
+                        memory_type=memory_type,
+                        summary=summary,
+                        embedding=self._prepare_embedding(embedding),
+                        **scope,
+                        created_at=now,
+                        updated_at=now,
+                        extra={
+                            "content_hash": content_hash,
+                            "reinforcement_count": 1,
+                            "last_reinforced_at": now.isoformat(),
+                        },
+                        content_hash=content_hash,
+                    )
+                    by_hash[content_hash] = row
+                session.add(row)
+                rows.append(row)
+            session.commit()
+
+        for row in rows:
+            row.embedding = self._normalize_embedding(row.embedding)
+            self._cache_item(row)
+        return rows
+
+    def _lock_content_hashes(self, session: Any, hashes: Sequence[str], scope: Mapping[str, Any]) -> None:
+        """Serialize reinforce writes for ``hashes`` in ``scope`` until the transaction ends.
+
+        Dedup is select-then-insert, so concurrent workers could both miss the row and
+        insert duplicates. Transaction-level advisory locks make the second writer wait
+        and then see the first one's row. Keys are taken in sorted order so overlapping
+        batches cannot deadlock; a hashtext collision only serializes unrelated writes.
+        """
+        from sqlalchemy import bindparam, text
+        from sqlalchemy.dialects.postgresql import ARRAY
+        from sqlalchemy.types import Text
+
+        scope_key = json.dumps(dict(scope), sort_keys=True, default=str)
+        table = self._memory_item_model.__tablename__
+        keys = sorted({f"{table}:{content_hash}:{scope_key}" for content_hash in hashes})
+        stmt = text("SELECT pg_advisory_xact_lock(hashtext(key)) FROM unnest(:keys) AS key").bindparams(
+            bindparam("keys", type_=ARRAY(Text))
+        )
+        session.execute(stmt, {"keys": keys})
 
     def update_item(
         self,
@@ -216,7 +367,7 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
         item_id: str,
         memory_type: MemoryType | None = None,
         summary: str | None = None,
-        embedding: list[float] | None = None,
+        embedding: Embedding | None = None,
         extra: dict[str, Any] | None = None,
     ) -> MemoryItem:
         from sqlmodel import select
@@ -241,6 +392,7 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
                 current_extra = item.extra or {}
                 merged_extra = {**current_extra, **extra}
                 item.extra = merged_extra
+                item.content_hash = merged_extra.get("content_hash")
 
             item.updated_at = now
             session.add(item)
@@ -256,6 +408,7 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
         with self._sessions.session() as session:
             session.exec(delete(self._sqla_models.MemoryItem).where(self._sqla_models.MemoryItem.id == item_id))
             session.commit()
+        self.items.pop(item_id, None)
 
     def vector_search_items(
         self,
@@ -266,11 +419,13 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
         ranking: str = "similarity",
         recency_decay_days: float = 30.0,
     ) -> list[tuple[str, float]]:
-        if not self._use_vector or ranking == "salience":
-            # For salience ranking or when pgvector is not available, use local search
+        if not self._use_vector:
+            # Without pgvector, rank the filtered rows locally
             return self._vector_search_local(
                 query_vec, top_k, where=where, ranking=ranking, recency_decay_days=recency_decay_days
             )
+        if ranking == "salience":
+            return self._vector_search_salience(query_vec, top_k, where=where, recency_decay_days=recency_decay_days)
 
         from sqlmodel import select
 
@@ -284,18 +439,98 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
             .limit(top_k)
         )
         with self._sessions.session() as session:
+            self._apply_search_params(session)
             rows = session.execute(stmt).all()
         return [(rid, float(score)) for rid, score in rows]
 
     def load_existing(self) -> None:
+        """Warm the cache with the most recently updated items, up to its capacity."""
         from sqlmodel import select
 
+        model = self._sqla_models.MemoryItem
+        stmt = select(model).order_by(model.updated_at.desc())
+        if self._cache.max_entries is not None:
+            stmt = stmt.limit(self._cache.max_entries)
         with self._sessions.session() as session:
-            rows = session.scalars(select(self._sqla_models.MemoryItem)).all()
-            for row in rows:
+            rows = session.scalars(stmt).all()
+            for row in reversed(rows):
                 row.embedding = self._normalize_embedding(row.embedding)
                 self._cache_item(row)
 
+    def _vector_search_salience(
+        self,
+        query_vec: list[float],
+        top_k: int,
+        where: Mapping[str, Any] | None = None,
+        *,
+        recency_decay_days: float = 30.0,
+    ) -> list[tuple[str, float]]:
+        """
+        Salience ranking in SQL: similarity * ln(reinforcement_count + 1) * recency decay.
+
+        The nearest rows by cosine distance form the candidate set (so the ANN index
+        is used), then the candidates are re-ordered by salience computed from the
+        JSONB `extra` reinforcement fields.
+        """
+        from sqlalchemy import Float, case, cast, func
+        from sqlalchemy.dialects.postgresql import TIMESTAMP
+        from sqlmodel import select
+
+        model = self._sqla_models.MemoryItem
+        distance = model.embedding.cosine_distance(query_vec)
+        filters = [model.embedding.isnot(None)]
+        filters.extend(self._build_filters(model, where))
+        candidate_limit = max(top_k * self.SALIENCE_CANDIDATE_FACTOR, self.SALIENCE_MIN_CANDIDATES)
+        candidates = (
+            select(
+                model.id.label("id"),
+                (1 - distance).label("similarity"),
+                model.extra["reinforcement_count"].astext.label("reinforcement_count"),
+                model.extra["last_reinforced_at"].astext.label("last_reinforced_at"),
+            )
+            .where(*filters)
+            .order_by(distance)
+            .limit(candidate_limit)
+            .subquery()
+        )
+
+        reinforcement_count = func.coalesce(cast(candidates.c.reinforcement_count, Float), 1.0)
+        # Cast only well-formed values, so one bad `extra` row cannot abort the query
+        last_reinforced_at = case(
+            (
+                candidates.c.last_reinforced_at.regexp_match(self._ISO_TIMESTAMP_PATTERN),
+                cast(candidates.c.last_reinforced_at, TIMESTAMP(timezone=True)),
+            ),
+            else_=None,
+        )
+        days_ago = func.extract("epoch", func.now() - last_reinforced_at) / 86400.0
+        # ln(2) gives half-life decay; unknown or malformed recency gets the neutral 0.5
+        recency = case(
+            (last_reinforced_at.is_(None), 0.5),
+            else_=func.exp(-math.log(2) * days_ago / recency_decay_days),
+        )
+        score = (candidates.c.similarity * func.ln(reinforcement_count + 1) * recency).label("score")
+        stmt = select(candidates.c.id, score).order_by(score.desc()).limit(top_k)
+
+        with self._sessions.session() as session:
+            # An HNSW scan returns at most ef_search rows, so widen it to cover the candidate set
+            self._apply_search_params(session, min_ef_search=candidate_limit)
+            rows = session.execute(stmt).all()
+        return [(rid, float(s)) for rid, s in rows]
+
+    def _apply_search_params(self, session: Any, *, min_ef_search: int | None = None) -> None:
+        """Set the ANN query-time knobs for the current transaction only."""
+        from sqlalchemy import text
+
+        ef_search = self._ef_search
+        if min_ef_search is not None:
+            ef_search = min(max(ef_search or 0, min_ef_search), self.MAX_EF_SEARCH)
+        # SET does not accept bind parameters; values are validated ints
+        if ef_search is not None:
+            session.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+        if self._probes is not None:
+            session.execute(text(f"SET LOCAL ivfflat.probes = {int(self._probes)}"))
+
     def _vector_search_local(
         self,
         query_vec: list[float],
@@ -305,57 +540,51 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
         ranking: str = "similarity",
         recency_decay_days: float = 30.0,
     ) -> list[tuple[str, float]]:
-        scored: list[tuple[str, float]] = []
-        for item in self.items.values():
-            if item.embedding is None:
-                continue
-            if not self._matches_where(item, where):
-                continue
-
-            similarity = self._cosine(query_vec, item.embedding)
-
-            if ranking == "salience":
-                # Salience-aware scoring - read from extra dict
-                extra = item.extra or {}
-                reinforcement_count = extra.get("reinforcement_count", 1)
-                last_reinforced_at = self._parse_datetime(extra.get("last_reinforced_at"))
-                score = self._salience_score(
-                    similarity,
-                    reinforcement_count,
-                    last_reinforced_at,
-                    recency_decay_days,
+        # Load the filtered rows from the database rather than the per-process cache
+        pool = self.list_items(where)
+        if ranking == "salience":
+            corpus = [
+                (
+                    i.id,
+                    i.embedding,
+                    (i.extra or {}).get("reinforcement_count", 1),
+                    self._parse_datetime((i.extra or {}).get("last_reinforced_at")),
                 )
-            else:
-                score = similarity
-
-            scored.append((item.id, score))
+                for i in pool.values()
+            ]
+            return cosine_topk_salience(query_vec, corpus, k=top_k, recency_decay_days=recency_decay_days)
+        return cosine_topk(query_vec, [(i.id, i.embedding) for i in pool.values()], k=top_k)
 
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[:top_k]
-
-    @staticmethod
-    def _salience_score(
-        similarity: float,
-        reinforcement_count: int,
-        last_reinforced_at: datetime | None,
-        recency_decay_days: float,
-    ) -> float:
-        """Compute salience score: similarity * reinforcement * recency."""
-        reinforcement_factor = math.log(reinforcement_count + 1)
-
-        if last_reinforced_at is None:
-            recency_factor = 0.5
-        else:
-            now = datetime.now(last_reinforced_at.tzinfo) if last_reinforced_at.tzinfo else datetime.utcnow()
-            days_ago = (now - last_reinforced_at).total_seconds() / 86400
-            recency_factor = math.exp(-0.693 * days_ago / recency_decay_days)
+    def _current(self, cached: dict[str, MemoryItem]) -> dict[str, MemoryItem]:
+        """Cache hits whose version column still matches the database; stale ones are evicted."""
+        from sqlmodel import select
 
-        return similarity * reinforcement_factor * recency_factor
+        if not cached or self._version_column is None:
+            return cached
+        model = self._sqla_models.MemoryItem
+        stmt = select(model.id, getattr(model, self._version_column)).where(model.id.in_(list(cached)))
+        with self._sessions.session() as session:
+            versions: dict[str, Any] = dict(session.execute(stmt).tuples().all())
+        current: dict[str, MemoryItem] = {}
+        for item_id, item in cached.items():
+            if item_id in versions and versions[item_id] == getattr(item, self._version_column):
+                current[item_id] = item
+            else:
+                self._cache.invalidate(item_id)
+        return current
 
     def _cache_item(self, item: MemoryItem) -> MemoryItem:
         self.items[item.id] = item
         return item
 
+    def _load_row(self, session: Any, row: Any, *, with_embeddings: bool) -> MemoryItem:
+        # Projected rows lack their embedding, so they never replace a cached item
+        if not with_embeddings:
+            item: MemoryItem = self._without_embeddings(session, row)
+            return item
+        row.embedding = self._normalize_embedding(row.embedding)
+        return self._cache_item(row)
+
     @staticmethod
     def _parse_datetime(dt_str: str | None) -> datetime | None:
         """Parse ISO datetime string from extra dict."""
@@ -372,10 +601,5 @@ class PostgresMemoryItemRepo(PostgresRepoBase):
                 return parsed
             return None
 
-    @staticmethod
-    def _cosine(a: list[float], b: list[float]) -> float:
-        denom = (sum(x * x for x in a) ** 0.5) * (sum(y * y for y in b) ** 0.5) + 1e-9
-        return float(sum(x * y for x, y in zip(a, b, strict=True)) / denom)
-
 
 __all__ = ["PostgresMemoryItemRepo"]
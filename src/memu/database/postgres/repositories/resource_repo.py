@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
-from memu.database.models import Resource
+from memu.database.models import Embedding, Resource
 from memu.database.postgres.repositories.base import PostgresRepoBase
 from memu.database.postgres.session import SessionManager
 from memu.database.repositories.resource import ResourceRepo
@@ -24,14 +24,18 @@ class PostgresResourceRepo(PostgresRepoBase, ResourceRepo):
         self._resource_model = resource_model
         self.resources: dict[str, Resource] = self._state.resources
 
-    def list_resources(self, where: Mapping[str, Any] | None = None) -> dict[str, Resource]:
-        from sqlmodel import select
-
-        filters = self._build_filters(self._sqla_models.Resource, where)
+    def list_resources(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, Resource]:
+        model = self._sqla_models.Resource
+        filters = self._build_filters(model, where)
         with self._sessions.session() as session:
-            rows = session.scalars(select(self._sqla_models.Resource).where(*filters)).all()
+            rows = session.scalars(self._select_rows(model, with_embeddings=with_embeddings).where(*filters)).all()
             result: dict[str, Resource] = {}
             for row in rows:
+                if not with_embeddings:
+                    result[row.id] = self._without_embeddings(session, row)
+                    continue
                 row.embedding = self._normalize_embedding(row.embedding)
                 res = self._cache_resource(row)
                 result[res.id] = res
@@ -69,7 +73,7 @@ class PostgresResourceRepo(PostgresRepoBase, ResourceRepo):
         modality: str,
         local_path: str,
         caption: str | None,
-        embedding: list[float] | None,
+        embedding: Embedding | None,
         user_data: dict[str, Any],
     ) -> Resource:
         res = self._resource_model(
@@ -12,7 +12,7 @@ except ImportError as exc:
     raise ImportError(msg) from exc
 
 try:
-    from sqlalchemy import MetaData
+    from sqlalchemy import Index, MetaData
 except ImportError as exc:
     msg = "sqlalchemy is required for Postgres storage support"
     raise ImportError(msg) from exc
@@ -41,43 +41,95 @@ class SQLAModels:
     CategoryItem: type[Any]
 
 
-_MODEL_CACHE: dict[type[Any], SQLAModels] = {}
+@dataclass(frozen=True)
+class VectorIndexOptions:
+    """
+    Embedding column typing and ANN index parameters for pgvector.
+
+    Without ``dimensions`` the embedding columns stay untyped ``vector`` and no
+    ANN index is built (pgvector can only index fixed-dimension columns).
+    """
+
+    dimensions: int | None = None
+    index_type: str = "hnsw"
+    m: int = 16
+    ef_construction: int = 64
+    lists: int = 100
+
+    @property
+    def enabled(self) -> bool:
+        return self.dimensions is not None and self.index_type in ("hnsw", "ivfflat")
+
+
+_MODEL_CACHE: dict[tuple[type[Any], VectorIndexOptions | None], SQLAModels] = {}
 
 
 def require_sqlalchemy() -> None:
     return None
 
 
-def get_sqlalchemy_models(*, scope_model: type[BaseModel] | None = None) -> SQLAModels:
+def build_vector_index(tablename: str, options: VectorIndexOptions) -> Index:
+    """Cosine-distance ANN index on ``<tablename>.embedding``."""
+    if options.index_type == "hnsw":
+        params = {"m": options.m, "ef_construction": options.ef_construction}
+    else:
+        params = {"lists": options.lists}
+    return Index(
+        f"ix_{tablename}__embedding_{options.index_type}",
+        "embedding",
+        postgresql_using=options.index_type,
+        postgresql_with=params,
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+    )
+
+
+def get_sqlalchemy_models(
+    *,
+    scope_model: type[BaseModel] | None = None,
+    vector_index: VectorIndexOptions | None = None,
+) -> SQLAModels:
     """
     Build (and cache) SQLModel ORM models for Postgres storage.
     """
     require_sqlalchemy()
     scope = scope_model or BaseModel
-    cache_key = scope
+    cache_key = (scope, vector_index)
     cached = _MODEL_CACHE.get(cache_key)
     if cached:
         return cached
 
     metadata_obj = MetaData()
+    dimensions = vector_index.dimensions if vector_index else None
+
+    def vector_table_args(tablename: str) -> tuple[Any, ...] | None:
+        if vector_index is None or not vector_index.enabled:
+            return None
+        return (build_vector_index(tablename, vector_index),)
 
     resource_model = build_table_model(
         scope,
         ResourceModel,
         tablename="resources",
         metadata=metadata_obj,
+        embedding_dim=dimensions,
+        extra_table_args=vector_table_args("resources"),
     )
     memory_category_model = build_table_model(
         scope,
         MemoryCategoryModel,
         tablename="memory_categories",
         metadata=metadata_obj,
+        embedding_dim=dimensions,
+        extra_table_args=vector_table_args("memory_categories"),
     )
     memory_item_model = build_table_model(
         scope,
         MemoryItemModel,
         tablename="memory_items",
         metadata=metadata_obj,
+        index_with_scope=["content_hash"],
+        embedding_dim=dimensions,
+        extra_table_args=vector_table_args("memory_items"),
     )
     category_item_model = build_table_model(
         scope,
@@ -101,10 +153,20 @@ def get_sqlalchemy_models(*, scope_model: type[BaseModel] | None = None) -> SQLA
     return models
 
 
-def get_metadata(scope_model: type[BaseModel] | None = None) -> MetaData:
+def get_metadata(
+    scope_model: type[BaseModel] | None = None, vector_index: VectorIndexOptions | None = None
+) -> MetaData:
     from typing import cast
 
-    return cast(MetaData, get_sqlalchemy_models(scope_model=scope_model).Base.metadata)
+    return cast(MetaData, get_sqlalchemy_models(scope_model=scope_model, vector_index=vector_index).Base.metadata)
 
 
-__all__ = ["SQLAModels", "Vector", "get_metadata", "get_sqlalchemy_models", "require_sqlalchemy"]
+__all__ = [
+    "SQLAModels",
+    "Vector",
+    "VectorIndexOptions",
+    "build_vector_index",
+    "get_metadata",
+    "get_sqlalchemy_models",
+    "require_sqlalchemy",
+]
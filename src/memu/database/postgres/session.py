@@ -9,14 +9,25 @@ except ImportError as exc:  # pragma: no cover - optional dependency
     msg = "sqlmodel is required for Postgres storage support"
     raise ImportError(msg) from exc
 
+from memu.app.settings import ConnectionPoolConfig
+
 logger = logging.getLogger(__name__)
 
 
 class SessionManager:
     """Handle engine lifecycle and session creation for Postgres store."""
 
-    def __init__(self, *, dsn: str, engine_kwargs: dict[str, Any] | None = None) -> None:
-        kw = {"pool_pre_ping": True}
+    def __init__(
+        self, *, dsn: str, engine_kwargs: dict[str, Any] | None = None, pool: ConnectionPoolConfig | None = None
+    ) -> None:
+        pool = pool or ConnectionPoolConfig()
+        kw: dict[str, Any] = {
+            "pool_pre_ping": pool.pre_ping,
+            "pool_size": pool.size,
+            "max_overflow": pool.max_overflow,
+            "pool_timeout": pool.timeout,
+            "pool_recycle": pool.recycle,
+        }
         if engine_kwargs:
             kw.update(engine_kwargs)
         self._engine = create_engine(dsn, **kw)
@@ -1,6 +1,15 @@
-from memu.database.repositories.category_item import CategoryItemRepo
-from memu.database.repositories.memory_category import MemoryCategoryRepo
-from memu.database.repositories.memory_item import MemoryItemRepo
-from memu.database.repositories.resource import ResourceRepo
+from memu.database.repositories.category_item import AsyncCategoryItemRepo, CategoryItemRepo
+from memu.database.repositories.memory_category import AsyncMemoryCategoryRepo, MemoryCategoryRepo
+from memu.database.repositories.memory_item import AsyncMemoryItemRepo, MemoryItemRepo
+from memu.database.repositories.resource import AsyncResourceRepo, ResourceRepo
 
-__all__ = ["CategoryItemRepo", "MemoryCategoryRepo", "MemoryItemRepo", "ResourceRepo"]
+__all__ = [
+    "AsyncCategoryItemRepo",
+    "AsyncMemoryCategoryRepo",
+    "AsyncMemoryItemRepo",
+    "AsyncResourceRepo",
+    "CategoryItemRepo",
+    "MemoryCategoryRepo",
+    "MemoryItemRepo",
+    "ResourceRepo",
+]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any, Protocol, runtime_checkable
 
 from memu.database.models import CategoryItem
@@ -14,10 +14,35 @@ class CategoryItemRepo(Protocol):
 
     def list_relations(self, where: Mapping[str, Any] | None = None) -> list[CategoryItem]: ...
 
+    def list_items_for_categories(
+        self, category_ids: Sequence[str], where: Mapping[str, Any] | None = None
+    ) -> list[CategoryItem]: ...
+
     def link_item_category(self, item_id: str, cat_id: str, user_data: dict[str, Any]) -> CategoryItem: ...
 
+    def link_many(self, pairs: Sequence[tuple[str, str]], user_data: dict[str, Any]) -> list[CategoryItem]: ...
+
     def unlink_item_category(self, item_id: str, cat_id: str) -> None: ...
 
     def get_item_categories(self, item_id: str) -> list[CategoryItem]: ...
 
     def load_existing(self) -> None: ...
+
+
+@runtime_checkable
+class AsyncCategoryItemRepo(Protocol):
+    """Awaitable counterpart of `CategoryItemRepo` for use from async code."""
+
+    async def list_relations(self, where: Mapping[str, Any] | None = None) -> list[CategoryItem]: ...
+
+    async def list_items_for_categories(
+        self, category_ids: Sequence[str], where: Mapping[str, Any] | None = None
+    ) -> list[CategoryItem]: ...
+
+    async def link_item_category(self, item_id: str, cat_id: str, user_data: dict[str, Any]) -> CategoryItem: ...
+
+    async def link_many(self, pairs: Sequence[tuple[str, str]], user_data: dict[str, Any]) -> list[CategoryItem]: ...
+
+    async def unlink_item_category(self, item_id: str, cat_id: str) -> None: ...
+
+    async def get_item_categories(self, item_id: str) -> list[CategoryItem]: ...
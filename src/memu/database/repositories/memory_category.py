@@ -3,21 +3,28 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any, Protocol, runtime_checkable
 
-from memu.database.models import MemoryCategory
+from memu.database.models import Embedding, MemoryCategory
 
 
 @runtime_checkable
 class MemoryCategoryRepo(Protocol):
-    """Repository contract for memory categories."""
+    """
+    Repository contract for memory categories.
+
+    Reads called with ``with_embeddings=False`` may skip loading the embedding
+    columns and return records whose embeddings are ``None``.
+    """
 
     categories: dict[str, MemoryCategory]
 
-    def list_categories(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryCategory]: ...
+    def list_categories(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryCategory]: ...
 
     def clear_categories(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryCategory]: ...
 
     def get_or_create_category(
-        self, *, name: str, description: str, embedding: list[float], user_data: dict[str, Any]
+        self, *, name: str, description: str, embedding: Embedding, user_data: dict[str, Any]
     ) -> MemoryCategory: ...
 
     def update_category(
@@ -26,8 +33,35 @@ class MemoryCategoryRepo(Protocol):
         category_id: str,
         name: str | None = None,
         description: str | None = None,
-        embedding: list[float] | None = None,
+        embedding: Embedding | None = None,
         summary: str | None = None,
+        summary_embedding: Embedding | None = None,
     ) -> MemoryCategory: ...
 
     def load_existing(self) -> None: ...
+
+
+@runtime_checkable
+class AsyncMemoryCategoryRepo(Protocol):
+    """Awaitable counterpart of `MemoryCategoryRepo` for use from async code."""
+
+    async def list_categories(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryCategory]: ...
+
+    async def clear_categories(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryCategory]: ...
+
+    async def get_or_create_category(
+        self, *, name: str, description: str, embedding: Embedding, user_data: dict[str, Any]
+    ) -> MemoryCategory: ...
+
+    async def update_category(
+        self,
+        *,
+        category_id: str,
+        name: str | None = None,
+        description: str | None = None,
+        embedding: Embedding | None = None,
+        summary: str | None = None,
+        summary_embedding: Embedding | None = None,
+    ) -> MemoryCategory: ...
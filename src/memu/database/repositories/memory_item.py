@@ -1,52 +1,137 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, MutableMapping, Sequence
 from typing import Any, Protocol, runtime_checkable
 
-from memu.database.models import MemoryItem, MemoryType
+from memu.database.models import Embedding, MemoryItem, MemoryType
 
 
 @runtime_checkable
 class MemoryItemRepo(Protocol):
-    """Repository contract for memory items."""
+    """
+    Repository contract for memory items.
 
-    items: dict[str, MemoryItem]
+    Reads called with ``with_embeddings=False`` may skip loading the embedding
+    columns and return records whose embeddings are ``None``.
+    """
+
+    items: MutableMapping[str, MemoryItem]
 
     def get_item(self, item_id: str) -> MemoryItem | None: ...
 
-    def list_items(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryItem]: ...
+    def get_items(self, item_ids: Sequence[str], *, with_embeddings: bool = True) -> dict[str, MemoryItem]: ...
+
+    def list_items(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryItem]: ...
 
     def clear_items(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryItem]: ...
 
     def create_item(
         self,
         *,
-        resource_id: str,
+        resource_id: str | None = None,
         memory_type: MemoryType,
         summary: str,
-        embedding: list[float],
+        embedding: Embedding,
         user_data: dict[str, Any],
         reinforce: bool = False,
     ) -> MemoryItem: ...
 
+    def create_items_bulk(
+        self,
+        *,
+        resource_id: str,
+        entries: Sequence[tuple[MemoryType, str, Embedding]],
+        user_data: dict[str, Any],
+        reinforce: bool = False,
+    ) -> list[MemoryItem]: ...
+
     def update_item(
         self,
         *,
         item_id: str,
         memory_type: MemoryType | None = None,
         summary: str | None = None,
-        embedding: list[float] | None = None,
+        embedding: Embedding | None = None,
         extra: dict[str, Any] | None = None,
     ) -> MemoryItem: ...
 
     def delete_item(self, item_id: str) -> None: ...
 
     def list_items_by_ref_ids(
-        self, ref_ids: list[str], where: Mapping[str, Any] | None = None
+        self, ref_ids: list[str], where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
     ) -> dict[str, MemoryItem]: ...
 
     def vector_search_items(
-        self, query_vec: list[float], top_k: int, where: Mapping[str, Any] | None = None
+        self,
+        query_vec: list[float],
+        top_k: int,
+        where: Mapping[str, Any] | None = None,
+        *,
+        ranking: str = "similarity",
+        recency_decay_days: float = 30.0,
     ) -> list[tuple[str, float]]: ...
 
     def load_existing(self) -> None: ...
+
+
+@runtime_checkable
+class AsyncMemoryItemRepo(Protocol):
+    """Awaitable counterpart of `MemoryItemRepo` for use from async code."""
+
+    async def get_item(self, item_id: str) -> MemoryItem | None: ...
+
+    async def get_items(self, item_ids: Sequence[str], *, with_embeddings: bool = True) -> dict[str, MemoryItem]: ...
+
+    async def list_items(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryItem]: ...
+
+    async def clear_items(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryItem]: ...
+
+    async def create_item(
+        self,
+        *,
+        resource_id: str | None = None,
+        memory_type: MemoryType,
+        summary: str,
+        embedding: Embedding,
+        user_data: dict[str, Any],
+        reinforce: bool = False,
+    ) -> MemoryItem: ...
+
+    async def create_items_bulk(
+        self,
+        *,
+        resource_id: str,
+        entries: Sequence[tuple[MemoryType, str, Embedding]],
+        user_data: dict[str, Any],
+        reinforce: bool = False,
+    ) -> list[MemoryItem]: ...
+
+    async def update_item(
+        self,
+        *,
+        item_id: str,
+        memory_type: MemoryType | None = None,
+        summary: str | None = None,
+        embedding: Embedding | None = None,
+        extra: dict[str, Any] | None = None,
+    ) -> MemoryItem: ...
+
+    async def delete_item(self, item_id: str) -> None: ...
+
+    async def list_items_by_ref_ids(
+        self, ref_ids: list[str], where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryItem]: ...
+
+    async def vector_search_items(
+        self,
+        query_vec: list[float],
+        top_k: int,
+        where: Mapping[str, Any] | None = None,
+        *,
+        ranking: str = "similarity",
+        recency_decay_days: float = 30.0,
+    ) -> list[tuple[str, float]]: ...
@@ -3,16 +3,23 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any, Protocol, runtime_checkable
 
-from memu.database.models import Resource
+from memu.database.models import Embedding, Resource
 
 
 @runtime_checkable
 class ResourceRepo(Protocol):
-    """Repository contract for resource records."""
+    """
+    Repository contract for resource records.
+
+    Reads called with ``with_embeddings=False`` may skip loading the embedding
+    columns and return records whose embeddings are ``None``.
+    """
 
     resources: dict[str, Resource]
 
-    def list_resources(self, where: Mapping[str, Any] | None = None) -> dict[str, Resource]: ...
+    def list_resources(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, Resource]: ...
 
     def clear_resources(self, where: Mapping[str, Any] | None = None) -> dict[str, Resource]: ...
 
@@ -23,8 +30,30 @@ class ResourceRepo(Protocol):
         modality: str,
         local_path: str,
         caption: str | None,
-        embedding: list[float] | None,
+        embedding: Embedding | None,
         user_data: dict[str, Any],
     ) -> Resource: ...
 
     def load_existing(self) -> None: ...
+
+
+@runtime_checkable
+class AsyncResourceRepo(Protocol):
+    """Awaitable counterpart of `ResourceRepo` for use from async code."""
+
+    async def list_resources(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, Resource]: ...
+
+    async def clear_resources(self, where: Mapping[str, Any] | None = None) -> dict[str, Resource]: ...
+
+    async def create_resource(
+        self,
+        *,
+        url: str,
+        modality: str,
+        local_path: str,
+        caption: str | None,
+        embedding: Embedding | None,
+        user_data: dict[str, Any],
+    ) -> Resource: ...
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def scope_fields_of(model: type[BaseModel], core_model: type[BaseModel]) -> list[str]:
+    """Fields a scoped model adds on top of its core record model."""
+    return [name for name in model.model_fields if name not in core_model.model_fields]
+
+
+class ScopeIndex:
+    """
+    ``field -> value -> ids`` hash index over the scope fields of one record kind.
+
+    Buckets keep insertion order, and unions over several values are re-sorted by
+    insertion, so narrowing a query through the index yields records in the same
+    order as scanning the backing dict. A field holding an unhashable value is
+    dropped from the index and served by scanning instead.
+    """
+
+    def __init__(self) -> None:
+        self.fields: tuple[str, ...] = ()
+        self._buckets: dict[str, dict[Any, dict[str, None]]] = {}
+        self._positions: dict[str, int] = {}
+        self._next_position = 0
+
+    def configure(self, fields: Iterable[str], records: Mapping[str, Any]) -> None:
+        """Index ``fields``, (re)building from ``records`` if the field set changed."""
+        fields = tuple(fields)
+        if fields == self.fields and (self._positions or not records):
+            return
+        self.fields = fields
+        self.clear()
+        for record_id, record in records.items():
+            self.add(record_id, record)
+
+    def clear(self) -> None:
+        self._buckets = {field: {} for field in self.fields}
+        self._positions.clear()
+        self._next_position = 0
+
+    def add(self, record_id: str, record: Any) -> None:
+        if record_id not in self._positions:
+            self._positions[record_id] = self._next_position
+            self._next_position += 1
+        for field in self.fields:
+            value = getattr(record, field, None)
+            try:
+                self._buckets[field].setdefault(value, {})[record_id] = None
+            except TypeError:
+                self._drop_field(field)
+
+    def remove(self, record_id: str, record: Any) -> None:
+        if self._positions.pop(record_id, None) is None:
+            return
+        for field in self.fields:
+            bucket = self._buckets[field]
+            value = getattr(record, field, None)
+            ids = bucket.get(value)
+            if ids is None:
+                continue
+            ids.pop(record_id, None)
+            if not ids:
+                del bucket[value]
+
+    def candidates(self, lookups: Iterable[tuple[str, Sequence[Any]]]) -> list[str] | None:
+        """
+        Ids that may satisfy every ``(field, accepted_values)`` lookup.
+
+        Uses the most selective indexed lookup only; callers still run the full
+        predicate on the returned ids. Returns ``None`` when no lookup is indexed.
+        """
+        best: list[str] | None = None
+        for field, values in lookups:
+            bucket = self._buckets.get(field)
+            if bucket is None:
+                continue
+            if len(values) == 1:
+                ids = list(bucket.get(values[0], ()))
+            else:
+                merged: dict[str, None] = {}
+                for value in values:
+                    merged.update(bucket.get(value, {}))
+                ids = sorted(merged, key=self._positions.__getitem__)
+            if best is None or len(ids) < len(best):
+                best = ids
+        return best
+
+    def _drop_field(self, field: str) -> None:
+        self.fields = tuple(name for name in self.fields if name != field)
+        self._buckets.pop(field, None)
+
+
+__all__ = ["ScopeIndex", "scope_fields_of"]
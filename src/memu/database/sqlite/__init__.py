@@ -30,6 +30,9 @@ def build_sqlite_database(
     return SQLiteStore(
         dsn=dsn,
         scope_model=user_model,
+        pool=config.metadata_store.pool,
+        pragmas=config.metadata_store.sqlite_pragmas,
+        item_cache=config.metadata_store.item_cache,
     )
 
 
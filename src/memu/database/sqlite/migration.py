@@ -0,0 +1,136 @@
+"""Schema upgrades for existing SQLite databases."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from sqlalchemy import MetaData, bindparam, func, inspect, select, text
+
+from memu.database.sqlite.models import decode_embedding_json
+
+logger = logging.getLogger(__name__)
+
+
+def add_missing_columns(engine: Any, metadata: MetaData) -> None:
+    """Add nullable columns that were introduced after a table was first created.
+
+    Args:
+        engine: SQLAlchemy engine bound to the SQLite database.
+        metadata: Metadata holding the MemU table definitions.
+    """
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            existing = {col["name"] for col in inspect(conn).get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'))
+                logger.info("Added column %s.%s", table.name, column.name)
+
+
+def migrate_embedding_storage(engine: Any, metadata: MetaData) -> None:
+    """Move embeddings from the legacy JSON text column to the float32 BLOB column.
+
+    Rows that only have ``embedding_json`` are converted and their JSON cleared;
+    run `add_missing_columns` first so ``embedding_blob`` exists.
+
+    Args:
+        engine: SQLAlchemy engine bound to the SQLite database.
+        metadata: Metadata holding the MemU table definitions.
+    """
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            if "embedding_blob" not in table.c or "embedding_json" not in table.c:
+                continue
+            rows = conn.execute(
+                select(table.c.id, table.c.embedding_json).where(
+                    table.c.embedding_blob.is_(None), table.c.embedding_json.isnot(None)
+                )
+            ).all()
+            updates = []
+            for row_id, raw in rows:
+                vector = decode_embedding_json(raw)
+                if vector is not None:
+                    # Bound through Float32Vector, which packs the list into a BLOB
+                    updates.append({"row_id": row_id, "vector": vector})
+            if not updates:
+                continue
+            stmt = (
+                table
+                .update()
+                .where(table.c.id == bindparam("row_id"))
+                .values(embedding_blob=bindparam("vector"), embedding_json=None)
+            )
+            conn.execute(stmt, updates)
+            logger.info("Migrated %d JSON embeddings to BLOB in %s", len(updates), table.name)
+
+
+def migrate_content_hash(engine: Any, metadata: MetaData) -> None:
+    """Backfill the ``content_hash`` column from ``extra`` and create its index.
+
+    ``create_all`` does not add indexes to tables that already exist, so the scoped
+    hash index is created here; run `add_missing_columns` first so the column exists.
+
+    Args:
+        engine: SQLAlchemy engine bound to the SQLite database.
+        metadata: Metadata holding the MemU table definitions.
+    """
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            if "content_hash" not in table.c or "extra" not in table.c:
+                continue
+            extra_hash = func.json_extract(table.c.extra, "$.content_hash")
+            result = conn.execute(
+                table
+                .update()
+                .where(table.c.content_hash.is_(None), extra_hash.isnot(None))
+                .values(content_hash=extra_hash)
+            )
+            if result.rowcount:
+                logger.info("Backfilled content_hash for %d rows in %s", result.rowcount, table.name)
+            for index in table.indexes:
+                if "content_hash" in index.columns:
+                    index.create(conn, checkfirst=True)
+
+
+def change_counter_table(tablename: str) -> str:
+    """Name of the one-row table counting the row changes of ``tablename``."""
+    return f"{tablename}_version"
+
+
+def create_change_counter(engine: Any, tablename: str) -> None:
+    """Keep a one-row counter that every insert, update and delete of ``tablename`` bumps.
+
+    The triggers run for writes from any connection or process, so readers holding
+    data derived from the table can tell it changed with a single-row lookup.
+
+    Args:
+        engine: SQLAlchemy engine bound to the SQLite database.
+        tablename: Table whose row changes are counted.
+    """
+    counter = change_counter_table(tablename)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{counter}" (id INTEGER PRIMARY KEY CHECK (id = 1), version INTEGER NOT NULL)'
+            )
+        )
+        conn.execute(text(f'INSERT OR IGNORE INTO "{counter}" (id, version) VALUES (1, 0)'))
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(
+                text(
+                    f'CREATE TRIGGER IF NOT EXISTS "{tablename}_{event.lower()}_version" AFTER {event} ON "{tablename}" '
+                    f'BEGIN UPDATE "{counter}" SET version = version + 1 WHERE id = 1; END'
+                )
+            )
+
+
+__all__ = [
+    "add_missing_columns",
+    "change_counter_table",
+    "create_change_counter",
+    "migrate_content_hash",
+    "migrate_embedding_storage",
+]
@@ -8,16 +8,57 @@ import uuid
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 import pendulum
 from pydantic import BaseModel
-from sqlalchemy import JSON, MetaData, String, Text
+from sqlalchemy import JSON, LargeBinary, MetaData, String, Text
+from sqlalchemy.types import TypeDecorator
 from sqlmodel import Column, DateTime, Field, Index, SQLModel, func
 
+from memu.database.embedding import LazyEmbedding
 from memu.database.models import CategoryItem, MemoryCategory, MemoryItem, MemoryType, Resource
 
 logger = logging.getLogger(__name__)
 
 
+def pack_embedding(value: Any) -> bytes | None:
+    """Serialize an embedding to a little-endian float32 BLOB."""
+    if value is None:
+        return None
+    return np.asarray(value, dtype="<f4").tobytes()
+
+
+def unpack_embedding(blob: bytes | None) -> np.ndarray | None:
+    """View a float32 BLOB as an array without copying (the array is read-only)."""
+    if blob is None:
+        return None
+    return np.frombuffer(blob, dtype="<f4")
+
+
+def decode_embedding_json(raw: str | None) -> list[float] | None:
+    """Parse a legacy JSON text embedding."""
+    if raw is None:
+        return None
+    try:
+        return [float(x) for x in json.loads(raw)]
+    except (json.JSONDecodeError, TypeError, ValueError) as e:
+        logger.warning("Failed to parse embedding JSON: %s", e)
+        return None
+
+
+class Float32Vector(TypeDecorator):
+    """Embedding stored as a float32 BLOB, exposed as a `LazyEmbedding` over the raw bytes."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> bytes | None:
+        return pack_embedding(value)
+
+    def process_result_value(self, value: Any, dialect: Any) -> LazyEmbedding | None:
+        return None if value is None else LazyEmbedding(value)
+
+
 class TZDateTime(DateTime):
     """DateTime type with timezone support."""
 
@@ -52,28 +93,13 @@ class SQLiteResourceModel(SQLiteBaseModelMixin, Resource):
     modality: str = Field(sa_column=Column(String, nullable=False))
     local_path: str = Field(sa_column=Column(String, nullable=False))
     caption: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
-    # Store embedding as JSON string since SQLite doesn't have native vector type
+    # Store embedding as a float32 BLOB since SQLite doesn't have native vector type
+    embedding: list[float] | None = Field(
+        default=None, sa_column=Column("embedding_blob", Float32Vector, nullable=True)
+    )
+    # Legacy JSON text embedding, migrated to embedding_blob on startup
     embedding_json: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
 
-    @property
-    def embedding(self) -> list[float] | None:
-        """Parse embedding from JSON string."""
-        if self.embedding_json is None:
-            return None
-        try:
-            return list(json.loads(self.embedding_json))
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.warning("Failed to parse resource embedding JSON: %s", e)
-            return None
-
-    @embedding.setter
-    def embedding(self, value: list[float] | None) -> None:
-        """Serialize embedding to JSON string."""
-        if value is None:
-            self.embedding_json = None
-        else:
-            self.embedding_json = json.dumps(value)
-
 
 class SQLiteMemoryItemModel(SQLiteBaseModelMixin, MemoryItem):
     """SQLite memory item model."""
@@ -81,29 +107,16 @@ class SQLiteMemoryItemModel(SQLiteBaseModelMixin, MemoryItem):
     resource_id: str | None = Field(sa_column=Column(String, nullable=True))
     memory_type: MemoryType = Field(sa_column=Column(String, nullable=False))
     summary: str = Field(sa_column=Column(Text, nullable=False))
-    # Store embedding as JSON string since SQLite doesn't have native vector type
+    # Store embedding as a float32 BLOB since SQLite doesn't have native vector type
+    embedding: list[float] | None = Field(
+        default=None, sa_column=Column("embedding_blob", Float32Vector, nullable=True)
+    )
+    # Legacy JSON text embedding, migrated to embedding_blob on startup
     embedding_json: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
     happened_at: datetime | None = Field(default=None, sa_column=Column(DateTime, nullable=True))
     extra: dict[str, Any] = Field(default={}, sa_column=Column(JSON, nullable=True))
-
-    @property
-    def embedding(self) -> list[float] | None:
-        """Parse embedding from JSON string."""
-        if self.embedding_json is None:
-            return None
-        try:
-            return list(json.loads(self.embedding_json))
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.warning("Failed to parse memory item embedding JSON: %s", e)
-            return None
-
-    @embedding.setter
-    def embedding(self, value: list[float] | None) -> None:
-        """Serialize embedding to JSON string."""
-        if value is None:
-            self.embedding_json = None
-        else:
-            self.embedding_json = json.dumps(value)
+    # Copy of extra["content_hash"] as a real column, so reinforcement lookups hit an index
+    content_hash: str | None = Field(default=None, sa_column=Column(String, nullable=True))
 
 
 class SQLiteMemoryCategoryModel(SQLiteBaseModelMixin, MemoryCategory):
@@ -111,28 +124,16 @@ class SQLiteMemoryCategoryModel(SQLiteBaseModelMixin, MemoryCategory):
 
     name: str = Field(sa_column=Column(String, nullable=False, index=True))
     description: str = Field(sa_column=Column(Text, nullable=False))
-    # Store embedding as JSON string since SQLite doesn't have native vector type
+    # Store embedding as a float32 BLOB since SQLite doesn't have native vector type
+    embedding: list[float] | None = Field(
+        default=None, sa_column=Column("embedding_blob", Float32Vector, nullable=True)
+    )
+    # Legacy JSON text embedding, migrated to embedding_blob on startup
     embedding_json: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
     summary: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
-
-    @property
-    def embedding(self) -> list[float] | None:
-        """Parse embedding from JSON string."""
-        if self.embedding_json is None:
-            return None
-        try:
-            return list(json.loads(self.embedding_json))
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.warning("Failed to parse category embedding JSON: %s", e)
-            return None
-
-    @embedding.setter
-    def embedding(self, value: list[float] | None) -> None:
-        """Serialize embedding to JSON string."""
-        if value is None:
-            self.embedding_json = None
-        else:
-            self.embedding_json = json.dumps(value)
+    summary_embedding: list[float] | None = Field(
+        default=None, sa_column=Column("summary_embedding_blob", Float32Vector, nullable=True)
+    )
 
 
 class SQLiteCategoryItemModel(SQLiteBaseModelMixin, CategoryItem):
@@ -160,6 +161,26 @@ def _normalize_table_args(table_args: Any) -> tuple[list[Any], dict[str, Any]]:
     return args, kwargs
 
 
+def _scoped_indexes(
+    tablename: str,
+    scope_fields: list[str],
+    *,
+    unique_with_scope: list[str] | None,
+    index_with_scope: list[str] | None,
+) -> list[Index]:
+    """Scope index plus optional unique and lookup indexes led by core columns."""
+    indexes: list[Index] = []
+    if scope_fields:
+        indexes.append(Index(f"ix_{tablename}__scope", *scope_fields))
+    if unique_with_scope:
+        unique_cols = [*unique_with_scope, *scope_fields]
+        indexes.append(Index(f"ix_{tablename}__unique_scoped", *unique_cols, unique=True))
+    if index_with_scope:
+        index_cols = [*index_with_scope, *scope_fields]
+        indexes.append(Index(f"ix_{tablename}__{'_'.join(index_with_scope)}_scoped", *index_cols))
+    return indexes
+
+
 def _merge_models(
     user_model: type[BaseModel],
     core_model: type[SQLModel],
@@ -188,6 +209,7 @@ def build_sqlite_table_model(
     metadata: MetaData | None = None,
     extra_table_args: tuple[Any, ...] | None = None,
     unique_with_scope: list[str] | None = None,
+    index_with_scope: list[str] | None = None,
 ) -> type[SQLModel]:
     """Build a scoped SQLite table model."""
     overlap = set(user_model.model_fields) & set(core_model.model_fields)
@@ -200,11 +222,9 @@ def build_sqlite_table_model(
     table_args = list(base_table_args)
     if extra_table_args:
         table_args.extend(extra_table_args)
-    if scope_fields:
-        table_args.append(Index(f"ix_{tablename}__scope", *scope_fields))
-    if unique_with_scope:
-        unique_cols = [*unique_with_scope, *scope_fields]
-        table_args.append(Index(f"ix_{tablename}__unique_scoped", *unique_cols, unique=True))
+    table_args.extend(
+        _scoped_indexes(tablename, scope_fields, unique_with_scope=unique_with_scope, index_with_scope=index_with_scope)
+    )
 
     base_attrs: dict[str, Any] = {"__module__": core_model.__module__, "__tablename__": tablename}
     if metadata is not None:
@@ -228,10 +248,14 @@ def build_sqlite_table_model(
 
 
 __all__ = [
+    "Float32Vector",
     "SQLiteBaseModelMixin",
     "SQLiteCategoryItemModel",
     "SQLiteMemoryCategoryModel",
     "SQLiteMemoryItemModel",
     "SQLiteResourceModel",
     "build_sqlite_table_model",
+    "decode_embedding_json",
+    "pack_embedding",
+    "unpack_embedding",
 ]
@@ -8,12 +8,17 @@ from collections.abc import Mapping
 from typing import Any
 
 import pendulum
+from sqlalchemy.orm import defer
+from sqlmodel import select
 
+from memu.database.filters import WhereFilter
 from memu.database.sqlite.session import SQLiteSessionManager
 from memu.database.state import DatabaseState
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_COLUMNS = ("embedding", "summary_embedding")
+
 
 class SQLiteRepoBase:
     """Base class for SQLite repository implementations."""
@@ -47,7 +52,7 @@ class SQLiteRepoBase:
         """Normalize embedding from various formats to list[float]."""
         if embedding is None:
             return None
-        # Handle JSON string format (SQLite stores embeddings as JSON)
+        # Handle legacy JSON string format
         if isinstance(embedding, str):
             try:
                 return [float(x) for x in json.loads(embedding)]
@@ -61,12 +66,6 @@ class SQLiteRepoBase:
             logger.debug("Could not normalize embedding %s", embedding)
             return None
 
-    def _prepare_embedding(self, embedding: list[float] | None) -> str | None:
-        """Serialize embedding to JSON string for SQLite storage."""
-        if embedding is None:
-            return None
-        return json.dumps(embedding)
-
     def _merge_and_commit(self, obj: Any) -> None:
         """Merge object into session and commit."""
         with self._sessions.session() as session:
@@ -77,52 +76,16 @@ class SQLiteRepoBase:
         """Get current UTC time."""
         return pendulum.now("UTC")
 
+    def _select_rows(self, model: Any, *, with_embeddings: bool = True) -> Any:
+        """Select full rows of ``model``, leaving its embedding columns unloaded unless requested."""
+        stmt = select(model)
+        if not with_embeddings:
+            stmt = stmt.options(*(defer(getattr(model, name)) for name in EMBEDDING_COLUMNS if hasattr(model, name)))
+        return stmt
+
     def _build_filters(self, model: Any, where: Mapping[str, Any] | None) -> list[Any]:
         """Build SQLAlchemy filter expressions from where clause."""
-        if not where:
-            return []
-        filters: list[Any] = []
-        for raw_key, expected in where.items():
-            if expected is None:
-                continue
-            field, op = [*raw_key.split("__", 1), None][:2]
-            column = getattr(model, str(field), None)
-            if column is None:
-                msg = f"Unknown filter field '{field}' for model '{model.__name__}'"
-                raise ValueError(msg)
-            if op == "in":
-                if isinstance(expected, str):
-                    filters.append(column == expected)
-                else:
-                    filters.append(column.in_(expected))
-            else:
-                filters.append(column == expected)
-        return filters
-
-    @staticmethod
-    def _matches_where(obj: Any, where: Mapping[str, Any] | None) -> bool:
-        """Check if object matches where clause (for in-memory filtering)."""
-        if not where:
-            return True
-        for raw_key, expected in where.items():
-            if expected is None:
-                continue
-            field, op = [*raw_key.split("__", 1), None][:2]
-            actual = getattr(obj, str(field), None)
-            if op == "in":
-                if isinstance(expected, str):
-                    if actual != expected:
-                        return False
-                else:
-                    try:
-                        if actual not in expected:
-                            return False
-                    except TypeError:
-                        return False
-            else:
-                if actual != expected:
-                    return False
-        return True
+        return WhereFilter.of(where).sql_clauses(model)
 
 
 __all__ = ["SQLiteRepoBase"]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 from sqlmodel import select
@@ -57,9 +57,30 @@ class SQLiteCategoryItemRepo(SQLiteRepoBase, CategoryItemRepo):
         Returns:
             List of CategoryItem relations.
         """
+        return self._select_relations(self._build_filters(self._category_item_model, where))
+
+    def list_items_for_categories(
+        self, category_ids: Sequence[str], where: Mapping[str, Any] | None = None
+    ) -> list[CategoryItem]:
+        """List the relations of the given categories.
+
+        Args:
+            category_ids: Category IDs whose item links are wanted.
+            where: Optional filter conditions.
+
+        Returns:
+            List of CategoryItem relations.
+        """
+        if not category_ids:
+            return []
+        filters = self._build_filters(self._category_item_model, where)
+        filters.append(self._category_item_model.category_id.in_(set(category_ids)))
+        return self._select_relations(filters)
+
+    def _select_relations(self, filters: list[Any]) -> list[CategoryItem]:
+        """Run a relation query and cache the returned rows."""
         with self._sessions.session() as session:
             stmt = select(self._category_item_model)
-            filters = self._build_filters(self._category_item_model, where)
             if filters:
                 stmt = stmt.where(*filters)
             rows = session.exec(stmt).all()
@@ -140,6 +161,57 @@ class SQLiteCategoryItemRepo(SQLiteRepoBase, CategoryItemRepo):
         self.relations.append(rel)
         return rel
 
+    def link_many(self, pairs: Sequence[tuple[str, str]], user_data: dict[str, Any]) -> list[CategoryItem]:
+        """Create links for many (item_id, category_id) pairs in a single transaction.
+
+        Existing links are looked up with one query and returned as-is.
+
+        Args:
+            pairs: ``(item_id, category_id)`` tuples.
+            user_data: User scope data.
+
+        Returns:
+            One CategoryItem relation per pair, in pair order.
+        """
+        if not pairs:
+            return []
+
+        model = self._category_item_model
+        by_pair: dict[tuple[str, str], Any] = {}
+        new_rows: list[Any] = []
+        with self._sessions.session() as session:
+            filters = [
+                model.item_id.in_({item_id for item_id, _ in pairs}),
+                model.category_id.in_({category_id for _, category_id in pairs}),
+            ]
+            filters.extend(self._build_filters(model, user_data))
+            for existing in session.exec(select(model).where(*filters)).all():
+                by_pair[(existing.item_id, existing.category_id)] = existing
+
+            now = self._now()
+            for pair in pairs:
+                if pair in by_pair:
+                    continue
+                row = model(item_id=pair[0], category_id=pair[1], created_at=now, updated_at=now, **user_data)
+                session.add(row)
+                by_pair[pair] = row
+                new_rows.append(row)
+            if new_rows:
+                session.commit()
+
+        relations: dict[str, CategoryItem] = {}
+        for row in by_pair.values():
+            relations[row.id] = CategoryItem(
+                id=row.id,
+                item_id=row.item_id,
+                category_id=row.category_id,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+                **self._scope_kwargs_from(row),
+            )
+        self.relations.extend(relations[row.id] for row in new_rows)
+        return [relations[by_pair[pair].id] for pair in pairs]
+
     def unlink_item_category(self, item_id: str, category_id: str) -> None:
         """Remove a link between an item and a category.
 
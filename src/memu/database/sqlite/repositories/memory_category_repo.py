@@ -8,7 +8,7 @@ from typing import Any
 
 from sqlmodel import delete, select
 
-from memu.database.models import MemoryCategory
+from memu.database.models import Embedding, MemoryCategory
 from memu.database.repositories.memory_category import MemoryCategoryRepo
 from memu.database.sqlite.repositories.base import SQLiteRepoBase
 from memu.database.sqlite.schema import SQLiteSQLAModels
@@ -48,17 +48,21 @@ class SQLiteMemoryCategoryRepo(SQLiteRepoBase, MemoryCategoryRepo):
         self._memory_category_model = memory_category_model
         self.categories = self._state.categories
 
-    def list_categories(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryCategory]:
+    def list_categories(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryCategory]:
         """List categories matching the where clause.
 
         Args:
             where: Optional filter conditions.
+            with_embeddings: Load the embedding columns; when False, records read from the
+                database carry ``None`` embeddings and are not cached.
 
         Returns:
             Dictionary of category ID to MemoryCategory mapping.
         """
         with self._sessions.session() as session:
-            stmt = select(self._memory_category_model)
+            stmt = self._select_rows(self._memory_category_model, with_embeddings=with_embeddings)
             filters = self._build_filters(self._memory_category_model, where)
             if filters:
                 stmt = stmt.where(*filters)
@@ -70,14 +74,16 @@ class SQLiteMemoryCategoryRepo(SQLiteRepoBase, MemoryCategoryRepo):
                 id=row.id,
                 name=row.name,
                 description=row.description,
-                embedding=self._normalize_embedding(row.embedding_json),
+                embedding=row.embedding if with_embeddings else None,
                 summary=row.summary,
+                summary_embedding=row.summary_embedding if with_embeddings else None,
                 created_at=row.created_at,
                 updated_at=row.updated_at,
                 **self._scope_kwargs_from(row),
             )
             result[row.id] = cat
-            self.categories[row.id] = cat
+            if with_embeddings:
+                self.categories[row.id] = cat
 
         return result
 
@@ -104,8 +110,9 @@ class SQLiteMemoryCategoryRepo(SQLiteRepoBase, MemoryCategoryRepo):
                     id=row.id,
                     name=row.name,
                     description=row.description,
-                    embedding=self._normalize_embedding(row.embedding_json),
+                    embedding=row.embedding,
                     summary=row.summary,
+                    summary_embedding=row.summary_embedding,
                     created_at=row.created_at,
                     updated_at=row.updated_at,
                     **self._scope_kwargs_from(row),
@@ -129,7 +136,7 @@ class SQLiteMemoryCategoryRepo(SQLiteRepoBase, MemoryCategoryRepo):
         return deleted
 
     def get_or_create_category(
-        self, *, name: str, description: str, embedding: list[float], user_data: dict[str, Any]
+        self, *, name: str, description: str, embedding: Embedding, user_data: dict[str, Any]
     ) -> MemoryCategory:
         """Get existing category by name or create a new one.
 
@@ -156,8 +163,9 @@ class SQLiteMemoryCategoryRepo(SQLiteRepoBase, MemoryCategoryRepo):
                     id=existing.id,
                     name=existing.name,
                     description=existing.description,
-                    embedding=self._normalize_embedding(existing.embedding_json),
+                    embedding=existing.embedding,
                     summary=existing.summary,
+                    summary_embedding=existing.summary_embedding,
                     created_at=existing.created_at,
                     updated_at=existing.updated_at,
                     **self._scope_kwargs_from(existing),
@@ -170,7 +178,7 @@ class SQLiteMemoryCategoryRepo(SQLiteRepoBase, MemoryCategoryRepo):
             row = self._memory_category_model(
                 name=name,
                 description=description,
-                embedding_json=self._prepare_embedding(embedding),
+                embedding=embedding,
                 summary=None,
                 created_at=now,
                 updated_at=now,
@@ -199,8 +207,9 @@ class SQLiteMemoryCategoryRepo(SQLiteRepoBase, MemoryCategoryRepo):
         category_id: str,
         name: str | None = None,
         description: str | None = None,
-        embedding: list[float] | None = None,
+        embedding: Embedding | None = None,
         summary: str | None = None,
+        summary_embedding: Embedding | None = None,
     ) -> MemoryCategory:
         """Update an existing category.
 
@@ -209,7 +218,9 @@ class SQLiteMemoryCategoryRepo(SQLiteRepoBase, MemoryCategoryRepo):
             name: New name (optional).
             description: New description (optional).
             embedding: New embedding vector (optional).
-            summary: New summary text (optional).
+            summary: New summary text (optional); a changed summary clears the stored
+                summary embedding unless a new one is given.
+            summary_embedding: Embedding of the summary text (optional).
 
         Returns:
             Updated MemoryCategory object.
@@ -230,9 +241,13 @@ class SQLiteMemoryCategoryRepo(SQLiteRepoBase, MemoryCategoryRepo):
             if description is not None:
                 row.description = description
             if embedding is not None:
-                row.embedding_json = self._prepare_embedding(embedding)
+                row.embedding = embedding
             if summary is not None:
+                if summary != row.summary:
+                    row.summary_embedding = None
                 row.summary = summary
+            if summary_embedding is not None:
+                row.summary_embedding = summary_embedding
             row.updated_at = self._now()
 
             session.add(row)
@@ -243,8 +258,9 @@ class SQLiteMemoryCategoryRepo(SQLiteRepoBase, MemoryCategoryRepo):
             id=row.id,
             name=row.name,
             description=row.description,
-            embedding=self._normalize_embedding(row.embedding_json),
+            embedding=row.embedding,
             summary=row.summary,
+            summary_embedding=row.summary_embedding,
             created_at=row.created_at,
             updated_at=row.updated_at,
             **self._scope_kwargs_from(row),
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping, MutableMapping, Sequence
 from typing import Any
 
+import numpy as np
 import pendulum
+from sqlalchemy import LargeBinary, column, table, type_coerce
 from sqlmodel import delete, select
 
-from memu.database.inmemory.vector import cosine_topk, cosine_topk_salience
-from memu.database.models import MemoryItem, MemoryType, compute_content_hash
+from memu.database.item_cache import ItemCache
+from memu.database.models import Embedding, MemoryItem, MemoryType, compute_content_hash
 from memu.database.repositories.memory_item import MemoryItemRepo
+from memu.database.sqlite.migration import change_counter_table
 from memu.database.sqlite.repositories.base import SQLiteRepoBase
 from memu.database.sqlite.schema import SQLiteSQLAModels
 from memu.database.sqlite.session import SQLiteSessionManager
@@ -31,6 +34,7 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
         sqla_models: SQLiteSQLAModels,
         sessions: SQLiteSessionManager,
         scope_fields: list[str],
+        version_column: str | None = None,
     ) -> None:
         """Initialize memory item repository.
 
@@ -40,6 +44,11 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
             sqla_models: SQLAlchemy model container.
             sessions: Session manager for database connections.
             scope_fields: List of user scope field names.
+            version_column: Optional item column compared against the database on
+                cache hits, so rows changed by other processes are reloaded.
+
+        Raises:
+            ValueError: If version_column is not a column of memory items.
         """
         super().__init__(
             state=state,
@@ -48,7 +57,24 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
             scope_fields=scope_fields,
         )
         self._memory_item_model = memory_item_model
-        self.items = self._state.items
+        if version_column is not None and (
+            version_column not in MemoryItem.model_fields or not hasattr(memory_item_model, version_column)
+        ):
+            msg = f"Unknown item cache version column '{version_column}'"
+            raise ValueError(msg)
+        self._version_column = version_column
+        items = self._state.items
+        if not isinstance(items, ItemCache):
+            # Never mirror the whole table: bound the cache even for a bare state
+            items = self._state.items = ItemCache()
+        self._cache = items
+        self.items: MutableMapping[str, MemoryItem] = items
+        # Sidecar embedding matrix, loaded on first search and patched by writes made
+        # through this repository. `_vectors_version` is the table's change counter
+        # (see `create_change_counter`) the matrix reflects; None means not loaded.
+        self._vectors = self._state.item_vectors
+        self._vectors_version: int | None = None
+        self._change_counter = table(change_counter_table(memory_item_model.__tablename__), column("version"))
 
     def get_item(self, item_id: str) -> MemoryItem | None:
         """Get a memory item by ID.
@@ -60,8 +86,9 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
             MemoryItem if found, None otherwise.
         """
         # Check cache first
-        if item_id in self.items:
-            return self.items[item_id]
+        cached = self._cache.lookup(item_id)
+        if cached is not None and self._current({item_id: cached}):
+            return cached
 
         with self._sessions.session() as session:
             stmt = select(self._memory_item_model).where(self._memory_item_model.id == item_id)
@@ -75,7 +102,7 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
             resource_id=row.resource_id,
             memory_type=row.memory_type,
             summary=row.summary,
-            embedding=self._normalize_embedding(row.embedding_json),
+            embedding=row.embedding,
             created_at=row.created_at,
             updated_at=row.updated_at,
             **self._scope_kwargs_from(row),
@@ -83,47 +110,66 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
         self.items[row.id] = item
         return item
 
-    def list_items(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryItem]:
+    def get_items(self, item_ids: Sequence[str], *, with_embeddings: bool = True) -> dict[str, MemoryItem]:
+        """Get memory items by ID, loading the ones not cached with a single query.
+
+        Args:
+            item_ids: The item IDs to look up.
+            with_embeddings: Load the embedding column; when False, items read from the
+                database carry ``embedding=None`` and are not cached.
+
+        Returns:
+            Dictionary of item ID to MemoryItem for the IDs that exist, in request order.
+        """
+        unique_ids = list(dict.fromkeys(item_ids))
+        found: dict[str, MemoryItem] = {}
+        for item_id in unique_ids:
+            cached = self._cache.lookup(item_id)
+            if cached is not None:
+                found[item_id] = cached
+        found = self._current(found)
+        missing = [item_id for item_id in unique_ids if item_id not in found]
+        if missing:
+            with self._sessions.session() as session:
+                stmt = self._select_rows(self._memory_item_model, with_embeddings=with_embeddings)
+                rows = session.exec(stmt.where(self._memory_item_model.id.in_(missing))).all()
+            for row in rows:
+                found[row.id] = self._load_row(row, with_embeddings=with_embeddings)
+        # Built from `found`: a batch larger than the cache may already be partly evicted
+        return {item_id: found[item_id] for item_id in item_ids if item_id in found}
+
+    def list_items(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, MemoryItem]:
         """List memory items matching the where clause.
 
         Args:
             where: Optional filter conditions.
+            with_embeddings: Load the embedding column; when False, items read from the
+                database carry ``embedding=None`` and are not cached.
 
         Returns:
             Dictionary of item ID to MemoryItem mapping.
         """
         with self._sessions.session() as session:
-            stmt = select(self._memory_item_model)
+            stmt = self._select_rows(self._memory_item_model, with_embeddings=with_embeddings)
             filters = self._build_filters(self._memory_item_model, where)
             if filters:
                 stmt = stmt.where(*filters)
             rows = session.exec(stmt).all()
 
-        result: dict[str, MemoryItem] = {}
-        for row in rows:
-            item = MemoryItem(
-                id=row.id,
-                resource_id=row.resource_id,
-                memory_type=row.memory_type,
-                summary=row.summary,
-                embedding=self._normalize_embedding(row.embedding_json),
-                created_at=row.created_at,
-                updated_at=row.updated_at,
-                **self._scope_kwargs_from(row),
-            )
-            result[row.id] = item
-            self.items[row.id] = item
-
-        return result
+        return {row.id: self._load_row(row, with_embeddings=with_embeddings) for row in rows}
 
     def list_items_by_ref_ids(
-        self, ref_ids: list[str], where: Mapping[str, Any] | None = None
+        self, ref_ids: list[str], where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
     ) -> dict[str, MemoryItem]:
         """List items by their ref_id in the extra column.
 
         Args:
             ref_ids: List of ref_ids to query.
             where: Additional filter conditions.
+            with_embeddings: Load the embedding column; when False, items read from the
+                database carry ``embedding=None`` and are not cached.
 
         Returns:
             Dict mapping item_id -> MemoryItem for items whose extra.ref_id is in ref_ids.
@@ -134,7 +180,7 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
         from sqlalchemy import func
 
         with self._sessions.session() as session:
-            stmt = select(self._memory_item_model)
+            stmt = self._select_rows(self._memory_item_model, with_embeddings=with_embeddings)
             filters = self._build_filters(self._memory_item_model, where)
             # Add filter for json_extract(extra, '$.ref_id') IN ref_ids (only rows with ref_id key)
             ref_id_col = func.json_extract(self._memory_item_model.extra, "$.ref_id")
@@ -144,22 +190,7 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
                 stmt = stmt.where(*filters)
             rows = session.exec(stmt).all()
 
-        result: dict[str, MemoryItem] = {}
-        for row in rows:
-            item = MemoryItem(
-                id=row.id,
-                resource_id=row.resource_id,
-                memory_type=row.memory_type,
-                summary=row.summary,
-                embedding=self._normalize_embedding(row.embedding_json),
-                created_at=row.created_at,
-                updated_at=row.updated_at,
-                **self._scope_kwargs_from(row),
-            )
-            result[row.id] = item
-            self.items[row.id] = item
-
-        return result
+        return {row.id: self._load_row(row, with_embeddings=with_embeddings) for row in rows}
 
     def clear_items(self, where: Mapping[str, Any] | None = None) -> dict[str, MemoryItem]:
         """Clear items matching the where clause.
@@ -185,7 +216,7 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
                     resource_id=row.resource_id,
                     memory_type=row.memory_type,
                     summary=row.summary,
-                    embedding=self._normalize_embedding(row.embedding_json),
+                    embedding=row.embedding,
                     created_at=row.created_at,
                     updated_at=row.updated_at,
                     **self._scope_kwargs_from(row),
@@ -199,22 +230,24 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
             del_stmt = delete(self._memory_item_model)
             if filters:
                 del_stmt = del_stmt.where(*filters)
-            session.exec(del_stmt)
+            result = session.exec(del_stmt)
+            version = self._written_version(session, result.rowcount)
             session.commit()
 
             # Clean up cache
             for item_id in deleted:
                 self.items.pop(item_id, None)
+            self._patch_vectors(version, removed=deleted)
 
         return deleted
 
     def create_item(
         self,
         *,
-        resource_id: str,
+        resource_id: str | None = None,
         memory_type: MemoryType,
         summary: str,
-        embedding: list[float],
+        embedding: Embedding,
         user_data: dict[str, Any],
         reinforce: bool = False,
     ) -> MemoryItem:
@@ -245,13 +278,14 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
             resource_id=resource_id,
             memory_type=memory_type,
             summary=summary,
-            embedding_json=self._prepare_embedding(embedding),
+            embedding=embedding,
             created_at=now,
             updated_at=now,
             **user_data,
         )
         with self._sessions.session() as session:
             session.add(row)
+            version = self._written_version(session, 1)
             session.commit()
             session.refresh(row)
 
@@ -266,15 +300,16 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
             **user_data,
         )
         self.items[row.id] = item
+        self._patch_vectors(version, written=[row])
         return item
 
     def create_item_reinforce(
         self,
         *,
-        resource_id: str,
+        resource_id: str | None,
         memory_type: MemoryType,
         summary: str,
-        embedding: list[float],
+        embedding: Embedding,
         user_data: dict[str, Any],
     ) -> MemoryItem:
         """Create or reinforce a memory item with deduplication.
@@ -292,15 +327,12 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
         Returns:
             Created or reinforced MemoryItem object.
         """
-        from sqlalchemy import func
-
         content_hash = compute_content_hash(summary, memory_type)
 
         with self._sessions.session() as session:
-            # Check for existing item with same hash in same scope (deduplication)
-            # Use json_extract(extra, '$.content_hash') for query
-            content_hash_col = func.json_extract(self._memory_item_model.extra, "$.content_hash")
-            filters = [content_hash_col == content_hash]
+            # Check for existing item with same hash in same scope (deduplication),
+            # served by the (content_hash, *scope) index
+            filters = [self._memory_item_model.content_hash == content_hash]
             filters.extend(self._build_filters(self._memory_item_model, user_data))
 
             existing = session.exec(select(self._memory_item_model).where(*filters)).first()
@@ -316,6 +348,7 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
                 }
                 existing.updated_at = self._now()
                 session.add(existing)
+                version = self._written_version(session, 1)
                 session.commit()
                 session.refresh(existing)
 
@@ -324,13 +357,14 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
                     resource_id=existing.resource_id,
                     memory_type=existing.memory_type,
                     summary=existing.summary,
-                    embedding=self._normalize_embedding(existing.embedding_json),
+                    embedding=existing.embedding,
                     created_at=existing.created_at,
                     updated_at=existing.updated_at,
                     extra=existing.extra,
                     **self._scope_kwargs_from(existing),
                 )
                 self.items[existing.id] = item
+                self._patch_vectors(version, written=[existing])
                 return item
 
             # Create new item with salience tracking in extra
@@ -346,14 +380,16 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
                 resource_id=resource_id,
                 memory_type=memory_type,
                 summary=summary,
-                embedding_json=self._prepare_embedding(embedding),
+                embedding=embedding,
                 extra=item_extra,
+                content_hash=content_hash,
                 created_at=now,
                 updated_at=now,
                 **user_data,
             )
 
             session.add(row)
+            version = self._written_version(session, 1)
             session.commit()
             session.refresh(row)
 
@@ -369,15 +405,119 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
             **self._scope_kwargs_from(row),
         )
         self.items[row.id] = item
+        self._patch_vectors(version, written=[row])
         return item
 
+    def create_items_bulk(
+        self,
+        *,
+        resource_id: str,
+        entries: Sequence[tuple[MemoryType, str, Embedding]],
+        user_data: dict[str, Any],
+        reinforce: bool = False,
+    ) -> list[MemoryItem]:
+        """Create many memory items in a single transaction.
+
+        With ``reinforce``, entries whose content hash already exists in the scope
+        (or earlier in the same batch) reinforce that item instead of inserting a
+        duplicate; existing hashes are looked up with one query.
+
+        Args:
+            resource_id: Associated resource ID.
+            entries: ``(memory_type, summary, embedding)`` tuples.
+            user_data: User scope data.
+            reinforce: If True, reinforce existing items instead of creating duplicates.
+
+        Returns:
+            One MemoryItem per entry, in entry order.
+        """
+        if not entries:
+            return []
+
+        now = self._now()
+        scope = dict(user_data)
+        base_extra: dict[str, Any] = (scope.pop("extra", None) or {}) if reinforce else {}
+        hashes = [compute_content_hash(summary, memory_type) for memory_type, summary, _ in entries]
+        rows: list[Any] = []
+
+        with self._sessions.session() as session:
+            by_hash: dict[str, Any] = {}
+            if reinforce:
+                filters = [self._memory_item_model.content_hash.in_(set(hashes))]
+                filters.extend(self._build_filters(self._memory_item_model, scope))
+                for existing in session.exec(select(self._memory_item_model).where(*filters)).all():
+                    by_hash.setdefault(existing.content_hash, existing)
+
+            for (memory_type, summary, embedding), content_hash in zip(entries, hashes, strict=True):
+                if not reinforce:
+                    row = self._memory_item_model(
+                        resource_id=resource_id,
+                        memory_type=memory_type,
+                        summary=summary,
+                        embedding=embedding,
+                        created_at=now,
+                        updated_at=now,
+                        **scope,
+                    )
+                elif (row := by_hash.get(content_hash)) is not None:
+                    current_extra = row.extra or {}
+                    row.extra = {
+                        **current_extra,
+                        "reinforcement_count": current_extra.get("reinforcement_count", 1) + 1,
+                        "last_reinforced_at": now.isoformat(),
+                    }
+                    row.updated_at = now
+                else:
+                    row = self._memory_item_model(
+                        resource_id=resource_id,
+                        memory_type=memory_type,
+                        summary=summary,
+                        embedding=embedding,
+                        extra={
+                            **base_extra,
+                            "content_hash": content_hash,
+                            "reinforcement_count": 1,
+                            "last_reinforced_at": now.isoformat(),
+                        },
+                        content_hash=content_hash,
+                        created_at=now,
+                        updated_at=now,
+                        **scope,
+                    )
+                    by_hash[content_hash] = row
+                session.add(row)
+                rows.append(row)
+            # A row reinforced several times in the batch is still written once
+            version = self._written_version(session, len({id(row) for row in rows}))
+            session.commit()
+
+        items: dict[str, MemoryItem] = {}
+        for row in rows:
+            if row.id in items:
+                continue
+            item = MemoryItem(
+                id=row.id,
+                resource_id=row.resource_id,
+                memory_type=row.memory_type,
+                summary=row.summary,
+                embedding=row.embedding,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+                extra=row.extra,
+                **self._scope_kwargs_from(row),
+            )
+            items[row.id] = item
+            self.items[row.id] = item
+        self._patch_vectors(version, written=rows)
+        return [items[row.id] for row in rows]
+
     def update_item(
         self,
         *,
         item_id: str,
         memory_type: MemoryType | None = None,
         summary: str | None = None,
-        embedding: list[float] | None = None,
+        embedding: Embedding | None = None,
         extra: dict[str, Any] | None = None,
     ) -> MemoryItem:
         """Update an existing memory item.
@@ -408,15 +548,17 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
             if summary is not None:
                 row.summary = summary
             if embedding is not None:
-                row.embedding_json = self._prepare_embedding(embedding)
+                row.embedding = embedding
             if extra is not None:
                 # Incremental update: merge new keys into existing extra dict
                 current_extra = row.extra or {}
                 merged_extra = {**current_extra, **extra}
                 row.extra = merged_extra
+                row.content_hash = merged_extra.get("content_hash")
             row.updated_at = self._now()
 
             session.add(row)
+            version = self._written_version(session, 1)
             session.commit()
             session.refresh(row)
 
@@ -425,12 +567,13 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
             resource_id=row.resource_id,
             memory_type=row.memory_type,
             summary=row.summary,
-            embedding=self._normalize_embedding(row.embedding_json),
+            embedding=row.embedding,
             created_at=row.created_at,
             updated_at=row.updated_at,
             **self._scope_kwargs_from(row),
         )
         self.items[row.id] = item
+        self._patch_vectors(version, written=[row])
         return item
 
     def delete_item(self, item_id: str) -> None:
@@ -444,10 +587,11 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
             row = session.exec(stmt).first()
             if row:
                 session.delete(row)
+                version = self._written_version(session, 1)
                 session.commit()
+                self._patch_vectors(version, removed=[item_id])
 
-        if item_id in self.items:
-            del self.items[item_id]
+        self.items.pop(item_id, None)
 
     def vector_search_items(
         self,
@@ -460,7 +604,9 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
     ) -> list[tuple[str, float]]:
         """Perform vector similarity search on memory items.
 
-        Uses brute-force cosine similarity since SQLite doesn't have native vector support.
+        Scores against an in-process float32 matrix of the stored embeddings (see
+        `VectorIndex`) instead of loading rows per query; the `where` filter is
+        resolved in SQL to candidate ids only.
 
         Args:
             query_vec: Query embedding vector.
@@ -472,26 +618,150 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
         Returns:
             List of (item_id, similarity_score) tuples.
         """
-        # Load items from database with filters
-        pool = self.list_items(where)
+        self._ensure_vectors_loaded()
+        candidates: list[str] | None = None
+        filters = self._build_filters(self._memory_item_model, where)
+        if filters:
+            with self._sessions.session() as session:
+                candidates = list(session.exec(select(self._memory_item_model.id).where(*filters)).all())
 
         if ranking == "salience":
-            # Salience-aware ranking: similarity x reinforcement x recency
-            # Read values from extra dict
-            corpus = [
-                (
-                    i.id,
-                    i.embedding,
-                    (i.extra or {}).get("reinforcement_count", 1),
-                    self._parse_datetime((i.extra or {}).get("last_reinforced_at")),
-                )
-                for i in pool.values()
-            ]
-            return cosine_topk_salience(query_vec, corpus, k=top_k, recency_decay_days=recency_decay_days)
+            # Salience-aware ranking: similarity x reinforcement x recency, using the
+            # reinforcement columns kept alongside each row of the matrix
+            return self._vectors.salience_search(
+                query_vec, top_k, candidates=candidates, recency_decay_days=recency_decay_days
+            )
 
         # Default: pure cosine similarity (backward compatible)
-        hits = cosine_topk(query_vec, [(i.id, i.embedding) for i in pool.values()], k=top_k)
-        return hits
+        return self._vectors.search(query_vec, top_k, candidates=candidates)
+
+    def _load_row(self, row: Any, *, with_embeddings: bool = True) -> MemoryItem:
+        """Build a MemoryItem from a row, caching it unless its embedding was not loaded.
+
+        Args:
+            row: The memory item row.
+            with_embeddings: Whether the row was read with its embedding column.
+
+        Returns:
+            The MemoryItem for the row.
+        """
+        item = MemoryItem(
+            id=row.id,
+            resource_id=row.resource_id,
+            memory_type=row.memory_type,
+            summary=row.summary,
+            embedding=row.embedding if with_embeddings else None,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            **self._scope_kwargs_from(row),
+        )
+        if with_embeddings:
+            self.items[row.id] = item
+        return item
+
+    def _current(self, cached: dict[str, MemoryItem]) -> dict[str, MemoryItem]:
+        """Drop cache hits whose version column no longer matches the database.
+
+        Args:
+            cached: Cached items by ID.
+
+        Returns:
+            The items still current; stale or deleted ones are evicted from the cache.
+        """
+        if not cached or self._version_column is None:
+            return cached
+        model = self._memory_item_model
+        stmt = select(model.id, getattr(model, self._version_column)).where(model.id.in_(list(cached)))
+        with self._sessions.session() as session:
+            versions = dict(session.exec(stmt).all())
+        current: dict[str, MemoryItem] = {}
+        for item_id, item in cached.items():
+            if item_id in versions and versions[item_id] == getattr(item, self._version_column):
+                current[item_id] = item
+            else:
+                self._cache.invalidate(item_id)
+        return current
+
+    def _ensure_vectors_loaded(self) -> None:
+        """Build the sidecar matrix from the raw embedding BLOBs, again after foreign writes.
+
+        Writes through this repository patch the matrix; a change counter that differs
+        from the one recorded with the matrix means another connection or process wrote
+        to the table. The counter is read before the rows, so a write landing in between
+        only causes one more reload.
+        """
+        from sqlalchemy import func
+
+        model = self._memory_item_model
+        stmt = select(
+            model.id,
+            type_coerce(model.embedding, LargeBinary),
+            func.json_extract(model.extra, "$.reinforcement_count"),
+            func.json_extract(model.extra, "$.last_reinforced_at"),
+        ).where(model.embedding.isnot(None))
+        with self._sessions.session() as session:
+            version = self._read_version(session)
+            if version == self._vectors_version:
+                return
+            rows = session.exec(stmt).all()
+
+        self._vectors.clear()
+        for item_id, blob, count, last_reinforced_at in rows:
+            self._vectors.upsert(
+                item_id,
+                np.frombuffer(blob, dtype="<f4"),
+                reinforcement_count=count if count is not None else 1,
+                last_reinforced_ts=self._epoch_seconds(last_reinforced_at),
+            )
+        self._vectors_version = version
+
+    def _read_version(self, session: Any) -> int:
+        version: int = session.exec(select(self._change_counter.c.version)).one()
+        return version
+
+    def _written_version(self, session: Any, changed_rows: int) -> int | None:
+        """Change counter a local write will commit, or None if the matrix cannot be patched with it.
+
+        Call after the write's statements are issued and before the commit: the
+        transaction then holds SQLite's write lock, so no other connection can commit
+        in between. A counter beyond the loaded one plus ``changed_rows`` means another
+        connection wrote since the matrix was loaded.
+
+        Args:
+            session: The session carrying the write.
+            changed_rows: Rows inserted, updated or deleted by the write.
+
+        Returns:
+            The counter value to record with the patched matrix, or None.
+        """
+        if self._vectors_version is None:
+            return None
+        session.flush()
+        version = self._read_version(session)
+        return version if version == self._vectors_version + changed_rows else None
+
+    def _patch_vectors(self, version: int | None, *, written: Sequence[Any] = (), removed: Iterable[str] = ()) -> None:
+        """Apply a committed local write to the sidecar matrix, or drop the matrix if it fell behind."""
+        if version is None:
+            # Not loaded, or another connection wrote too: the next search reloads
+            self._vectors_version = None
+            return
+        for row in written:
+            extra = row.extra or {}
+            self._vectors.upsert(
+                row.id,
+                row.embedding,
+                reinforcement_count=extra.get("reinforcement_count", 1),
+                last_reinforced_ts=self._epoch_seconds(extra.get("last_reinforced_at")),
+            )
+        for item_id in removed:
+            self._vectors.remove(item_id)
+        self._vectors_version = version
+
+    @classmethod
+    def _epoch_seconds(cls, dt_str: str | None) -> float | None:
+        parsed = cls._parse_datetime(dt_str)
+        return None if parsed is None else parsed.timestamp()
 
     @staticmethod
     def _parse_datetime(dt_str: str | None) -> pendulum.DateTime | None:
@@ -508,8 +778,26 @@ class SQLiteMemoryItemRepo(SQLiteRepoBase, MemoryItemRepo):
             return None
 
     def load_existing(self) -> None:
-        """Load all existing items from database into cache."""
-        self.list_items()
+        """Warm the cache with the most recently updated items, up to its capacity."""
+        model = self._memory_item_model
+        stmt = select(model).order_by(model.updated_at.desc())
+        if self._cache.max_entries is not None:
+            stmt = stmt.limit(self._cache.max_entries)
+        with self._sessions.session() as session:
+            rows = session.exec(stmt).all()
+
+        # Oldest first, so the newest rows end up most recently used
+        for row in reversed(rows):
+            self.items[row.id] = MemoryItem(
+                id=row.id,
+                resource_id=row.resource_id,
+                memory_type=row.memory_type,
+                summary=row.summary,
+                embedding=row.embedding,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+                **self._scope_kwargs_from(row),
+            )
 
 
 __all__ = ["SQLiteMemoryItemRepo"]
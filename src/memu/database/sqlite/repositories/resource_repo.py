@@ -8,7 +8,7 @@ from typing import Any
 
 from sqlmodel import delete, select
 
-from memu.database.models import Resource
+from memu.database.models import Embedding, Resource
 from memu.database.repositories.resource import ResourceRepo
 from memu.database.sqlite.repositories.base import SQLiteRepoBase
 from memu.database.sqlite.schema import SQLiteSQLAModels
@@ -48,11 +48,15 @@ class SQLiteResourceRepo(SQLiteRepoBase, ResourceRepo):
         self._resource_model = resource_model
         self.resources = self._state.resources
 
-    def list_resources(self, where: Mapping[str, Any] | None = None) -> dict[str, Resource]:
+    def list_resources(
+        self, where: Mapping[str, Any] | None = None, *, with_embeddings: bool = True
+    ) -> dict[str, Resource]:
         """List resources matching the where clause.
 
         Args:
             where: Optional filter conditions.
+            with_embeddings: Load the embedding columns; when False, records read from the
+                database carry ``None`` embeddings and are not cached.
 
         Returns:
             Dictionary of resource ID to Resource mapping.
@@ -62,7 +66,7 @@ class SQLiteResourceRepo(SQLiteRepoBase, ResourceRepo):
             return dict(self.resources)
 
         with self._sessions.session() as session:
-            stmt = select(self._resource_model)
+            stmt = self._select_rows(self._resource_model, with_embeddings=with_embeddings)
             filters = self._build_filters(self._resource_model, where)
             if filters:
                 stmt = stmt.where(*filters)
@@ -76,13 +80,14 @@ class SQLiteResourceRepo(SQLiteRepoBase, ResourceRepo):
                 modality=row.modality,
                 local_path=row.local_path,
                 caption=row.caption,
-                embedding=self._normalize_embedding(row.embedding_json),
+                embedding=row.embedding if with_embeddings else None,
                 created_at=row.created_at,
                 updated_at=row.updated_at,
                 **self._scope_kwargs_from(row),
             )
             result[row.id] = res
-            self.resources[row.id] = res
+            if with_embeddings:
+                self.resources[row.id] = res
 
         return result
 
@@ -111,7 +116,7 @@ class SQLiteResourceRepo(SQLiteRepoBase, ResourceRepo):
                     modality=row.modality,
                     local_path=row.local_path,
                     caption=row.caption,
-                    embedding=self._normalize_embedding(row.embedding_json),
+                    embedding=row.embedding,
                     created_at=row.created_at,
                     updated_at=row.updated_at,
                     **self._scope_kwargs_from(row),
@@ -141,7 +146,7 @@ class SQLiteResourceRepo(SQLiteRepoBase, ResourceRepo):
         modality: str,
         local_path: str,
         caption: str | None,
-        embedding: list[float] | None,
+        embedding: Embedding | None,
         user_data: dict[str, Any],
     ) -> Resource:
         """Create a new resource record.
@@ -163,7 +168,7 @@ class SQLiteResourceRepo(SQLiteRepoBase, ResourceRepo):
             modality=modality,
             local_path=local_path,
             caption=caption,
-            embedding_json=self._prepare_embedding(embedding),
+            embedding=embedding,
             created_at=now,
             updated_at=now,
             **user_data,
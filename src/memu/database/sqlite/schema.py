@@ -52,25 +52,26 @@ def get_sqlite_sqlalchemy_models(*, scope_model: type[BaseModel] | None = None)
     resource_model = build_sqlite_table_model(
         scope,
         SQLiteResourceModel,
-        tablename="sqlite_resources",
+        tablename="resources",
         metadata=metadata_obj,
     )
     memory_category_model = build_sqlite_table_model(
         scope,
         SQLiteMemoryCategoryModel,
-        tablename="sqlite_memory_categories",
+        tablename="memory_categories",
         metadata=metadata_obj,
     )
     memory_item_model = build_sqlite_table_model(
         scope,
         SQLiteMemoryItemModel,
-        tablename="sqlite_memory_items",
+        tablename="memory_items",
         metadata=metadata_obj,
+        index_with_scope=["content_hash"],
     )
     category_item_model = build_sqlite_table_model(
         scope,
         SQLiteCategoryItemModel,
-        tablename="sqlite_category_items",
+        tablename="category_items",
         metadata=metadata_obj,
     )
 
@@ -5,28 +5,60 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, create_engine
 
+from memu.app.settings import ConnectionPoolConfig, SQLitePragmaConfig
+
 logger = logging.getLogger(__name__)
 
 
 class SQLiteSessionManager:
     """Handle engine lifecycle and session creation for SQLite store."""
 
-    def __init__(self, *, dsn: str, engine_kwargs: dict[str, Any] | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        dsn: str,
+        engine_kwargs: dict[str, Any] | None = None,
+        pool: ConnectionPoolConfig | None = None,
+        pragmas: SQLitePragmaConfig | None = None,
+    ) -> None:
         """Initialize SQLite session manager.
 
         Args:
             dsn: SQLite connection string (e.g., "sqlite:///path/to/db.sqlite").
             engine_kwargs: Optional keyword arguments for create_engine.
+            pool: Connection pool sizing for file databases. In-memory databases
+                keep SQLAlchemy's single-connection pool.
+            pragmas: PRAGMAs run on every new connection.
         """
         kw: dict[str, Any] = {
             "connect_args": {"check_same_thread": False},  # Allow multi-threaded access
         }
+        if pool is not None and not _is_memory_database(dsn):
+            kw.update(
+                pool_size=pool.size,
+                max_overflow=pool.max_overflow,
+                pool_timeout=pool.timeout,
+                pool_recycle=pool.recycle,
+            )
         if engine_kwargs:
             kw.update(engine_kwargs)
         self._engine = create_engine(dsn, **kw)
+        statements = pragma_statements(pragmas or SQLitePragmaConfig())
+
+        def apply_pragmas(dbapi_conn: Any, _record: Any) -> None:
+            cursor = dbapi_conn.cursor()
+            try:
+                for statement in statements:
+                    cursor.execute(statement)
+            finally:
+                cursor.close()
+
+        event.listen(self._engine, "connect", apply_pragmas)
 
     def session(self) -> Session:
         """Create a new database session."""
@@ -45,4 +77,20 @@ class SQLiteSessionManager:
         return self._engine
 
 
-__all__ = ["SQLiteSessionManager"]
+def pragma_statements(pragmas: SQLitePragmaConfig) -> list[str]:
+    """PRAGMA statements for ``pragmas``; busy_timeout comes first so the WAL switch can wait on a lock."""
+    return [
+        f"PRAGMA busy_timeout = {int(pragmas.busy_timeout)}",
+        f"PRAGMA journal_mode = {pragmas.journal_mode.upper()}",
+        f"PRAGMA synchronous = {pragmas.synchronous.upper()}",
+        f"PRAGMA mmap_size = {int(pragmas.mmap_size)}",
+        f"PRAGMA cache_size = {int(pragmas.cache_size)}",
+    ]
+
+
+def _is_memory_database(dsn: str) -> bool:
+    database = make_url(dsn).database
+    return not database or database == ":memory:" or database.startswith("file::memory:")
+
+
+__all__ = ["SQLiteSessionManager", "pragma_statements"]
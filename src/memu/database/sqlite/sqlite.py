@@ -3,14 +3,23 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import MutableMapping
 from typing import Any
 
 from pydantic import BaseModel
 from sqlmodel import SQLModel
 
+from memu.app.settings import ConnectionPoolConfig, ItemCacheConfig, SQLitePragmaConfig
 from memu.database.interfaces import Database
+from memu.database.item_cache import ItemCache
 from memu.database.models import CategoryItem, MemoryCategory, MemoryItem, Resource
 from memu.database.repositories import CategoryItemRepo, MemoryCategoryRepo, MemoryItemRepo, ResourceRepo
+from memu.database.sqlite.migration import (
+    add_missing_columns,
+    create_change_counter,
+    migrate_content_hash,
+    migrate_embedding_storage,
+)
 from memu.database.sqlite.repositories.category_item_repo import SQLiteCategoryItemRepo
 from memu.database.sqlite.repositories.memory_category_repo import SQLiteMemoryCategoryRepo
 from memu.database.sqlite.repositories.memory_item_repo import SQLiteMemoryItemRepo
@@ -26,8 +35,10 @@ class SQLiteStore(Database):
     """SQLite database store implementation.
 
     This store provides a lightweight, file-based database backend for MemU.
-    It uses SQLite for metadata storage and brute-force cosine similarity
-    for vector search (native vector support is not available in SQLite).
+    It uses SQLite for metadata storage and an in-process float32 embedding
+    matrix for vector search (native vector support is not available in SQLite).
+    The matrix is loaded on the first search and only tracks writes made through
+    this store.
 
     Attributes:
         resource_repo: Repository for resource records.
@@ -35,7 +46,7 @@ class SQLiteStore(Database):
         memory_item_repo: Repository for memory items.
         category_item_repo: Repository for category-item relations.
         resources: Dict cache of resource records.
-        items: Dict cache of memory item records.
+        items: Bounded LRU cache of memory item records (see `ItemCache`).
         categories: Dict cache of memory category records.
         relations: List cache of category-item relations.
     """
@@ -45,7 +56,7 @@ class SQLiteStore(Database):
     memory_item_repo: MemoryItemRepo
     category_item_repo: CategoryItemRepo
     resources: dict[str, Resource]
-    items: dict[str, MemoryItem]
+    items: MutableMapping[str, MemoryItem]
     categories: dict[str, MemoryCategory]
     relations: list[CategoryItem]
 
@@ -59,6 +70,9 @@ class SQLiteStore(Database):
         memory_item_model: type[Any] | None = None,
         category_item_model: type[Any] | None = None,
         sqla_models: SQLiteSQLAModels | None = None,
+        pool: ConnectionPoolConfig | None = None,
+        pragmas: SQLitePragmaConfig | None = None,
+        item_cache: ItemCacheConfig | None = None,
     ) -> None:
         """Initialize SQLite database store.
 
@@ -70,12 +84,18 @@ class SQLiteStore(Database):
             memory_item_model: Optional custom memory item model.
             category_item_model: Optional custom category-item model.
             sqla_models: Pre-built SQLAlchemy models container.
+            pool: Connection pool sizing for the engine.
+            pragmas: PRAGMAs applied to every new connection.
+            item_cache: Size, TTL and version column of the memory item cache.
         """
         self.dsn = dsn
         self._scope_model: type[BaseModel] = scope_model or BaseModel
         self._scope_fields = list(getattr(self._scope_model, "model_fields", {}).keys())
-        self._state = DatabaseState()
-        self._sessions = SQLiteSessionManager(dsn=self.dsn)
+        item_cache = item_cache or ItemCacheConfig()
+        self._state = DatabaseState(
+            items=ItemCache(max_entries=item_cache.max_entries, ttl_seconds=item_cache.ttl_seconds)
+        )
+        self._sessions = SQLiteSessionManager(dsn=self.dsn, pool=pool, pragmas=pragmas)
         self._sqla_models: SQLiteSQLAModels = sqla_models or get_sqlite_sqlalchemy_models(scope_model=self._scope_model)
 
         # Create tables
@@ -86,6 +106,8 @@ class SQLiteStore(Database):
         memory_category_model = memory_category_model or self._sqla_models.MemoryCategory
         memory_item_model = memory_item_model or self._sqla_models.MemoryItem
         category_item_model = category_item_model or self._sqla_models.CategoryItem
+        # Lets the item repository notice item writes made through other connections
+        create_change_counter(self._sessions.engine, memory_item_model.__tablename__)
 
         # Initialize repositories
         self.resource_repo = SQLiteResourceRepo(
@@ -108,6 +130,7 @@ class SQLiteStore(Database):
             sqla_models=self._sqla_models,
             sessions=self._sessions,
             scope_fields=self._scope_fields,
+            version_column=item_cache.version_column,
         )
         self.category_item_repo = SQLiteCategoryItemRepo(
             state=self._state,
@@ -128,6 +151,9 @@ class SQLiteStore(Database):
         SQLModel.metadata.create_all(self._sessions.engine)
         # Also create tables from our custom metadata
         self._sqla_models.Base.metadata.create_all(self._sessions.engine)
+        add_missing_columns(self._sessions.engine, self._sqla_models.Base.metadata)
+        migrate_embedding_storage(self._sessions.engine, self._sqla_models.Base.metadata)
+        migrate_content_hash(self._sessions.engine, self._sqla_models.Base.metadata)
         logger.debug("SQLite tables created/verified")
 
     def close(self) -> None:
@@ -135,7 +161,7 @@ class SQLiteStore(Database):
         self._sessions.close()
 
     def load_existing(self) -> None:
-        """Load all existing data from database into cache."""
+        """Load existing data into the caches (memory items only up to the item cache's capacity)."""
         self.resource_repo.load_existing()
         self.memory_category_repo.load_existing()
         self.memory_item_repo.load_existing()
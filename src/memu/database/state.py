@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
 
 from memu.database.models import CategoryItem, MemoryCategory, MemoryItem, Resource
+from memu.database.scope_index import ScopeIndex
+from memu.database.vector_index import VectorIndex
 
 
 @dataclass
 class DatabaseState:
     resources: dict[str, Resource] = field(default_factory=dict)
-    items: dict[str, MemoryItem] = field(default_factory=dict)
+    # A plain dict for the in-memory backend, a bounded `ItemCache` for the SQL backends
+    items: MutableMapping[str, MemoryItem] = field(default_factory=dict)
     categories: dict[str, MemoryCategory] = field(default_factory=dict)
     relations: list[CategoryItem] = field(default_factory=list)
+    # Normalized item embeddings kept in sync with `items` by the in-memory repository
+    item_vectors: VectorIndex = field(default_factory=VectorIndex)
+    # content_hash -> ids of the items carrying it, for reinforcement lookups
+    item_hashes: dict[str, list[str]] = field(default_factory=dict)
+    # item_id -> {category_id: relation} and category_id -> {item_id: relation},
+    # kept in sync with `relations` by the in-memory repository
+    relations_by_item: dict[str, dict[str, CategoryItem]] = field(default_factory=dict)
+    relations_by_category: dict[str, dict[str, CategoryItem]] = field(default_factory=dict)
+    # Scope field -> value -> ids, maintained by the in-memory repositories
+    resource_scopes: ScopeIndex = field(default_factory=ScopeIndex)
+    item_scopes: ScopeIndex = field(default_factory=ScopeIndex)
+    category_scopes: ScopeIndex = field(default_factory=ScopeIndex)
 
 
 __all__ = ["DatabaseState"]
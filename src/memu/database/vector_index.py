@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+
+_EPS = 1e-9
+# Half-life decay (kept identical to `salience_score`)
+_LN2 = math.log(2)
+_SECONDS_PER_DAY = 86400.0
+
+
+def normalize_vector(vec: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Return a float32 unit-length copy of ``vec`` (zero vectors stay zero)."""
+    arr = np.asarray(vec, dtype=np.float32).reshape(-1)
+    norm = float(np.linalg.norm(arr))
+    if norm <= _EPS:
+        return np.zeros_like(arr)
+    return arr / norm
+
+
+def select_topk(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` highest scores, sorted descending.
+
+    Uses argpartition for O(n) selection and only sorts the selected slice.
+    """
+    n = len(scores)
+    actual_k = min(k, n)
+    if actual_k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if actual_k == n:
+        return np.argsort(scores)[::-1]
+    topk = np.argpartition(scores, -actual_k)[-actual_k:]
+    return topk[np.argsort(scores[topk])[::-1]]
+
+
+def salience_scores(
+    similarities: np.ndarray,
+    reinforcement_counts: np.ndarray,
+    last_reinforced_ts: np.ndarray,
+    recency_decay_days: float = 30.0,
+    now: float | None = None,
+) -> np.ndarray:
+    """
+    Batched form of `salience_score`: similarity * log(count + 1) * recency decay.
+
+    Args:
+        similarities: Cosine similarities, shape (n,)
+        reinforcement_counts: Reinforcement counts, shape (n,)
+        last_reinforced_ts: Epoch seconds of last reinforcement, NaN when unknown
+        recency_decay_days: Half-life for recency decay in days
+        now: Reference epoch seconds (defaults to the current time)
+
+    Returns:
+        Salience scores, shape (n,)
+    """
+    ref = time.time() if now is None else now
+    reinforcement = np.log(np.asarray(reinforcement_counts, dtype=np.float64) + 1.0)
+    ts = np.asarray(last_reinforced_ts, dtype=np.float64)
+    days_ago = (ref - ts) / _SECONDS_PER_DAY
+    with np.errstate(invalid="ignore"):
+        recency = np.where(np.isnan(ts), 0.5, np.exp(-_LN2 * days_ago / recency_decay_days))
+    return np.asarray(similarities, dtype=np.float64) * reinforcement * recency
+
+
+class VectorIndex:
+    """
+    Contiguous, pre-normalized embedding matrix with an id <-> row map.
+
+    Rows are stored as unit vectors in a single growable float32 matrix so that a
+    cosine query is one matrix-vector product. Deletes move the last row into the
+    freed slot, keeping the live rows packed in ``[0, len(index))``.
+
+    Each row also carries salience columns (reinforcement count and last
+    reinforcement time as epoch seconds, NaN when unknown) so salience ranking
+    can be computed without touching the records.
+    """
+
+    def __init__(self, *, initial_capacity: int = 256) -> None:
+        self._initial_capacity = max(1, initial_capacity)
+        self._matrix: np.ndarray | None = None
+        self._counts = np.empty(0, dtype=np.float64)
+        self._timestamps = np.empty(0, dtype=np.float64)
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    @property
+    def dim(self) -> int | None:
+        return None if self._matrix is None else int(self._matrix.shape[1])
+
+    @property
+    def ids(self) -> list[str]:
+        """Row-ordered ids of the live rows (do not mutate)."""
+        return self._ids
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """View over the live, normalized rows."""
+        if self._matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._matrix[: len(self._ids)]
+
+    def row_of(self, key: str) -> int | None:
+        return self._rows.get(key)
+
+    def upsert(
+        self,
+        key: str,
+        vector: Sequence[float] | np.ndarray | None,
+        *,
+        reinforcement_count: int = 1,
+        last_reinforced_ts: float | None = None,
+    ) -> None:
+        """Insert or replace the vector (and salience columns) for ``key``; ``None`` removes it."""
+        if vector is None:
+            self.remove(key)
+            return
+        row_vec = normalize_vector(vector)
+        if self._matrix is None:
+            self._matrix = np.empty((self._initial_capacity, row_vec.shape[0]), dtype=np.float32)
+            self._counts = np.ones(self._initial_capacity, dtype=np.float64)
+            self._timestamps = np.full(self._initial_capacity, np.nan, dtype=np.float64)
+        elif row_vec.shape[0] != self._matrix.shape[1]:
+            msg = f"Embedding dimension mismatch: index has {self._matrix.shape[1]}, got {row_vec.shape[0]}"
+            raise ValueError(msg)
+
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self._ids)
+            self._ensure_capacity(row + 1)
+            self._ids.append(key)
+            self._rows[key] = row
+        self._matrix[row] = row_vec
+        self._set_salience_row(row, reinforcement_count, last_reinforced_ts)
+
+    def set_salience(self, key: str, reinforcement_count: int, last_reinforced_ts: float | None) -> None:
+        """Update the salience columns of an indexed row without touching its vector."""
+        row = self._rows.get(key)
+        if row is not None:
+            self._set_salience_row(row, reinforcement_count, last_reinforced_ts)
+
+    def remove(self, key: str) -> None:
+        row = self._rows.pop(key, None)
+        if row is None or self._matrix is None:
+            return
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._counts[row] = self._counts[last]
+            self._timestamps[row] = self._timestamps[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+        self._ids.pop()
+
+    def clear(self) -> None:
+        self._matrix = None
+        self._counts = np.empty(0, dtype=np.float64)
+        self._timestamps = np.empty(0, dtype=np.float64)
+        self._ids.clear()
+        self._rows.clear()
+
+    def rebuild(self, entries: Iterable[tuple[str, Any]]) -> None:
+        """Replace the index contents with ``(id, vector | None)`` entries."""
+        self.clear()
+        for key, vec in entries:
+            if vec is not None:
+                self.upsert(key, vec)
+
+    def rows_for(self, candidates: Iterable[str]) -> np.ndarray:
+        """Row numbers for the candidate ids that are present in the index."""
+        rows = self._rows
+        return np.fromiter((rows[c] for c in candidates if c in rows), dtype=np.intp)
+
+    def similarities(self, query_vec: Sequence[float] | np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+        """Cosine similarity of the query against all live rows (or the given rows)."""
+        if self._matrix is None or not self._ids:
+            return np.empty(0, dtype=np.float32)
+        q = normalize_vector(query_vec)
+        if q.shape[0] != self._matrix.shape[1]:
+            msg = f"Query dimension mismatch: index has {self._matrix.shape[1]}, got {q.shape[0]}"
+            raise ValueError(msg)
+        matrix = self.matrix if rows is None else self._matrix[rows]
+        return np.asarray(matrix @ q)
+
+    def search(
+        self,
+        query_vec: Sequence[float] | np.ndarray,
+        k: int,
+        *,
+        candidates: Iterable[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Top-k cosine search, optionally restricted to ``candidates`` ids."""
+        if not self._ids:
+            return []
+        rows = None if candidates is None else self.rows_for(candidates)
+        if rows is not None and rows.size == 0:
+            return []
+        scores = self.similarities(query_vec, rows)
+        top = select_topk(scores, k)
+        if rows is None:
+            return [(self._ids[i], float(scores[i])) for i in top]
+        return [(self._ids[rows[i]], float(scores[i])) for i in top]
+
+    def salience_search(
+        self,
+        query_vec: Sequence[float] | np.ndarray,
+        k: int,
+        *,
+        candidates: Iterable[str] | None = None,
+        recency_decay_days: float = 30.0,
+        now: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """Top-k by salience: one matvec for similarity plus vectorized reinforcement/recency factors."""
+        if not self._ids:
+            return []
+        rows = None if candidates is None else self.rows_for(candidates)
+        if rows is not None and rows.size == 0:
+            return []
+        sims = self.similarities(query_vec, rows)
+        n = len(self._ids)
+        counts = self._counts[:n] if rows is None else self._counts[rows]
+        timestamps = self._timestamps[:n] if rows is None else self._timestamps[rows]
+        scores = salience_scores(sims, counts, timestamps, recency_decay_days, now)
+        top = select_topk(scores, k)
+        if rows is None:
+            return [(self._ids[i], float(scores[i])) for i in top]
+        return [(self._ids[rows[i]], float(scores[i])) for i in top]
+
+    def _set_salience_row(self, row: int, reinforcement_count: int, last_reinforced_ts: float | None) -> None:
+        self._counts[row] = reinforcement_count
+        self._timestamps[row] = np.nan if last_reinforced_ts is None else last_reinforced_ts
+
+    def _ensure_capacity(self, needed: int) -> None:
+        if self._matrix is None:
+            return
+        capacity = self._matrix.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        grown = np.empty((new_capacity, self._matrix.shape[1]), dtype=np.float32)
+        grown[: len(self._ids)] = self._matrix[: len(self._ids)]
+        self._matrix = grown
+        self._counts = np.resize(self._counts, new_capacity)
+        self._timestamps = np.resize(self._timestamps, new_capacity)
+
+
+__all__ = ["VectorIndex", "normalize_vector", "salience_scores", "select_topk"]
@@ -9,6 +9,7 @@ import httpx
 from memu.embedding.backends.base import EmbeddingBackend
 from memu.embedding.backends.doubao import DoubaoEmbeddingBackend, DoubaoMultimodalEmbeddingInput
 from memu.embedding.backends.openai import OpenAIEmbeddingBackend
+from memu.utils.http import PooledAsyncClient
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +30,10 @@ class HTTPEmbeddingClient:
         embed_model: str,
         provider: str = "openai",
         endpoint_overrides: dict[str, str] | None = None,
-        timeout: int = 60,
+        timeout: float = 60,
+        connect_timeout: float | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key or ""
@@ -44,6 +48,9 @@ class HTTPEmbeddingClient:
             or self.backend.embedding_endpoint
         )
         self.timeout = timeout
+        self._http = PooledAsyncClient(
+            base_url=self.base_url, timeout=timeout, connect_timeout=connect_timeout, limits=limits, http2=http2
+        )
 
     async def embed(self, inputs: list[str]) -> list[list[float]]:
         """
@@ -56,10 +63,10 @@ class HTTPEmbeddingClient:
             List of embedding vectors
         """
         payload = self.backend.build_embedding_payload(inputs=inputs, embed_model=self.embed_model)
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout) as client:
-            resp = await client.post(self.embedding_endpoint, json=payload, headers=self._headers())
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._http.get()
+        resp = await client.post(self.embedding_endpoint, json=payload, headers=self._headers())
+        resp.raise_for_status()
+        data = resp.json()
         logger.debug("HTTP embedding response: %s", data)
         return self.backend.parse_embedding_response(data)
 
@@ -118,14 +125,18 @@ class HTTPEmbeddingClient:
         )
 
         endpoint = self.backend.multimodal_embedding_endpoint
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout) as client:
-            resp = await client.post(endpoint, json=payload, headers=self._headers())
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._http.get()
+        resp = await client.post(endpoint, json=payload, headers=self._headers())
+        resp.raise_for_status()
+        data = resp.json()
 
         logger.debug("HTTP multimodal embedding response: %s", data)
         return self.backend.parse_multimodal_embedding_response(data)
 
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._http.aclose()
+
     def _headers(self) -> dict[str, str]:
         return {"Authorization": f"Bearer {self.api_key}"}
 
@@ -0,0 +1,121 @@
+"""Coalesce concurrent embedding requests into shared provider calls.
+
+Retrieval and memorize steps often embed one or two strings at a time from many
+concurrent coroutines. `EmbeddingBatcher` parks those requests for a short window
+(or until ``max_batch_size`` texts are queued), sends them as one ``embed`` call and
+fans the vectors back to the awaiting callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from memu.llm.retry import RetryHook
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingEmbed:
+    inputs: list[str]
+    future: asyncio.Future[Any]
+    on_retry: RetryHook | None = None
+
+
+class EmbeddingBatcher:
+    """
+    Micro-batching front for an async ``embed(list[str])`` callable.
+
+    Each caller receives the vectors for its own inputs, in order. When the
+    underlying call returns ``(vectors, raw_response)``, the raw response is handed
+    to the first caller of the batch only, so usage extracted from it is counted once.
+    Retry hooks of the callers are all notified when the shared call retries.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[..., Awaitable[Any]],
+        *,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+    ) -> None:
+        if max_batch_size <= 0:
+            msg = "max_batch_size must be positive"
+            raise ValueError(msg)
+        self._embed = embed
+        self.max_batch_size = max_batch_size
+        self.max_wait = max(max_wait_ms, 0.0) / 1000
+        self._pending: list[_PendingEmbed] = []
+        self._pending_texts = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def embed(self, inputs: list[str], *, on_retry: RetryHook | None = None) -> Any:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Futures and timers belong to a single loop; start over on a new one
+            self._pending, self._pending_texts, self._timer = [], 0, None
+            self._loop = loop
+
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append(_PendingEmbed(list(inputs), future, on_retry))
+        self._pending_texts += len(inputs)
+        if self._pending_texts >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending, self._pending_texts = self._pending, [], 0
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[_PendingEmbed]) -> None:
+        texts = [text for request in batch for text in request.inputs]
+        hooks = [request.on_retry for request in batch if request.on_retry is not None]
+
+        async def _on_retry(exc: Exception, attempt: int, delay: float) -> None:
+            for hook in hooks:
+                await hook(exc, attempt, delay)
+
+        try:
+            result = await (self._embed(texts, on_retry=_on_retry) if hooks else self._embed(texts))
+        except Exception as exc:
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(exc)
+            return
+
+        raw_response = None
+        vectors = result
+        if isinstance(result, tuple) and len(result) == 2:
+            vectors, raw_response = result
+        if len(batch) > 1:
+            logger.debug("Coalesced %d embed requests into one call of %d texts", len(batch), len(texts))
+
+        offset = 0
+        for index, request in enumerate(batch):
+            chunk = list(vectors[offset : offset + len(request.inputs)])
+            offset += len(request.inputs)
+            if request.future.done():
+                continue
+            if raw_response is not None:
+                request.future.set_result((chunk, raw_response if index == 0 else None))
+            else:
+                request.future.set_result(chunk)
+
+
+__all__ = ["EmbeddingBatcher"]
@@ -0,0 +1,167 @@
+"""Content-addressed cache for embedding vectors.
+
+Vectors are keyed by ``(embed_model, sha256(text))`` so identical strings embedded
+anywhere in the service (category descriptions, item summaries, queries) are only
+sent to the provider once. The in-memory tier is a bounded LRU; an optional SQLite
+file acts as a persistent second tier shared across processes and restarts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str]
+
+_DDL = (
+    "CREATE TABLE IF NOT EXISTS embedding_cache ("
+    "model TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, "
+    "PRIMARY KEY (model, text_hash))"
+)
+
+
+@dataclass
+class EmbeddingCacheStats:
+    hits: int = 0
+    persistent_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Thread-safe LRU of embedding vectors with an optional SQLite-backed tier.
+
+    Vectors are held as float32 arrays, so memory is bounded by
+    ``max_entries * dim * 4`` bytes. Lookups that miss in memory fall back to the
+    persistent tier (when configured) and promote the hit into the LRU.
+    """
+
+    def __init__(self, *, max_entries: int = 4096, persist_path: str | Path | None = None) -> None:
+        if max_entries <= 0:
+            msg = "max_entries must be positive"
+            raise ValueError(msg)
+        self.max_entries = max_entries
+        self.stats = EmbeddingCacheStats()
+        self._entries: OrderedDict[CacheKey, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        if persist_path is not None:
+            path = Path(persist_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(_DDL)
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def persistent(self) -> bool:
+        """Whether lookups and stores may touch the SQLite tier (i.e. block on disk I/O)."""
+        return self._conn is not None
+
+    def get_many(self, model: str, texts: Sequence[str]) -> list[list[float] | None]:
+        """Return cached vectors for ``texts`` in order, with ``None`` for misses."""
+        keys = [(model, text_hash(text)) for text in texts]
+        found: dict[CacheKey, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = vector
+            pending = list(dict.fromkeys(key for key in keys if key not in found))
+            if pending and self._conn is not None:
+                for key, vector in self._load(pending).items():
+                    found[key] = vector
+                    self._remember(key, vector)
+                    self.stats.persistent_hits += 1
+
+            results: list[list[float] | None] = []
+            for key in keys:
+                vector = found.get(key)
+                if vector is None:
+                    self.stats.misses += 1
+                    results.append(None)
+                else:
+                    self.stats.hits += 1
+                    results.append(vector.tolist())
+        return results
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> list[list[float]]:
+        """Store vectors for ``texts`` in both tiers.
+
+        Returns the vectors as stored (float32-rounded), i.e. exactly what a later hit yields.
+        """
+        rows: list[tuple[str, str, bytes]] = []
+        stored: list[list[float]] = []
+        with self._lock:
+            for text, vector in zip(texts, vectors, strict=True):
+                key = (model, text_hash(text))
+                array = np.asarray(vector, dtype="<f4")
+                self._remember(key, array)
+                rows.append((key[0], key[1], array.tobytes()))
+                stored.append(array.tolist())
+            if rows and self._conn is not None:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embedding_cache (model, text_hash, vector) VALUES (?, ?, ?)", rows
+                )
+                self._conn.commit()
+        return stored
+
+    def clear(self) -> None:
+        """Drop the in-memory tier; persisted vectors are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: CacheKey, vector: np.ndarray) -> None:
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _load(self, keys: Sequence[CacheKey]) -> dict[CacheKey, np.ndarray]:
+        if self._conn is None:
+            return {}
+        loaded: dict[CacheKey, np.ndarray] = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(keys), 400):
+            chunk = keys[start : start + 400]
+            clause = " OR ".join("(model = ? AND text_hash = ?)" for _ in chunk)
+            params = [part for key in chunk for part in key]
+            cursor = self._conn.execute(f"SELECT model, text_hash, vector FROM embedding_cache WHERE {clause}", params)  # noqa: S608
+            for model, digest, blob in cursor:
+                loaded[(model, digest)] = np.frombuffer(blob, dtype="<f4")
+        return loaded
+
+
+__all__ = ["EmbeddingCache", "EmbeddingCacheStats", "text_hash"]
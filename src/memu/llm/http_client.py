@@ -14,6 +14,7 @@ from memu.llm.backends.grok import GrokBackend
 from memu.llm.backends.openai import OpenAILLMBackend
 from memu.llm.backends.ollama import OllamaLLMBackend
 from memu.llm.backends.openrouter import OpenRouterLLMBackend
+from memu.utils.http import PooledAsyncClient
 
 
 # Minimal embedding backend support (moved from embedding module)
@@ -92,7 +93,10 @@ class HTTPLLMClient:
         chat_model: str,
         provider: str = "openai",
         endpoint_overrides: dict[str, str] | None = None,
-        timeout: int = 60,
+        timeout: float = 60,
+        connect_timeout: float | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
         embed_model: str | None = None,
     ):
         self.base_url = base_url.rstrip("/")
@@ -110,6 +114,9 @@ class HTTPLLMClient:
             or self.embedding_backend.embedding_endpoint
         )
         self.timeout = timeout
+        self._http = PooledAsyncClient(
+            base_url=self.base_url, timeout=timeout, connect_timeout=connect_timeout, limits=limits, http2=http2
+        )
         self.embed_model = embed_model or chat_model
 
     async def summarize(
@@ -118,10 +125,10 @@ class HTTPLLMClient:
         payload = self.backend.build_summary_payload(
             text=text, system_prompt=system_prompt, chat_model=self.chat_model, max_tokens=max_tokens
         )
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout) as client:
-            resp = await client.post(self.summary_endpoint, json=payload, headers=self._headers())
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._http.get()
+        resp = await client.post(self.summary_endpoint, json=payload, headers=self._headers())
+        resp.raise_for_status()
+        data = resp.json()
         logger.debug("HTTP LLM summarize response: %s", data)
         return self.backend.parse_summary_response(data), data
 
@@ -168,20 +175,20 @@ class HTTPLLMClient:
             max_tokens=max_tokens,
         )
 
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout) as client:
-            resp = await client.post(self.summary_endpoint, json=payload, headers=self._headers())
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._http.get()
+        resp = await client.post(self.summary_endpoint, json=payload, headers=self._headers())
+        resp.raise_for_status()
+        data = resp.json()
         logger.debug("HTTP LLM vision response: %s", data)
         return self.backend.parse_summary_response(data), data
 
     async def embed(self, inputs: list[str]) -> tuple[list[list[float]], dict[str, Any]]:
         """Create text embeddings using the provider-specific embedding API."""
         payload = self.embedding_backend.build_embedding_payload(inputs=inputs, embed_model=self.embed_model)
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout) as client:
-            resp = await client.post(self.embedding_endpoint, json=payload, headers=self._headers())
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._http.get()
+        resp = await client.post(self.embedding_endpoint, json=payload, headers=self._headers())
+        resp.raise_for_status()
+        data = resp.json()
         logger.debug("HTTP embedding response: %s", data)
         return self.embedding_backend.parse_embedding_response(data), data
 
@@ -219,20 +226,21 @@ class HTTPLLMClient:
                 if language:
                     data["language"] = language
 
-                async with httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout * 3) as client:
-                    resp = await client.post(
-                        "/v1/audio/transcriptions",
-                        files=files,
-                        data=data,
-                        headers=self._headers(),
-                    )
-                    resp.raise_for_status()
-
-                    if response_format == "text":
-                        result = resp.text
-                    else:
-                        raw_response = resp.json()
-                        result = raw_response.get("text", "")
+                client = self._http.get()
+                resp = await client.post(
+                    "/v1/audio/transcriptions",
+                    files=files,
+                    data=data,
+                    headers=self._headers(),
+                    timeout=self.timeout * 3,
+                )
+                resp.raise_for_status()
+
+                if response_format == "text":
+                    result = resp.text
+                else:
+                    raw_response = resp.json()
+                    result = raw_response.get("text", "")
 
             logger.debug("HTTP audio transcribe response for %s: %s chars", audio_path, len(result))
         except Exception:
@@ -241,6 +249,10 @@ class HTTPLLMClient:
         else:
             return result or "", raw_response
 
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._http.aclose()
+
     def _headers(self) -> dict[str, str]:
         return {"Authorization": f"Bearer {self.api_key}"}
 
@@ -1,10 +1,11 @@
+import asyncio
 import base64
 import logging
 from pathlib import Path
 from typing import Any, Literal, cast
 
-from openai import AsyncOpenAI
-from openai.types import CreateEmbeddingResponse
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
+from openai.types import CreateEmbeddingResponse, Embedding
 from openai.types.chat import (
     ChatCompletion,
     ChatCompletionContentPartImageParam,
@@ -13,9 +14,15 @@ from openai.types.chat import (
     ChatCompletionSystemMessageParam,
     ChatCompletionUserMessageParam,
 )
+from openai.types.create_embedding_response import Usage as EmbeddingUsage
+
+from memu.llm.retry import RetryHook, RetryPolicy
 
 logger = logging.getLogger(__name__)
 
+# Errors after which a single embedding chunk is worth retrying
+_RETRYABLE_EMBED_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
 
 class OpenAISDKClient:
     """OpenAI LLM client that relies on the official Python SDK."""
@@ -28,13 +35,28 @@ class OpenAISDKClient:
         chat_model: str,
         embed_model: str,
         embed_batch_size: int = 1,
+        embed_concurrency: int = 4,
+        embed_chunk_retries: int = 2,
+        max_retries: int | None = None,
+        retry_policy: RetryPolicy | None = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key or ""
         self.chat_model = chat_model
         self.embed_model = embed_model
         self.embed_batch_size = embed_batch_size
-        self.client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        self.embed_concurrency = max(1, embed_concurrency)
+        self.embed_chunk_retries = max(0, embed_chunk_retries)
+        # When set, it replaces the fixed chunk retries so each chunk is retried like any wrapped call
+        self.retry_policy = retry_policy
+        if max_retries is None:
+            self.client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        else:
+            self.client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=max_retries)
+
+    async def aclose(self) -> None:
+        """Close the SDK's pooled HTTP connections."""
+        await self.client.close()
 
     async def summarize(
         self,
@@ -125,22 +147,65 @@ class OpenAISDKClient:
         logger.debug("OpenAI vision response: %s", response)
         return content or "", response
 
-    async def embed(self, inputs: list[str]) -> tuple[list[list[float]], CreateEmbeddingResponse | None]:
-        """Create text embeddings via the official SDK."""
+    async def embed(
+        self, inputs: list[str], *, on_retry: RetryHook | None = None
+    ) -> tuple[list[list[float]], CreateEmbeddingResponse | None]:
+        """
+        Create text embeddings via the official SDK.
+
+        Inputs larger than ``embed_batch_size`` are split into chunks that run with up to
+        ``embed_concurrency`` requests in flight; each chunk is retried on its own after a
+        transient failure (per ``retry_policy`` when set), and ``on_retry`` is awaited
+        before each retry. The returned response carries the usage summed over all chunks.
+        """
         if len(inputs) <= self.embed_batch_size:
-            response = await self.client.embeddings.create(model=self.embed_model, input=inputs)
+            response = await self._embed_chunk(inputs, on_retry)
             return [cast(list[float], d.embedding) for d in response.data], response
 
-        # For batched requests, we aggregate embeddings but only return the last response for usage
+        chunks = [inputs[idx : idx + self.embed_batch_size] for idx in range(0, len(inputs), self.embed_batch_size)]
+        semaphore = asyncio.Semaphore(self.embed_concurrency)
+
+        async def _run(chunk: list[str]) -> CreateEmbeddingResponse:
+            async with semaphore:
+                return await self._embed_chunk(chunk, on_retry)
+
+        responses = await asyncio.gather(*(_run(chunk) for chunk in chunks))
+
         all_embeddings: list[list[float]] = []
-        last_response: CreateEmbeddingResponse | None = None
-        for idx in range(0, len(inputs), self.embed_batch_size):
-            batch = inputs[idx : idx + self.embed_batch_size]
-            response = await self.client.embeddings.create(model=self.embed_model, input=batch)
-            all_embeddings.extend([cast(list[float], d.embedding) for d in response.data])
-            last_response = response
-
-        return all_embeddings, last_response
+        data: list[Embedding] = []
+        prompt_tokens = total_tokens = 0
+        for response in responses:
+            for item in response.data:
+                all_embeddings.append(cast(list[float], item.embedding))
+                data.append(item.model_copy(update={"index": len(data)}))
+            if response.usage is not None:
+                prompt_tokens += response.usage.prompt_tokens
+                total_tokens += response.usage.total_tokens
+        merged = responses[0].model_copy(
+            update={"data": data, "usage": EmbeddingUsage(prompt_tokens=prompt_tokens, total_tokens=total_tokens)}
+        )
+        return all_embeddings, merged
+
+    async def _embed_chunk(self, chunk: list[str], on_retry: RetryHook | None = None) -> CreateEmbeddingResponse:
+        policy = self.retry_policy
+        attempt = 1
+        while True:
+            try:
+                return await self.client.embeddings.create(model=self.embed_model, input=chunk)
+            except Exception as exc:
+                if policy is not None:
+                    if attempt >= policy.max_attempts or not policy.is_retryable(exc):
+                        raise
+                    delay = policy.delay_for(attempt, exc)
+                else:
+                    if not isinstance(exc, _RETRYABLE_EMBED_ERRORS) or attempt > self.embed_chunk_retries:
+                        raise
+                    delay = 0.5 * (2 ** (attempt - 1))
+                logger.warning("Embedding chunk of %d inputs failed; retrying in %.1fs", len(chunk), delay)
+                if on_retry is not None:
+                    await on_retry(exc, attempt, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
 
     async def transcribe(
         self,
@@ -0,0 +1,120 @@
+"""Per-profile admission control for provider calls.
+
+`LLMRateLimiter` bounds the number of in-flight requests of an LLM profile and
+paces them against requests-per-minute and tokens-per-minute budgets using token
+buckets. Waiters are admitted in arrival order, so concurrent workflows sharing a
+profile get a fair share instead of one large memorize starving the rest.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class _TokenBucket:
+    """Continuously refilling budget of ``per_minute`` units with a one-minute burst."""
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+
+    def wait_time(self, amount: float) -> float:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+        # A single request larger than the whole budget waits for a full bucket
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.available -= min(amount, self.capacity)
+
+
+class LLMRateLimiter:
+    """
+    Concurrency cap plus RPM/TPM token buckets for one LLM profile.
+
+    Token budgets are charged with the caller's estimate (input size) when a request
+    is admitted. Limits left as ``None`` are not enforced.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int | None = None,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self._requests = _TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._admission: asyncio.Lock | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.max_concurrency) or self._requests is not None or self._tokens is not None
+
+    async def run[T](self, fn: Callable[[], Awaitable[T]], *, tokens: int = 0) -> T:
+        """Wait for a slot and budget, then await ``fn()``."""
+        slots, admission = self._primitives()
+        if slots is None:
+            await self._admit(admission, tokens)
+            return await fn()
+        async with slots:
+            await self._admit(admission, tokens)
+            return await fn()
+
+    def limit_embed[T](self, embed: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        """Wrap an ``embed(texts, **kwargs)`` callable so every call is admitted by this limiter."""
+
+        async def _embed(texts: list[str], **kwargs: Any) -> T:
+            return await self.run(
+                lambda: embed(texts, **kwargs), tokens=estimate_tokens(sum(len(text) for text in texts))
+            )
+
+        return _embed
+
+    async def _admit(self, admission: asyncio.Lock, tokens: int) -> None:
+        if self._requests is None and self._tokens is None:
+            return
+        # The lock queues waiters FIFO, so budget is handed out in arrival order
+        async with admission:
+            while True:
+                delay = 0.0
+                if self._requests is not None:
+                    delay = max(delay, self._requests.wait_time(1))
+                if self._tokens is not None and tokens > 0:
+                    delay = max(delay, self._tokens.wait_time(tokens))
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            if self._requests is not None:
+                self._requests.take(1)
+            if self._tokens is not None and tokens > 0:
+                self._tokens.take(tokens)
+
+    def _primitives(self) -> tuple[asyncio.Semaphore | None, asyncio.Lock]:
+        loop = asyncio.get_running_loop()
+        if self._admission is None or self._loop is not loop:
+            # asyncio primitives bind to the loop they first wait on
+            self._slots = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+            self._admission = asyncio.Lock()
+            self._loop = loop
+        return self._slots, self._admission
+
+
+def estimate_tokens(chars: int | None) -> int:
+    """Rough token count for budget accounting (about four characters per token)."""
+    return max(1, (chars or 0) // 4)
+
+
+__all__ = ["LLMRateLimiter", "estimate_tokens"]
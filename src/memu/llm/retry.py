@@ -0,0 +1,91 @@
+"""Retry policy for transient provider failures.
+
+Classifies exceptions raised by the httpx, OpenAI SDK and LazyLLM backends into
+retryable (timeouts, connection resets, configured HTTP status codes) or fatal, and
+computes exponential backoff with jitter, preferring a server-sent ``Retry-After``.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+import openai
+import pendulum
+
+DEFAULT_RETRY_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+# Called as ``hook(exc, attempt, delay)`` before a client sleeps and retries a failed request
+RetryHook = Callable[[Exception, int, float], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3
+    initial_backoff: float = 0.5
+    max_backoff: float = 30.0
+    multiplier: float = 2.0
+    jitter: float = 0.5
+    retry_status_codes: frozenset[int] = DEFAULT_RETRY_STATUS_CODES
+    respect_retry_after: bool = True
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        status = error_status_code(exc)
+        if status is not None:
+            return status in self.retry_status_codes
+        return _is_transport_error(exc)
+
+    def delay_for(self, attempt: int, exc: BaseException) -> float:
+        """Seconds to wait before retry number ``attempt`` (1-based) after ``exc``."""
+        if self.respect_retry_after:
+            retry_after = error_retry_after(exc)
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        backoff = min(self.max_backoff, self.initial_backoff * self.multiplier ** (attempt - 1))
+        # Spread concurrent retries so they do not hit the provider in lockstep
+        return backoff * (1 - self.jitter * random.random())  # noqa: S311
+
+
+def error_status_code(exc: BaseException) -> int | None:
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def error_retry_after(exc: BaseException) -> float | None:
+    headers: Any = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is None:
+        return None
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - pendulum.now("UTC").timestamp())
+
+
+def _is_transport_error(exc: BaseException) -> bool:
+    # openai.APITimeoutError is a subclass of APIConnectionError
+    return isinstance(exc, httpx.TransportError | openai.APIConnectionError | TimeoutError | ConnectionError)
+
+
+__all__ = ["DEFAULT_RETRY_STATUS_CODES", "RetryHook", "RetryPolicy", "error_retry_after", "error_status_code"]
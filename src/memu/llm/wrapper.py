@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import inspect
 import logging
@@ -11,6 +13,11 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from memu.llm.embedding_batcher import EmbeddingBatcher
+from memu.llm.embedding_cache import EmbeddingCache
+from memu.llm.rate_limit import LLMRateLimiter, estimate_tokens
+from memu.llm.retry import RetryPolicy
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,6 +63,7 @@ class LLMUsage:
     finish_reason: str | None = None
     status: str | None = None
     tokens_breakdown: dict[str, Any] | None = None
+    attempt: int | None = None
 
 
 @dataclass(frozen=True)
@@ -233,6 +241,10 @@ class LLMClientWrapper:
         provider: str | None = None,
         chat_model: str | None = None,
         embed_model: str | None = None,
+        embed_cache: EmbeddingCache | None = None,
+        embed_batcher: EmbeddingBatcher | None = None,
+        rate_limiter: LLMRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         self._client = client
         self._registry = registry
@@ -240,6 +252,10 @@ class LLMClientWrapper:
         self._provider = provider
         self._chat_model = chat_model or getattr(client, "chat_model", None)
         self._embed_model = embed_model or getattr(client, "embed_model", None)
+        self._embed_cache = embed_cache
+        self._embed_batcher = embed_batcher
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._client, name)
@@ -304,10 +320,37 @@ class LLMClientWrapper:
         )
 
     async def embed(self, inputs: list[str]) -> Any:
+        if self._embed_cache is None:
+            return await self._embed_uncached(inputs)
+
+        cache = self._embed_cache
+        model = self._embed_model or ""
+        vectors = await self._run_cache(cache, cache.get_many, model, inputs)
+        # Deduplicate misses so each distinct text is sent to the provider once
+        missing = list(dict.fromkeys(text for text, vec in zip(inputs, vectors, strict=True) if vec is None))
+        if not missing:
+            return vectors
+
+        fetched = await self._embed_uncached(missing)
+        # Return the stored (float32) vectors so hits and misses have the same precision
+        stored = await self._run_cache(cache, cache.put_many, model, missing, fetched)
+        by_text = dict(zip(missing, stored, strict=True))
+        return [vec if vec is not None else by_text[text] for text, vec in zip(inputs, vectors, strict=True)]
+
+    @staticmethod
+    async def _run_cache[R](cache: EmbeddingCache, fn: Callable[..., R], /, *args: Any) -> R:
+        # The SQLite tier does blocking I/O, so keep it off the event loop; the LRU alone is cheap
+        if cache.persistent:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    async def _embed_uncached(self, inputs: list[str]) -> Any:
         request_view = _build_embedding_request_view(inputs)
 
-        async def _call() -> Any:
-            return await self._client.embed(inputs)
+        async def _call(**kwargs: Any) -> Any:
+            if self._embed_batcher is not None:
+                return await self._embed_batcher.embed(inputs, **kwargs)
+            return await self._client.embed(inputs, **kwargs)
 
         return await self._invoke(
             kind="embed",
@@ -315,6 +358,8 @@ class LLMClientWrapper:
             request_view=request_view,
             model=self._embed_model,
             response_builder=_build_embedding_response_view,
+            # A client with its own retry policy retries each embedding chunk rather than the whole call
+            client_retries=getattr(self._client, "retry_policy", None) is not None,
         )
 
     async def transcribe(
@@ -354,51 +399,93 @@ class LLMClientWrapper:
         self,
         *,
         kind: str,
-        call_fn: Callable[[], Any],
+        call_fn: Callable[..., Any],
         request_view: LLMRequestView,
         model: str | None,
         response_builder: Callable[[Any], LLMResponseView],
+        client_retries: bool = False,
     ) -> Any:
         call_ctx = self._build_call_context(model)
         snapshot = self._registry.snapshot()
         await self._run_before(snapshot.before, call_ctx, request_view)
-        start_time = time.perf_counter()
-        try:
+        policy = self._retry_policy
+        if client_retries:
+            # The client retries on its own; its retries are reported like ours
+            async def _report_retry(exc: Exception, attempt: int, delay: float) -> None:
+                usage = LLMUsage(status="retry", attempt=attempt)
+                await self._run_on_error(snapshot.on_error, call_ctx, request_view, exc, usage)
+
+            call_fn = functools.partial(call_fn, on_retry=_report_retry)
+            policy = None
+        max_attempts = max(1, policy.max_attempts) if policy is not None else 1
+        attempt = 1
+        while True:
+            start_time = time.perf_counter()
+            try:
+                result = await self._call_provider(kind, call_fn, request_view)
+            except Exception as exc:
+                latency_ms = (time.perf_counter() - start_time) * 1000
+                if policy is not None and attempt < max_attempts and policy.is_retryable(exc):
+                    # Each failed attempt is reported; the call is then retried after a backoff
+                    usage = LLMUsage(latency_ms=latency_ms, status="retry", attempt=attempt)
+                    await self._run_on_error(snapshot.on_error, call_ctx, request_view, exc, usage)
+                    delay = policy.delay_for(attempt, exc)
+                    logger.warning(
+                        "LLM %s call failed (attempt %d/%d): %s; retrying in %.2fs",
+                        kind,
+                        attempt,
+                        max_attempts,
+                        exc,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+                usage = LLMUsage(latency_ms=latency_ms, status="error", attempt=attempt)
+                await self._run_on_error(snapshot.on_error, call_ctx, request_view, exc, usage)
+                raise
+            break
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+
+        # Handle tuple response: (pure_response, raw_response)
+        pure_result = result
+        raw_response = None
+        if isinstance(result, tuple) and len(result) == 2:
+            pure_result, raw_response = result
+
+        response_view = response_builder(pure_result)
+
+        # Extract token usage from raw response (best-effort)
+        extracted_usage = _extract_usage_from_raw_response(kind=kind, raw_response=raw_response)
+        usage = LLMUsage(
+            input_tokens=extracted_usage.get("input_tokens"),
+            output_tokens=extracted_usage.get("output_tokens"),
+            total_tokens=extracted_usage.get("total_tokens"),
+            cached_input_tokens=extracted_usage.get("cached_input_tokens"),
+            reasoning_tokens=extracted_usage.get("reasoning_tokens"),
+            latency_ms=latency_ms,
+            finish_reason=extracted_usage.get("finish_reason"),
+            status="success",
+            tokens_breakdown=extracted_usage.get("tokens_breakdown"),
+            attempt=attempt,
+        )
+
+        await self._run_after(snapshot.after, call_ctx, request_view, response_view, usage)
+        return pure_result
+
+    async def _call_provider(self, kind: str, call_fn: Callable[[], Any], request_view: LLMRequestView) -> Any:
+        async def _call() -> Any:
             result = call_fn()
             if inspect.isawaitable(result):
                 result = await result
-        except Exception as exc:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            usage = LLMUsage(latency_ms=latency_ms, status="error")
-            await self._run_on_error(snapshot.on_error, call_ctx, request_view, exc, usage)
-            raise
-        else:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-
-            # Handle tuple response: (pure_response, raw_response)
-            pure_result = result
-            raw_response = None
-            if isinstance(result, tuple) and len(result) == 2:
-                pure_result, raw_response = result
-
-            response_view = response_builder(pure_result)
-
-            # Extract token usage from raw response (best-effort)
-            extracted_usage = _extract_usage_from_raw_response(kind=kind, raw_response=raw_response)
-            usage = LLMUsage(
-                input_tokens=extracted_usage.get("input_tokens"),
-                output_tokens=extracted_usage.get("output_tokens"),
-                total_tokens=extracted_usage.get("total_tokens"),
-                cached_input_tokens=extracted_usage.get("cached_input_tokens"),
-                reasoning_tokens=extracted_usage.get("reasoning_tokens"),
-                latency_ms=latency_ms,
-                finish_reason=extracted_usage.get("finish_reason"),
-                status="success",
-                tokens_breakdown=extracted_usage.get("tokens_breakdown"),
-            )
+            return result
 
-            await self._run_after(snapshot.after, call_ctx, request_view, response_view, usage)
-            return pure_result
+        limiter = self._rate_limiter
+        # Batched embeddings are admitted per provider request inside the batcher instead
+        if limiter is None or (kind == "embed" and self._embed_batcher is not None):
+            return await _call()
+        return await limiter.run(_call, tokens=estimate_tokens(request_view.input_chars))
 
     def _build_call_context(self, model: str | None) -> LLMCallContext:
         request_id = uuid.uuid4().hex
@@ -0,0 +1,63 @@
+"""
+Long-lived httpx client shared by the HTTP LLM and embedding clients.
+
+Opening an ``httpx.AsyncClient`` per request pays a TCP+TLS handshake every time;
+this keeps one pooled client alive and reuses its keep-alive connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+
+class PooledAsyncClient:
+    """
+    Lazily created ``httpx.AsyncClient`` with connection pooling.
+
+    Pooled connections belong to the event loop that opened them, so the client is
+    recreated when it is used from a different loop (e.g. successive ``asyncio.run``
+    calls). Call `aclose` to release the connections when the owner shuts down.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        timeout: float,
+        connect_timeout: float | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+    ) -> None:
+        self.base_url = base_url
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout if connect_timeout is not None else timeout)
+        self.limits = limits or DEFAULT_LIMITS
+        self.http2 = http2
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # A client left over from a finished loop cannot be closed from here; drop it
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+            )
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        client, loop = self._client, self._loop
+        self._client, self._loop = None, None
+        if client is None or client.is_closed:
+            return
+        if loop is not asyncio.get_running_loop():
+            # Its connections died with the loop that opened them
+            return
+        await client.aclose()
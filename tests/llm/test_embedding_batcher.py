@@ -0,0 +1,48 @@
+"""
+Tests for embedding micro-batching:
+- Concurrent embed() calls share one provider request
+- Raw responses (token usage) are attributed to a single caller
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from memu.llm.embedding_batcher import EmbeddingBatcher
+
+
+class _StubEmbedClient:
+    def __init__(self, *, with_raw: bool = False) -> None:
+        self.calls: list[list[str]] = []
+        self.with_raw = with_raw
+
+    async def embed(self, texts):
+        self.calls.append(list(texts))
+        vectors = [[float(len(t))] for t in texts]
+        return (vectors, {"usage": {"prompt_tokens": len(texts)}}) if self.with_raw else vectors
+
+
+class TestEmbeddingBatcher:
+    def test_concurrent_calls_are_coalesced(self):
+        client = _StubEmbedClient()
+        batcher = EmbeddingBatcher(client.embed, max_batch_size=16, max_wait_ms=5)
+
+        async def run():
+            return await asyncio.gather(batcher.embed(["a"]), batcher.embed(["bb", "ccc"]), batcher.embed(["dddd"]))
+
+        results = asyncio.run(run())
+        assert results == [[[1.0]], [[2.0], [3.0]], [[4.0]]]
+        assert client.calls == [["a", "bb", "ccc", "dddd"]]
+
+    def test_full_batch_flushes_and_raw_goes_to_first_caller(self):
+        client = _StubEmbedClient(with_raw=True)
+        batcher = EmbeddingBatcher(client.embed, max_batch_size=2, max_wait_ms=1000)
+
+        async def run():
+            return await asyncio.gather(batcher.embed(["a"]), batcher.embed(["b"]))
+
+        (first, first_raw), (second, second_raw) = asyncio.run(run())
+        assert (first, second) == ([[1.0]], [[1.0]])
+        assert first_raw == {"usage": {"prompt_tokens": 2}}
+        assert second_raw is None
+        assert client.calls == [["a", "b"]]
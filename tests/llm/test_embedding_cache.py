@@ -0,0 +1,112 @@
+"""
+Tests for the content-addressed embedding cache:
+- Only distinct misses are sent to the client, in one batch
+- LRU bound and persistent tier
+- Misses and hits return the same (float32) precision
+- Persistent-tier I/O runs off the event loop thread
+- Caching is off by default
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from memu.app import MemoryService
+from memu.llm.embedding_cache import EmbeddingCache
+from memu.llm.wrapper import LLMClientWrapper, LLMInterceptorRegistry
+
+
+class _StubEmbedClient:
+    embed_model = "stub-embed"
+
+    def __init__(self, vector: list[float] | None = None) -> None:
+        self.calls: list[list[str]] = []
+        self._vector = vector
+
+    async def embed(self, texts):
+        self.calls.append(list(texts))
+        if self._vector is not None:
+            return [list(self._vector) for _ in texts]
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+def _wrapper(client, cache):
+    return LLMClientWrapper(client, registry=LLMInterceptorRegistry(), embed_cache=cache)
+
+
+class TestEmbeddingCache:
+    def test_wrapper_embeds_only_distinct_misses(self):
+        client = _StubEmbedClient()
+        cache = EmbeddingCache(max_entries=16)
+        wrapper = _wrapper(client, cache)
+
+        first = asyncio.run(wrapper.embed(["a", "bb", "a"]))
+        second = asyncio.run(wrapper.embed(["bb", "ccc"]))
+
+        assert first == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+        assert second == [[2.0, 1.0], [3.0, 1.0]]
+        assert client.calls == [["a", "bb"], ["ccc"]]
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 4
+
+    def test_lru_bound_and_persistent_tier(self, tmp_path):
+        path = tmp_path / "embeddings.db"
+        cache = EmbeddingCache(max_entries=2, persist_path=path)
+        cache.put_many("m", ["a", "b", "c"], [[1.0], [2.0], [3.0]])
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+        cache.close()
+
+        reopened = EmbeddingCache(max_entries=2, persist_path=path)
+        assert reopened.get_many("m", ["a", "c", "d"]) == [[1.0], [3.0], None]
+        assert reopened.get_many("other-model", ["a"]) == [None]
+        assert reopened.stats.persistent_hits == 2
+        reopened.close()
+
+    def test_miss_and_hit_have_the_same_precision(self):
+        client_vector = [0.1, 1 / 3]
+        client = _StubEmbedClient(client_vector)
+        wrapper = _wrapper(client, EmbeddingCache(max_entries=16))
+
+        miss = asyncio.run(wrapper.embed(["a"]))
+        hit = asyncio.run(wrapper.embed(["a"]))
+
+        assert miss == hit
+        assert miss[0] != client_vector
+        assert miss[0] == pytest.approx(client_vector, rel=1e-6)
+
+    def test_persistent_tier_runs_off_the_loop_thread(self, tmp_path):
+        threads: list[str] = []
+
+        class _RecordingCache(EmbeddingCache):
+            def get_many(self, model, texts):
+                threads.append(threading.current_thread().name)
+                return super().get_many(model, texts)
+
+            def put_many(self, model, texts, vectors):
+                threads.append(threading.current_thread().name)
+                return super().put_many(model, texts, vectors)
+
+        async def _embed_twice(wrapper):
+            await wrapper.embed(["a"])
+            await wrapper.embed(["a"])
+            return threading.current_thread().name
+
+        persistent = _RecordingCache(max_entries=16, persist_path=tmp_path / "embeddings.db")
+        loop_thread = asyncio.run(_embed_twice(_wrapper(_StubEmbedClient(), persistent)))
+        persistent.close()
+        assert len(threads) == 3
+        assert loop_thread not in threads
+
+        threads.clear()
+        loop_thread = asyncio.run(_embed_twice(_wrapper(_StubEmbedClient(), _RecordingCache(max_entries=16))))
+        assert threads == [loop_thread] * 3
+
+    def test_cache_is_disabled_by_default(self):
+        service = MemoryService(llm_profiles={"default": {"api_key": "test"}})
+
+        assert service._get_embedding_cache() is None
+        assert service.embedding_cache_stats() == {}
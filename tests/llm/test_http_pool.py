@@ -0,0 +1,56 @@
+"""
+Tests for the pooled httpx client used by HTTPLLMClient:
+- One AsyncClient is reused across calls on the same event loop
+- aclose releases it and MemoryService.aclose closes every profile's client
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from memu.app import MemoryService
+from memu.llm.http_client import HTTPLLMClient
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"data": [{"embedding": [0.1, 0.2]}]})
+
+
+def _client() -> HTTPLLMClient:
+    return HTTPLLMClient(base_url="https://llm.test/v1", api_key="k", chat_model="m", embed_model="e")
+
+
+class TestPooledHTTPClient:
+    def test_client_reused_within_loop(self):
+        client = _client()
+
+        async def run():
+            seen = []
+            for _ in range(3):
+                pooled = client._http.get()
+                # Route the pooled client through a mock transport
+                pooled._transport = httpx.MockTransport(_handler)
+                vectors, _ = await client.embed(["hi"])
+                assert vectors == [[0.1, 0.2]]
+                seen.append(pooled)
+            await client.aclose()
+            return seen
+
+        seen = asyncio.run(run())
+        assert all(p is seen[0] for p in seen)
+        assert seen[0].is_closed
+
+    def test_service_aclose_closes_profile_clients(self):
+        service = MemoryService(llm_profiles={"default": {"api_key": "k", "client_backend": "httpx"}})
+
+        async def run():
+            base = service._get_llm_base_client()
+            pooled = base._http.get()
+            await service.aclose()
+            return pooled
+
+        pooled = asyncio.run(run())
+        assert pooled.is_closed
+        assert service._llm_clients == {}
@@ -0,0 +1,127 @@
+"""
+Tests for chunked embedding in OpenAISDKClient:
+- Chunks run concurrently and keep input order
+- Usage is summed across chunks and failed chunks are retried alone
+- Under the service's retry policy only the failed chunk is re-sent, and retries are reported
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+from openai.types import CreateEmbeddingResponse, Embedding
+from openai.types.create_embedding_response import Usage
+
+from memu.app import MemoryService
+from memu.llm import openai_sdk
+from memu.llm.openai_sdk import OpenAISDKClient
+from memu.llm.retry import RetryPolicy
+
+
+class _DownEmbeddings:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def create(self, *, model, **kwargs):
+        self.calls += 1
+        raise ConnectionError
+
+
+class _StubEmbeddings:
+    def __init__(self, *, fail_once: str | None = None) -> None:
+        self.calls: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_once = fail_once
+
+    async def create(self, *, model, **kwargs):
+        texts = kwargs["input"]
+        self.calls.append(list(texts))
+        if self.fail_once in texts:
+            self.fail_once = None
+            raise ConnectionError
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return CreateEmbeddingResponse(
+            data=[Embedding(embedding=[float(t)], index=i, object="embedding") for i, t in enumerate(texts)],
+            model=model,
+            object="list",
+            usage=Usage(prompt_tokens=len(texts), total_tokens=len(texts)),
+        )
+
+
+def _client(stub: _StubEmbeddings) -> OpenAISDKClient:
+    client = OpenAISDKClient(
+        base_url="https://api.test/v1",
+        api_key="k",
+        chat_model="m",
+        embed_model="e",
+        embed_batch_size=2,
+        embed_concurrency=2,
+    )
+    client.embed_chunk_retries = 1
+    client.client = cast(Any, SimpleNamespace(embeddings=stub))
+    return client
+
+
+class TestOpenAISDKChunkedEmbed:
+    def test_chunks_run_concurrently_in_order(self):
+        stub = _StubEmbeddings()
+        vectors, response = asyncio.run(_client(stub).embed([str(i) for i in range(7)]))
+
+        assert vectors == [[float(i)] for i in range(7)]
+        assert response is not None
+        assert [d.index for d in response.data] == list(range(7))
+        assert response.usage.prompt_tokens == 7
+        assert stub.max_in_flight == 2
+
+    def test_failed_chunk_is_retried_alone(self, monkeypatch):
+        monkeypatch.setattr(asyncio, "sleep", _no_sleep(asyncio.sleep))
+        monkeypatch.setattr(openai_sdk, "_RETRYABLE_EMBED_ERRORS", (ConnectionError,))
+        stub = _StubEmbeddings(fail_once="2")
+        vectors, _ = asyncio.run(_client(stub).embed([str(i) for i in range(4)]))
+
+        assert vectors == [[float(i)] for i in range(4)]
+        assert sorted(map(tuple, stub.calls)) == [("0", "1"), ("2", "3"), ("2", "3")]
+
+    def test_default_config_resends_only_the_failed_chunk(self, monkeypatch):
+        monkeypatch.setattr(asyncio, "sleep", _no_sleep(asyncio.sleep))
+        service = MemoryService(
+            llm_profiles={"default": {"api_key": "k", "client_backend": "sdk", "embed_batch_size": 2}}
+        )
+        retries: list[tuple[str | None, int | None]] = []
+        service.intercept_on_error_llm_call(lambda ctx, req, exc, usage: retries.append((usage.status, usage.attempt)))
+        base = service._get_llm_base_client()
+        stub = _StubEmbeddings(fail_once="2")
+        base.client = cast(Any, SimpleNamespace(embeddings=stub))
+
+        vectors = asyncio.run(service._get_llm_client().embed([str(i) for i in range(4)]))
+
+        assert vectors == [[float(i)] for i in range(4)]
+        assert sorted(map(tuple, stub.calls)) == [("0", "1"), ("2", "3"), ("2", "3")]
+        assert retries == [("retry", 1)]
+
+    def test_retry_policy_gives_up_after_max_attempts(self, monkeypatch):
+        monkeypatch.setattr(asyncio, "sleep", _no_sleep(asyncio.sleep))
+        client = _client(_StubEmbeddings())
+        stub = _DownEmbeddings()
+        client.client = cast(Any, SimpleNamespace(embeddings=stub))
+        client.retry_policy = RetryPolicy(max_attempts=3, initial_backoff=0.0)
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(client.embed(["a"]))
+        # The policy replaces the fixed chunk retries instead of stacking on them
+        assert stub.calls == 3
+
+
+def _no_sleep(real_sleep):
+    async def _sleep(delay, *args, **kwargs):
+        # Keep the stub's concurrency sleeps, skip retry backoff
+        return await real_sleep(min(delay, 0.01), *args, **kwargs)
+
+    return _sleep
@@ -0,0 +1,61 @@
+"""
+Tests for the per-profile LLM rate limiter:
+- In-flight requests are capped and admitted in arrival order
+- Request budgets pace calls once the burst is spent
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from functools import partial
+
+from memu.app import MemoryService
+from memu.llm.rate_limit import LLMRateLimiter
+
+
+class TestLLMRateLimiter:
+    def test_concurrency_cap_and_fifo_order(self):
+        limiter = LLMRateLimiter(max_concurrency=2)
+        in_flight = 0
+        peak = 0
+        started: list[int] = []
+
+        async def call(i: int) -> int:
+            nonlocal in_flight, peak
+            started.append(i)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return i
+
+        async def run():
+            return await asyncio.gather(*(limiter.run(partial(call, i)) for i in range(6)))
+
+        assert asyncio.run(run()) == list(range(6))
+        assert peak == 2
+        assert started == list(range(6))
+
+    def test_requests_per_minute_paces_calls(self):
+        limiter = LLMRateLimiter(requests_per_minute=600)  # burst of 600, then 10/s
+        limiter._requests.available = 1  # type: ignore[union-attr]
+
+        async def noop() -> None:
+            return None
+
+        async def run():
+            start = time.monotonic()
+            for _ in range(3):
+                await limiter.run(noop)
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 0.18
+
+    def test_service_shares_limiter_per_profile(self):
+        service = MemoryService(llm_profiles={"default": {"api_key": "k", "rate_limit": {"max_concurrency": 4}}})
+        assert service._get_llm_client()._rate_limiter is service._get_llm_client()._rate_limiter
+        limiter = service._get_rate_limiter("default")
+        assert limiter is not None
+        assert limiter.max_concurrency == 4
+        assert MemoryService(llm_profiles={"default": {"api_key": "k"}})._get_rate_limiter() is None
@@ -0,0 +1,69 @@
+"""
+Tests for retrying transient LLM failures in LLMClientWrapper:
+- 429/5xx responses are retried and each retry is reported to on_error hooks
+- Non-retryable errors fail immediately; Retry-After is honoured
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from memu.llm.retry import RetryPolicy
+from memu.llm.wrapper import LLMClientWrapper, LLMInterceptorRegistry
+
+
+def _status_error(status: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://llm.test/chat")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("boom", request=request, response=response)
+
+
+class _FlakyClient:
+    chat_model = "m"
+
+    def __init__(self, failures: list[Exception]) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    async def summarize(self, text, max_tokens=None, system_prompt=None):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return "ok"
+
+
+def _wrapper(client, registry):
+    policy = RetryPolicy(max_attempts=3, initial_backoff=0.0)
+    return LLMClientWrapper(client, registry=registry, retry_policy=policy)
+
+
+class TestLLMRetry:
+    def test_transient_errors_are_retried_and_reported(self):
+        registry = LLMInterceptorRegistry()
+        seen: list[tuple[str | None, int | None]] = []
+        registry.register_on_error(lambda ctx, req, exc, usage: seen.append((usage.status, usage.attempt)))
+        client = _FlakyClient([_status_error(429), httpx.ConnectTimeout("slow")])
+
+        assert asyncio.run(_wrapper(client, registry).summarize("hi")) == "ok"
+        assert client.calls == 3
+        assert seen == [("retry", 1), ("retry", 2)]
+
+    def test_non_retryable_error_fails_fast(self):
+        registry = LLMInterceptorRegistry()
+        seen: list[str | None] = []
+        registry.register_on_error(lambda ctx, req, exc, usage: seen.append(usage.status))
+        client = _FlakyClient([_status_error(400)])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(_wrapper(client, registry).summarize("hi"))
+        assert client.calls == 1
+        assert seen == ["error"]
+
+    def test_retry_after_header_sets_delay(self):
+        policy = RetryPolicy(max_backoff=10.0)
+        assert policy.delay_for(1, _status_error(503, {"retry-after": "4"})) == 4.0
+        assert policy.delay_for(1, _status_error(503, {"retry-after": "120"})) == 10.0
+        assert 0.25 <= policy.delay_for(1, _status_error(503)) <= 0.5
@@ -0,0 +1,110 @@
+"""
+Tests for the async repository layer:
+- SQLite repository calls from workflow steps run on the database thread, not the event loop
+- RAG context building loads missing pools through the repository executor
+- In-memory calls run inline
+- Worker counts resolved from the metadata store config
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from memu.app import MemoryService
+from memu.app.settings import MetadataStoreConfig
+from memu.database.aio import RepoExecutor, resolve_io_workers
+from memu.database.repositories import AsyncMemoryItemRepo
+
+
+class TestAsyncRepos:
+    def test_sqlite_calls_leave_the_event_loop(self, tmp_path, monkeypatch):
+        service = MemoryService(
+            llm_profiles={"default": {"api_key": "test"}},
+            database_config={"metadata_store": {"provider": "sqlite", "dsn": f"sqlite:///{tmp_path / 'memu.db'}"}},
+        )
+        store = service._get_database()
+        store.memory_item_repo.create_item(
+            resource_id="r", memory_type="event", summary="a", embedding=[1.0, 0.0], user_data={"user_id": "u1"}
+        )
+        repo = store.memory_item_repo
+        clear_items = repo.clear_items
+        threads: list[str] = []
+
+        def record_thread(where):
+            threads.append(threading.current_thread().name)
+            return clear_items(where)
+
+        monkeypatch.setattr(repo, "clear_items", record_thread)
+
+        async def main():
+            result = await service.clear_memory(where={"user_id": "u1"})
+            await service.aclose()
+            return result
+
+        result = asyncio.run(main())
+        store.close()
+
+        assert len(result["deleted_items"]) == 1
+        assert threads
+        assert threads[0].startswith("memu-db")
+        assert isinstance(service._get_async_database(store).memory_item_repo, AsyncMemoryItemRepo)
+
+    def test_rag_build_context_loads_pools_off_the_loop(self, tmp_path, monkeypatch):
+        service = MemoryService(
+            llm_profiles={"default": {"api_key": "test"}},
+            database_config={"metadata_store": {"provider": "sqlite", "dsn": f"sqlite:///{tmp_path / 'memu.db'}"}},
+        )
+        store = service._get_database()
+        item = store.memory_item_repo.create_item(
+            resource_id="r", memory_type="event", summary="a", embedding=[1.0, 0.0], user_data={"user_id": "u1"}
+        )
+        threads: dict[str, str] = {}
+
+        def recorded(name, method):
+            def call(*args, **kwargs):
+                threads[name] = threading.current_thread().name
+                return method(*args, **kwargs)
+
+            return call
+
+        for repo, name in (
+            (store.memory_category_repo, "list_categories"),
+            (store.resource_repo, "list_resources"),
+            (store.memory_item_repo, "get_items"),
+        ):
+            monkeypatch.setattr(repo, name, recorded(name, getattr(repo, name)))
+
+        state = {
+            "needs_retrieval": True,
+            "original_query": "q",
+            "store": store,
+            "where": service._normalize_where({"user_id": "u1"}),
+            "category_hits": [("c", 1.0)],
+            "item_hits": [(item.id, 1.0)],
+            "resource_hits": [("r", 1.0)],
+        }
+
+        async def main():
+            result = await service._rag_build_context(state, None)
+            await service.aclose()
+            return result
+
+        result = asyncio.run(main())
+        store.close()
+
+        assert [hit["summary"] for hit in result["response"]["items"]] == ["a"]
+        assert set(threads) == {"list_categories", "list_resources", "get_items"}
+        assert all(name.startswith("memu-db") for name in threads.values())
+
+    def test_inline_executor_runs_on_loop_thread(self):
+        async def main():
+            return await RepoExecutor(0).run(threading.current_thread)
+
+        assert asyncio.run(main()) is threading.main_thread()
+
+    def test_worker_resolution(self):
+        assert resolve_io_workers(MetadataStoreConfig(provider="inmemory")) == 0
+        assert resolve_io_workers(MetadataStoreConfig(provider="postgres")) == 4
+        assert resolve_io_workers(MetadataStoreConfig(provider="postgres", io_workers=8)) == 8
+        assert resolve_io_workers(MetadataStoreConfig(provider="sqlite", io_workers=8)) == 1
@@ -0,0 +1,80 @@
+"""
+Tests for bulk persistence APIs:
+- create_items_bulk keeps entry order and reinforces duplicates within a batch
+- link_many skips relations that already exist
+- Relation lookups by item and by category stay consistent after unlinking
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from memu.app.settings import DatabaseConfig, DefaultUserModel, MetadataStoreConfig
+from memu.database.inmemory import build_inmemory_database
+from memu.database.sqlite import build_sqlite_database
+
+
+@pytest.fixture(params=["inmemory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "inmemory":
+        config = DatabaseConfig(metadata_store=MetadataStoreConfig(provider="inmemory"))
+        yield build_inmemory_database(config=config, user_model=DefaultUserModel)
+        return
+    config = DatabaseConfig(metadata_store=MetadataStoreConfig(provider="sqlite", dsn=f"sqlite:///{tmp_path}/m.db"))
+    db = build_sqlite_database(config=config, user_model=DefaultUserModel)
+    yield db
+    db.close()
+
+
+class TestBulkPersist:
+    def test_create_items_bulk_reinforces_duplicates(self, store):
+        repo = store.memory_item_repo
+        first = repo.create_item(
+            resource_id="r",
+            memory_type="profile",
+            summary="likes tea",
+            embedding=[1.0, 0.0],
+            user_data={"user_id": "u1"},
+            reinforce=True,
+        )
+
+        items = repo.create_items_bulk(
+            resource_id="r",
+            entries=[
+                ("profile", "likes tea", [1.0, 0.0]),
+                ("event", "went hiking", [0.0, 1.0]),
+                ("event", "went hiking", [0.0, 1.0]),
+            ],
+            user_data={"user_id": "u1"},
+            reinforce=True,
+        )
+
+        assert [item.summary for item in items] == ["likes tea", "went hiking", "went hiking"]
+        assert items[0].id == first.id
+        assert items[1].id == items[2].id
+        assert repo.get_item(first.id).extra["reinforcement_count"] == 2
+        assert items[1].extra["reinforcement_count"] == 2
+        assert len(repo.list_items()) == 2
+        assert list(repo.get_items([items[1].id, "missing", first.id])) == [items[1].id, first.id]
+
+    def test_link_many_is_idempotent(self, store):
+        rel_repo = store.category_item_repo
+        existing = rel_repo.link_item_category("i1", "c1", user_data={"user_id": "u1"})
+
+        rels = rel_repo.link_many([("i1", "c1"), ("i1", "c2"), ("i2", "c1")], user_data={"user_id": "u1"})
+
+        assert [(r.item_id, r.category_id) for r in rels] == [("i1", "c1"), ("i1", "c2"), ("i2", "c1")]
+        assert rels[0].id == existing.id
+        assert len(rel_repo.list_relations()) == 3
+
+    def test_relation_lookups_after_unlink(self, store):
+        rel_repo = store.category_item_repo
+        rel_repo.link_many([("i1", "c1"), ("i1", "c2"), ("i2", "c1"), ("i3", "c3")], user_data={"user_id": "u1"})
+
+        rel_repo.unlink_item_category("i1", "c1")
+
+        assert {r.category_id for r in rel_repo.get_item_categories("i1")} == {"c2"}
+        rels = rel_repo.list_items_for_categories(["c1", "c2"], {"user_id": "u1"})
+        assert sorted((r.item_id, r.category_id) for r in rels) == [("i1", "c2"), ("i2", "c1")]
+        assert rel_repo.list_items_for_categories(["c1"], {"user_id": "u2"}) == []
+        assert len(store.relations) == 3
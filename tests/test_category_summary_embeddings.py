@@ -0,0 +1,76 @@
+"""
+Tests for stored category summary embeddings:
+- Summaries written by memorize are embedded once, in a batch
+- Retrieval reuses stored embeddings and only backfills missing ones
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from memu.app import MemoryService
+
+
+class _StubClient:
+    def __init__(self) -> None:
+        self.embed_calls: list[list[str]] = []
+
+    async def embed(self, texts):
+        self.embed_calls.append(list(texts))
+        return [[1.0, float(len(t))] for t in texts]
+
+    async def summarize(self, prompt, system_prompt=None):
+        return "new summary"
+
+
+def _service_with_category():
+    service = MemoryService(llm_profiles={"default": {"api_key": "test"}})
+    store = service._get_database()
+    cat = store.memory_category_repo.get_or_create_category(
+        name="preferences", description="likes", embedding=[1.0, 0.0], user_data={}
+    )
+    return service, store, cat
+
+
+class TestCategorySummaryEmbeddings:
+    def test_summary_update_stores_embedding(self):
+        service, store, cat = _service_with_category()
+        client = _StubClient()
+
+        asyncio.run(
+            service._update_category_summaries(
+                {cat.id: [("item", "likes tea")]},
+                ctx=service._get_context(),
+                store=store,
+                llm_client=client,
+                embed_client=client,
+            )
+        )
+
+        stored = store.memory_category_repo.categories[cat.id]
+        assert stored.summary == "new summary"
+        assert stored.summary_embedding == [1.0, float(len("new summary"))]
+        assert client.embed_calls == [["new summary"]]
+
+        # Retrieval ranks against the stored vector without embedding again
+        hits, _ = asyncio.run(
+            service._rank_categories_by_summary([1.0, 1.0], 1, service._get_context(), store, embed_client=client)
+        )
+        assert hits[0][0] == cat.id
+        assert client.embed_calls == [["new summary"]]
+
+    def test_missing_embeddings_are_backfilled_once(self):
+        service, store, cat = _service_with_category()
+        store.memory_category_repo.update_category(category_id=cat.id, summary="old summary")
+        client = _StubClient()
+
+        for _ in range(2):
+            asyncio.run(
+                service._rank_categories_by_summary([1.0, 1.0], 1, service._get_context(), store, embed_client=client)
+            )
+
+        assert client.embed_calls == [["old summary"]]
+
+        # A changed summary invalidates the stored embedding
+        store.memory_category_repo.update_category(category_id=cat.id, summary="changed")
+        assert store.memory_category_repo.categories[cat.id].summary_embedding is None
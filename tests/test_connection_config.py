@@ -0,0 +1,50 @@
+"""
+Tests for engine connection settings:
+- SQLite PRAGMAs from the metadata store config are applied to every connection
+- Pool sizing reaches file-backed SQLite engines; in-memory databases keep their default pool
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+
+from memu.app.settings import (
+    ConnectionPoolConfig,
+    DatabaseConfig,
+    DefaultUserModel,
+    MetadataStoreConfig,
+    SQLitePragmaConfig,
+)
+from memu.database.sqlite import build_sqlite_database
+from memu.database.sqlite.session import SQLiteSessionManager
+
+
+class TestConnectionConfig:
+    def test_sqlite_pragmas_applied_on_connect(self, tmp_path):
+        config = DatabaseConfig(
+            metadata_store=MetadataStoreConfig(
+                provider="sqlite",
+                dsn=f"sqlite:///{tmp_path / 'memu.db'}",
+                pool=ConnectionPoolConfig(size=3, max_overflow=2),
+                sqlite_pragmas=SQLitePragmaConfig(synchronous="normal", cache_size=-2048, busy_timeout=1234),
+            )
+        )
+        store = build_sqlite_database(config=config, user_model=DefaultUserModel)
+        engine = store._sessions.engine
+        try:
+            with engine.connect() as conn:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+                assert conn.execute(text("PRAGMA cache_size")).scalar() == -2048
+                assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+            assert engine.pool.size() == 3
+        finally:
+            store.close()
+
+    def test_memory_database_ignores_pool_sizing(self):
+        sessions = SQLiteSessionManager(dsn="sqlite://", pool=ConnectionPoolConfig(size=3))
+        try:
+            with sessions.engine.connect() as conn:
+                assert conn.execute(text("SELECT 1")).scalar() == 1
+        finally:
+            sessions.close()
@@ -0,0 +1,70 @@
+"""
+Tests for the indexed content_hash used by reinforcement:
+- The in-memory hash index respects scope and follows deletes
+- SQLite backfills the column and its index for rows written before it existed
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from memu.app.settings import DatabaseConfig, DefaultUserModel, MetadataStoreConfig
+from memu.database.inmemory import build_inmemory_database
+from memu.database.sqlite import build_sqlite_database
+
+
+def _reinforce(repo, summary, user_id):
+    return repo.create_item(
+        resource_id="r",
+        memory_type="profile",
+        summary=summary,
+        embedding=[1.0, 0.0],
+        user_data={"user_id": user_id},
+        reinforce=True,
+    )
+
+
+class TestContentHashIndex:
+    def test_inmemory_index_respects_scope_and_deletes(self):
+        config = DatabaseConfig(metadata_store=MetadataStoreConfig(provider="inmemory"))
+        repo = build_inmemory_database(config=config, user_model=DefaultUserModel).memory_item_repo
+
+        first = _reinforce(repo, "likes tea", "u1")
+        other_user = _reinforce(repo, "likes tea", "u2")
+        again = _reinforce(repo, "Likes  tea", "u1")
+
+        assert other_user.id != first.id
+        assert again.id == first.id
+        assert again.extra["reinforcement_count"] == 2
+
+        repo.delete_item(first.id)
+        recreated = _reinforce(repo, "likes tea", "u1")
+        assert recreated.id != first.id
+        assert recreated.extra["reinforcement_count"] == 1
+
+    def test_sqlite_backfills_legacy_rows(self, tmp_path):
+        path = tmp_path / "m.db"
+        config = DatabaseConfig(metadata_store=MetadataStoreConfig(provider="sqlite", dsn=f"sqlite:///{path}"))
+        db = build_sqlite_database(config=config, user_model=DefaultUserModel)
+        first = _reinforce(db.memory_item_repo, "likes tea", "u1")
+        db.close()
+
+        # Simulate a database written before the column was populated and indexed
+        conn = sqlite3.connect(path)
+        conn.execute("DROP INDEX ix_memory_items__content_hash_scoped")
+        conn.execute("UPDATE memory_items SET content_hash = NULL")
+        conn.commit()
+        conn.close()
+
+        db = build_sqlite_database(config=config, user_model=DefaultUserModel)
+        again = _reinforce(db.memory_item_repo, "likes tea", "u1")
+        db.close()
+
+        conn = sqlite3.connect(path)
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(memory_items)")}
+        hashes = conn.execute("SELECT content_hash FROM memory_items").fetchall()
+        conn.close()
+        assert again.id == first.id
+        assert again.extra["reinforcement_count"] == 2
+        assert "ix_memory_items__content_hash_scoped" in indexes
+        assert hashes == [(first.extra["content_hash"],)]
@@ -0,0 +1,110 @@
+"""
+Tests for lazily materialized embeddings:
+- SQLite reads keep embeddings as undecoded float32 BLOBs until they are used
+- Lazy embeddings decode to NumPy, compare to lists and serialize as lists
+- Reads with ``with_embeddings=False`` skip the embedding columns and bypass the caches
+- Compact float32 embeddings: records wrap ndarray/array('f') values, and the in-memory
+  backend stores and searches them without boxing when ``compact_embeddings`` is set
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import cast
+
+import numpy as np
+
+from memu.app.settings import DatabaseConfig, DefaultUserModel, MetadataStoreConfig
+from memu.database.embedding import CompactEmbedding, LazyEmbedding
+from memu.database.inmemory import build_inmemory_database
+from memu.database.models import Embedding, MemoryItem
+from memu.database.sqlite import build_sqlite_database
+
+
+def _store(path):
+    config = DatabaseConfig(metadata_store=MetadataStoreConfig(provider="sqlite", dsn=f"sqlite:///{path}"))
+    return build_sqlite_database(config=config, user_model=DefaultUserModel)
+
+
+class TestLazyEmbeddings:
+    def test_sqlite_reads_stay_encoded(self, tmp_path):
+        path = tmp_path / "memu.db"
+        writer = _store(path)
+        reader = _store(path)
+        try:
+            item = writer.memory_item_repo.create_item(
+                resource_id="r", memory_type="event", summary="a", embedding=[0.5, 1.0, 2.0], user_data={}
+            )
+            loaded = reader.memory_item_repo.get_item(item.id)
+            embedding = loaded.embedding
+            assert isinstance(embedding, LazyEmbedding)
+            assert not embedding.decoded
+            assert len(embedding) == 3
+
+            assert np.asarray(embedding).dtype == np.float32
+            assert embedding.decoded
+            assert embedding == [0.5, 1.0, 2.0]
+            assert loaded.model_dump()["embedding"] == [0.5, 1.0, 2.0]
+            assert loaded.model_dump_json().count("[0.5,1.0,2.0]") == 1
+        finally:
+            writer.close()
+            reader.close()
+
+    def test_projection_skips_embeddings(self, tmp_path):
+        path = tmp_path / "memu.db"
+        writer = _store(path)
+        reader = _store(path)
+        try:
+            item = writer.memory_item_repo.create_item(
+                resource_id="r", memory_type="event", summary="a", embedding=[1.0, 0.0], user_data={}
+            )
+            writer.memory_category_repo.get_or_create_category(
+                name="work", description="jobs", embedding=[0.0, 1.0], user_data={}
+            )
+
+            items = reader.memory_item_repo.list_items(with_embeddings=False)
+            assert items[item.id].summary == "a"
+            assert items[item.id].embedding is None
+            assert item.id not in reader.items
+            assert reader.memory_item_repo.get_items([item.id], with_embeddings=False)[item.id].embedding is None
+
+            categories = reader.memory_category_repo.list_categories(with_embeddings=False)
+            assert [cat.embedding for cat in categories.values()] == [None]
+            assert not reader.categories
+
+            assert reader.memory_item_repo.list_items()[item.id].embedding == [1.0, 0.0]
+        finally:
+            writer.close()
+            reader.close()
+
+    def test_records_wrap_float32_arrays(self):
+        source = np.array([1.0, 2.0], dtype=np.float32)
+        # Raw arrays are not part of the static type; the validator wraps them at runtime
+        item = MemoryItem(resource_id=None, memory_type="event", summary="a", embedding=cast(Embedding, source))
+        assert isinstance(item.embedding, CompactEmbedding)
+        source[0] = 9.0
+        assert item.embedding == [1.0, 2.0]
+
+        packed = MemoryItem(
+            resource_id=None, memory_type="event", summary="a", embedding=cast(Embedding, array("f", [3.0]))
+        )
+        assert isinstance(packed.embedding, CompactEmbedding)
+        assert MemoryItem.model_validate_json(packed.model_dump_json()).embedding == [3.0]
+        assert MemoryItem(resource_id=None, memory_type="event", summary="a", embedding=[1, 2]).embedding == [1.0, 2.0]
+
+    def test_inmemory_compact_embeddings(self):
+        config = DatabaseConfig(metadata_store=MetadataStoreConfig(provider="inmemory", compact_embeddings=True))
+        store = build_inmemory_database(config=config, user_model=DefaultUserModel)
+        repo = store.memory_item_repo
+        near = repo.create_item(
+            resource_id="r", memory_type="event", summary="near", embedding=[1.0, 0.0], user_data={}
+        )
+        repo.create_item(resource_id="r", memory_type="event", summary="far", embedding=[0.0, 1.0], user_data={})
+        assert isinstance(near.embedding, CompactEmbedding)
+        assert near.embedding.array.dtype == np.float32
+
+        assert repo.vector_search_items([0.9, 0.1], 1)[0][0] == near.id
+        category = store.memory_category_repo.get_or_create_category(
+            name="work", description="jobs", embedding=[0.0, 1.0], user_data={}
+        )
+        assert isinstance(category.embedding, CompactEmbedding)
@@ -0,0 +1,81 @@
+"""
+Tests for the bounded memory item cache of the SQL backends:
+- LRU eviction, TTL expiry and hit/miss counters
+- SQLite reads fall back to the database for evicted items
+- Version-column checks reload rows changed through another store
+"""
+
+from __future__ import annotations
+
+from memu.app.settings import DatabaseConfig, DefaultUserModel, ItemCacheConfig, MetadataStoreConfig
+from memu.database.item_cache import ItemCache
+from memu.database.models import MemoryItem
+from memu.database.sqlite import build_sqlite_database
+
+
+def _item(item_id: str) -> MemoryItem:
+    return MemoryItem(id=item_id, resource_id=None, memory_type="event", summary=item_id, embedding=None)
+
+
+def _store(path, **cache):
+    config = DatabaseConfig(
+        metadata_store=MetadataStoreConfig(
+            provider="sqlite", dsn=f"sqlite:///{path}", item_cache=ItemCacheConfig(**cache)
+        )
+    )
+    return build_sqlite_database(config=config, user_model=DefaultUserModel)
+
+
+def _add(store, summary):
+    return store.memory_item_repo.create_item(
+        resource_id="r", memory_type="event", summary=summary, embedding=[1.0, 0.0], user_data={"user_id": "u1"}
+    )
+
+
+class TestItemCache:
+    def test_lru_eviction_and_ttl(self):
+        now = [0.0]
+        cache = ItemCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+        cache["a"] = _item("a")
+        cache["b"] = _item("b")
+        assert cache.lookup("a") is not None
+        cache["c"] = _item("c")
+        assert list(cache) == ["a", "c"]
+        assert cache.lookup("b") is None
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (1, 1, 1)
+
+        now[0] = 11.0
+        assert cache.lookup("a") is None
+        assert len(cache) == 0
+        assert cache.stats.expirations == 2
+
+    def test_sqlite_reads_past_capacity(self, tmp_path):
+        store = _store(tmp_path / "memu.db", max_entries=2)
+        try:
+            items = [_add(store, f"event {i}") for i in range(3)]
+            assert len(store.items) == 2
+
+            ids = [item.id for item in items]
+            found = store.memory_item_repo.get_items(ids)
+            assert [item.summary for item in found.values()] == ["event 0", "event 1", "event 2"]
+            assert store.memory_item_repo.get_item(ids[0]).summary == "event 0"
+            assert store.items.stats.hits >= 1
+            assert store.items.stats.misses >= 1
+        finally:
+            store.close()
+
+    def test_version_column_reloads_changed_rows(self, tmp_path):
+        path = tmp_path / "memu.db"
+        reader = _store(path, version_column="updated_at")
+        writer = _store(path)
+        try:
+            item = _add(reader, "before")
+            assert reader.memory_item_repo.get_item(item.id).summary == "before"
+            assert reader.items.stats.invalidations == 0
+
+            writer.memory_item_repo.update_item(item_id=item.id, summary="after")
+            assert reader.memory_item_repo.get_item(item.id).summary == "after"
+            assert reader.items.stats.invalidations == 1
+        finally:
+            reader.close()
+            writer.close()
@@ -0,0 +1,293 @@
+"""
+Tests for the SQL the Postgres backend emits, compiled with the postgresql dialect (no live database):
+- Salience search ranks an ANN candidate subquery of max(top_k * 10, 100) rows
+- Reinforcement x recency scoring and scope filters inside the candidate set
+- Malformed last_reinforced_at values are never cast
+- Reinforce writes take sorted, scope-keyed advisory locks before the dedup lookup
+- SET LOCAL ANN query parameters, with hnsw.ef_search widened to the salience candidate limit
+- HNSW / IVFFlat CREATE INDEX DDL, typed vector(n) columns and positive index settings
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, cast
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from memu.app.settings import DefaultUserModel, VectorIndexConfig
+from memu.database.postgres.repositories.memory_item_repo import PostgresMemoryItemRepo
+from memu.database.postgres.schema import VectorIndexOptions, build_vector_index, get_sqlalchemy_models
+from memu.database.postgres.session import SessionManager
+from memu.database.state import DatabaseState
+
+
+class _Result:
+    def all(self) -> list[Any]:
+        return []
+
+
+class _RecordingSession:
+    def __init__(self, statements: list[Any]) -> None:
+        self.statements = statements
+
+    def __enter__(self) -> _RecordingSession:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, stmt: Any, params: dict[str, Any] | None = None) -> _Result:
+        self.statements.append((stmt, params) if params is not None else stmt)
+        return _Result()
+
+    def scalar(self, stmt: Any) -> None:
+        self.statements.append(stmt)
+
+    def scalars(self, stmt: Any) -> _Result:
+        self.statements.append(stmt)
+        return _Result()
+
+    def add(self, row: Any) -> None:
+        return None
+
+    def commit(self) -> None:
+        self.statements.append("COMMIT")
+
+    def refresh(self, row: Any) -> None:
+        return None
+
+
+class _RecordingSessions:
+    def __init__(self) -> None:
+        self.statements: list[Any] = []
+
+    def session(self) -> _RecordingSession:
+        return _RecordingSession(self.statements)
+
+
+def _repo(*, ef_search: int | None = None, probes: int | None = None) -> tuple[PostgresMemoryItemRepo, list[Any]]:
+    models = get_sqlalchemy_models(scope_model=DefaultUserModel)
+    sessions = _RecordingSessions()
+    repo = PostgresMemoryItemRepo(
+        state=DatabaseState(),
+        memory_item_model=models.MemoryItem,
+        sqla_models=models,
+        sessions=cast(SessionManager, sessions),
+        scope_fields=["user_id"],
+        use_vector=True,
+        ef_search=ef_search,
+        probes=probes,
+    )
+    return repo, sessions.statements
+
+
+def _compile(stmt: Any) -> tuple[str, dict[str, Any]]:
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    return " ".join(str(compiled).split()), compiled.params
+
+
+def _limit(stmt: Any) -> int:
+    sql, params = _compile(stmt)
+    match = re.search(r"LIMIT %\((\w+)\)s$", sql)
+    assert match is not None, sql
+    return int(params[match.group(1)])
+
+
+def _candidates(stmt: Any) -> Any:
+    """The ANN candidate subquery the salience statement ranks."""
+    return stmt.get_final_froms()[0].element
+
+
+class TestSalienceSearchSQL:
+    def test_candidates_are_the_ann_nearest_rows(self):
+        repo, statements = _repo()
+        repo.vector_search_items([0.1, 0.2], 5, where={"user_id": "u1"}, ranking="salience")
+
+        stmt = statements[-1]
+        sql, params = _compile(_candidates(stmt))
+        assert "ORDER BY memory_items.embedding <=> %(embedding_1)s LIMIT" in sql
+        assert _limit(_candidates(stmt)) == 100
+        assert "memory_items.embedding IS NOT NULL" in sql
+        # Scope filters narrow the candidate set itself, not the re-ranked rows
+        assert "memory_items.user_id = %(user_id_1)s" in sql
+        assert params["user_id_1"] == "u1"
+        assert stmt.whereclause is None
+
+    def test_candidate_limit_scales_with_top_k(self):
+        repo, statements = _repo()
+        repo.vector_search_items([0.1, 0.2], 25, ranking="salience")
+
+        stmt = statements[-1]
+        assert _limit(_candidates(stmt)) == 250
+        assert _limit(stmt) == 25
+
+    def test_score_is_similarity_times_reinforcement_times_recency(self):
+        repo, statements = _repo()
+        repo.vector_search_items([0.1, 0.2], 5, ranking="salience", recency_decay_days=7.0)
+
+        stmt = statements[-1]
+        sql, params = _compile(stmt)
+        assert "anon_1.similarity * ln(coalesce(CAST(anon_1.reinforcement_count AS FLOAT)" in sql
+        assert "exp(" in sql
+        assert "ORDER BY score DESC" in sql
+        assert 7.0 in params.values()
+        assert 0.5 in params.values()
+        assert pytest.approx(-math.log(2)) in params.values()
+
+    def test_last_reinforced_at_is_cast_only_when_well_formed(self):
+        repo, statements = _repo()
+        repo.vector_search_items([0.1, 0.2], 5, ranking="salience")
+
+        sql, params = _compile(statements[-1])
+        guarded = (
+            "CASE WHEN (anon_1.last_reinforced_at ~ %(last_reinforced_at_1)s) "
+            "THEN CAST(anon_1.last_reinforced_at AS TIMESTAMP WITH TIME ZONE) END"
+        )
+        assert f"CASE WHEN ({guarded} IS NULL) THEN" in sql
+        pattern = re.compile(params["last_reinforced_at_1"])
+        for value in ("2026-03-01T12:30:00+00:00", "2026-03-01 12:30:00.123456", "2026-03-01", "2026-03-01T12:30Z"):
+            assert pattern.match(value), value
+        for value in ("yesterday", "2026-13-01", "2026-03-01T25:00:00", "", "1.7e9"):
+            assert not pattern.match(value), value
+
+    def test_reinforcement_fields_come_from_extra(self):
+        repo, statements = _repo()
+        repo.vector_search_items([0.1, 0.2], 5, ranking="salience")
+
+        stmt = statements[-1]
+        sql, params = _compile(_candidates(stmt))
+        assert "memory_items.extra ->> %(extra_1)s AS reinforcement_count" in sql
+        assert "memory_items.extra ->> %(extra_2)s AS last_reinforced_at" in sql
+        assert (params["extra_1"], params["extra_2"]) == ("reinforcement_count", "last_reinforced_at")
+
+
+class TestSearchParams:
+    def test_set_local_is_issued_before_the_search(self):
+        repo, statements = _repo(ef_search=120, probes=12)
+        repo.vector_search_items([0.1, 0.2], 5, ranking="salience")
+
+        assert [str(s) for s in statements[:2]] == ["SET LOCAL hnsw.ef_search = 120", "SET LOCAL ivfflat.probes = 12"]
+        assert len(statements) == 3
+
+    def test_configured_ef_search_is_used_as_is_for_plain_search(self):
+        repo, statements = _repo(ef_search=80)
+        repo.vector_search_items([0.1, 0.2], 5)
+
+        assert str(statements[0]) == "SET LOCAL hnsw.ef_search = 80"
+
+    @pytest.mark.parametrize(
+        ("ef_search", "top_k", "expected"),
+        [(None, 5, 100), (40, 5, 100), (400, 5, 400), (None, 25, 250), (None, 500, 1000)],
+    )
+    def test_salience_widens_ef_search_to_the_candidate_limit(self, ef_search, top_k, expected):
+        repo, statements = _repo(ef_search=ef_search)
+        repo.vector_search_items([0.1, 0.2], top_k, ranking="salience")
+
+        assert str(statements[0]) == f"SET LOCAL hnsw.ef_search = {expected}"
+        assert len(statements) == 2
+
+    def test_no_set_local_without_params(self):
+        repo, statements = _repo()
+        repo.vector_search_items([0.1, 0.2], 5)
+
+        assert len(statements) == 1
+        assert "SET LOCAL" not in str(statements[0])
+
+
+class TestReinforceLocking:
+    def test_reinforce_locks_the_hash_before_the_dedup_lookup(self):
+        repo, statements = _repo()
+        repo.create_item_reinforce(
+            memory_type="profile", summary="likes tea", embedding=[1.0, 0.0], user_data={"user_id": "u1"}
+        )
+
+        (lock, params), lookup, commit = statements
+        assert str(lock) == "SELECT pg_advisory_xact_lock(hashtext(key)) FROM unnest(:keys) AS key"
+        (key,) = params["keys"]
+        assert key.startswith("memory_items:") and key.endswith(':{"user_id": "u1"}')
+        assert "memory_items.content_hash =" in _compile(lookup)[0]
+        assert commit == "COMMIT"
+
+    def test_bulk_locks_distinct_hashes_in_sorted_order(self):
+        repo, statements = _repo()
+        repo.create_items_bulk(
+            entries=[("event", "b", [0.0, 1.0]), ("event", "a", [1.0, 0.0]), ("event", "b", [0.0, 1.0])],
+            user_data={"user_id": "u1"},
+            reinforce=True,
+        )
+
+        (_lock, params), _lookup, _commit = statements
+        keys = params["keys"]
+        assert len(keys) == 2
+        assert keys == sorted(keys)
+
+    def test_scopes_take_different_locks(self):
+        repo, statements = _repo()
+        for user_id in ("u1", "u2"):
+            repo.create_item_reinforce(
+                memory_type="profile", summary="likes tea", embedding=[1.0, 0.0], user_data={"user_id": user_id}
+            )
+
+        first, second = (s[1]["keys"] for s in statements if isinstance(s, tuple))
+        assert first != second
+
+    def test_plain_bulk_insert_takes_no_lock(self):
+        repo, statements = _repo()
+        repo.create_items_bulk(entries=[("event", "a", [1.0, 0.0])], user_data={"user_id": "u1"})
+
+        assert statements == ["COMMIT"]
+
+
+def _ddl(element: Any) -> str:
+    return " ".join(str(element.compile(dialect=postgresql.dialect())).split())
+
+
+class TestVectorIndexDDL:
+    def test_hnsw_index(self):
+        models = get_sqlalchemy_models(
+            scope_model=DefaultUserModel, vector_index=VectorIndexOptions(dimensions=8, m=24, ef_construction=80)
+        )
+        (index,) = [i for i in models.MemoryItem.__table__.indexes if i.name.endswith("_hnsw")]
+
+        assert _ddl(CreateIndex(index)) == (
+            "CREATE INDEX ix_memory_items__embedding_hnsw ON memory_items "
+            "USING hnsw (embedding vector_cosine_ops) WITH (m = 24, ef_construction = 80)"
+        )
+
+    def test_ivfflat_index(self):
+        options = VectorIndexOptions(dimensions=8, index_type="ivfflat", lists=50)
+        models = get_sqlalchemy_models(scope_model=DefaultUserModel, vector_index=options)
+        (index,) = [i for i in models.Resource.__table__.indexes if i.name.endswith("_ivfflat")]
+
+        assert _ddl(CreateIndex(index)) == (
+            "CREATE INDEX ix_resources__embedding_ivfflat ON resources "
+            "USING ivfflat (embedding vector_cosine_ops) WITH (lists = 50)"
+        )
+
+    def test_embedding_columns_are_typed_with_dimensions(self):
+        models = get_sqlalchemy_models(scope_model=DefaultUserModel, vector_index=VectorIndexOptions(dimensions=8))
+
+        assert "embedding VECTOR(8)" in _ddl(CreateTable(models.MemoryItem.__table__))
+        category_ddl = _ddl(CreateTable(models.MemoryCategory.__table__))
+        assert "embedding VECTOR(8)" in category_ddl
+        assert "summary_embedding VECTOR(8)" in category_ddl
+
+    def test_untyped_columns_and_no_index_without_dimensions(self):
+        models = get_sqlalchemy_models(scope_model=DefaultUserModel, vector_index=VectorIndexOptions())
+
+        assert "embedding VECTOR," in _ddl(CreateTable(models.MemoryItem.__table__))
+        assert not [i for i in models.MemoryItem.__table__.indexes if "embedding" in i.name]
+
+    def test_build_vector_index_names_the_method(self):
+        index = build_vector_index("memory_items", VectorIndexOptions(dimensions=4, index_type="ivfflat"))
+        assert index.name == "ix_memory_items__embedding_ivfflat"
+
+    @pytest.mark.parametrize("field", ["m", "ef_construction", "lists", "ef_search", "probes"])
+    def test_index_settings_must_be_positive(self, field):
+        with pytest.raises(ValidationError):
+            VectorIndexConfig.model_validate({"provider": "pgvector", field: 0})
@@ -0,0 +1,55 @@
+"""
+Tests for RAG retrieve record loading:
+- Item recall fetches only the hit records, never the whole scoped pool
+- The response is built from those records
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from memu.app import MemoryService
+from memu.workflow.step import WorkflowState
+
+
+def _fail(*_args, **_kwargs):
+    msg = "full pool loaded"
+    raise AssertionError(msg)
+
+
+class TestRetrievePools:
+    def test_rag_item_recall_fetches_hits_only(self, monkeypatch: pytest.MonkeyPatch):
+        service = MemoryService(llm_profiles={"default": {"api_key": "test"}})
+        store = service._get_database()
+        repo = store.memory_item_repo
+        for i in range(5):
+            repo.create_item(
+                resource_id="r",
+                memory_type="event",
+                summary=f"event {i}",
+                embedding=[1.0, float(i)],
+                user_data={"user_id": "u1"},
+            )
+        monkeypatch.setattr(repo, "list_items", _fail)
+        monkeypatch.setattr(store.memory_category_repo, "list_categories", _fail)
+        monkeypatch.setattr(store.resource_repo, "list_resources", _fail)
+
+        state: WorkflowState = {
+            "retrieve_item": True,
+            "needs_retrieval": True,
+            "proceed_to_items": True,
+            "store": store,
+            "where": service._normalize_where({"user_id": "u1"}),
+            "query_vector": [1.0, 0.0],
+            "active_query": "q",
+            "original_query": "q",
+        }
+        service.retrieve_config.item.top_k = 2
+        state = asyncio.run(service._rag_recall_items(state, None))
+        state = asyncio.run(service._rag_build_context(state, None))
+
+        assert [iid for iid, _ in state["item_hits"]] == list(state["item_pool"])
+        assert len(state["item_pool"]) == 2
+        assert [item["summary"] for item in state["response"]["items"]] == ["event 0", "event 1"]
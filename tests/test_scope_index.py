@@ -0,0 +1,59 @@
+"""
+Tests for scope-indexed filtering in the in-memory repositories:
+- Scoped queries return the same records, in insertion order, as a full scan
+- The index follows deletes and clears
+"""
+
+from __future__ import annotations
+
+from memu.app.settings import DatabaseConfig, DefaultUserModel, MetadataStoreConfig
+from memu.database.filters import WhereFilter
+from memu.database.inmemory import build_inmemory_database
+
+
+def _store():
+    config = DatabaseConfig(metadata_store=MetadataStoreConfig(provider="inmemory"))
+    return build_inmemory_database(config=config, user_model=DefaultUserModel)
+
+
+def _add(repo, summary, user_id):
+    return repo.create_item(
+        resource_id="r", memory_type="event", summary=summary, embedding=[1.0, 0.0], user_data={"user_id": user_id}
+    )
+
+
+class TestScopeIndex:
+    def test_scoped_queries_match_full_scan(self):
+        store = _store()
+        repo = store.memory_item_repo
+        for i in range(6):
+            _add(repo, f"event {i}", f"u{i % 3}")
+
+        for where in ({"user_id": "u1"}, {"user_id__in": ["u2", "u0"]}, {"user_id": "u1", "memory_type": "event"}):
+            compiled = WhereFilter(where)
+            expected = [mid for mid, item in store.items.items() if compiled.matches(item)]
+            assert list(repo.list_items(where)) == expected
+
+        hits = repo.vector_search_items([1.0, 0.0], top_k=10, where={"user_id": "u2"})
+        assert {mid for mid, _ in hits} == set(repo.list_items({"user_id": "u2"}))
+
+    def test_index_follows_deletes_and_clears(self):
+        store = _store()
+        repo = store.memory_item_repo
+        first = _add(repo, "a", "u1")
+        _add(repo, "b", "u1")
+        _add(repo, "c", "u2")
+
+        repo.delete_item(first.id)
+        assert [item.summary for item in repo.list_items({"user_id": "u1"}).values()] == ["b"]
+
+        cleared = repo.clear_items({"user_id": "u1"})
+        assert [item.summary for item in cleared.values()] == ["b"]
+        assert repo.list_items({"user_id": "u1"}) == {}
+        assert [item.summary for item in repo.list_items({"user_id": "u2"}).values()] == ["c"]
+
+        store.resource_repo.create_resource(
+            url="u", modality="text", local_path="p", caption=None, embedding=None, user_data={"user_id": "u1"}
+        )
+        store.resource_repo.clear_resources({"user_id": "u1"})
+        assert store.resources == {}
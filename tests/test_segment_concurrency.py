@@ -0,0 +1,103 @@
+"""
+Tests for bounded segment concurrency during memorize:
+- Segment captioning and extraction never exceed segment_concurrency in-flight LLM calls
+- Captions and resource_plans keep segment order when calls finish out of order
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from typing import Any
+
+import pytest
+
+from memu.app import MemoryService
+
+_SEGMENTS = 6
+
+
+class _InFlight:
+    """Counts concurrent calls and makes later segments finish first."""
+
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+
+    async def run(self, idx: int) -> None:
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        try:
+            await asyncio.sleep(0.01 * (_SEGMENTS - idx))
+        finally:
+            self.current -= 1
+
+
+class _StubLLM:
+    def __init__(self) -> None:
+        self.in_flight = _InFlight()
+
+    async def summarize(self, prompt, system_prompt=None):
+        if "Summarize the following conversation segment" not in prompt:
+            # Conversation preprocess: one segment per message line
+            return json.dumps({"segments": [{"start": i, "end": i} for i in range(_SEGMENTS)]})
+        match = re.search(r"msg-(\d+)", prompt)
+        assert match is not None
+        idx = int(match.group(1))
+        await self.in_flight.run(idx)
+        return f"caption {idx}"
+
+
+def _service(limit: int) -> MemoryService:
+    return MemoryService(
+        llm_profiles={"default": {"api_key": "test"}},
+        memorize_config={"segment_concurrency": limit},
+    )
+
+
+def _conversation() -> str:
+    return json.dumps([{"role": "user", "content": f"msg-{i}"} for i in range(_SEGMENTS)])
+
+
+class TestSegmentConcurrency:
+    @pytest.mark.parametrize("limit", [1, 2, 4])
+    def test_captions_are_bounded_and_ordered(self, limit):
+        service = _service(limit)
+        client = _StubLLM()
+
+        resources = asyncio.run(service._preprocess_conversation(_conversation(), "{conversation}", llm_client=client))
+
+        assert client.in_flight.peak == limit
+        assert [r["caption"] for r in resources] == [f"caption {i}" for i in range(_SEGMENTS)]
+        assert all(f"msg-{i}" in str(r["text"]) for i, r in enumerate(resources))
+
+    @pytest.mark.parametrize("limit", [1, 3])
+    def test_resource_plans_are_bounded_and_ordered(self, limit, monkeypatch):
+        service = _service(limit)
+        in_flight = _InFlight()
+
+        async def _entries(*, resource_url, text, **_kwargs):
+            idx = int(text.removeprefix("segment "))
+            await in_flight.run(idx)
+            return [("event", f"entry {idx}", [])]
+
+        monkeypatch.setattr(service, "_generate_structured_entries", _entries)
+        state: dict[str, Any] = {
+            "resource_url": "conv.json",
+            "modality": "conversation",
+            "memory_types": ["event"],
+            "categories_prompt_str": "",
+            "preprocessed_resources": [{"text": f"segment {i}", "caption": f"c{i}"} for i in range(_SEGMENTS)],
+        }
+
+        result = asyncio.run(service._memorize_extract_items(state, step_context=None))
+
+        assert in_flight.peak == limit
+        plans: list[dict[str, Any]] = list(result["resource_plans"])
+        assert [p["text"] for p in plans] == [f"segment {i}" for i in range(_SEGMENTS)]
+        assert [p["caption"] for p in plans] == [f"c{i}" for i in range(_SEGMENTS)]
+        assert [p["entries"] for p in plans] == [[("event", f"entry {i}", [])] for i in range(_SEGMENTS)]
+        assert [p["resource_url"] for p in plans] == [
+            service._segment_resource_url("conv.json", i, _SEGMENTS) for i in range(_SEGMENTS)
+        ]
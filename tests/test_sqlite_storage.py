@@ -0,0 +1,189 @@
+"""
+Tests for SQLite embedding storage:
+- float32 BLOB round trip through the repositories
+- Migration of legacy JSON text embeddings
+- The search matrix is patched by local writes and reloaded after writes from another connection
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+import numpy as np
+
+from memu.app.settings import DatabaseConfig, DefaultUserModel, MetadataStoreConfig
+from memu.database.sqlite import build_sqlite_database
+
+
+def _build_store(path):
+    config = DatabaseConfig(metadata_store=MetadataStoreConfig(provider="sqlite", dsn=f"sqlite:///{path}"))
+    return build_sqlite_database(config=config, user_model=DefaultUserModel)
+
+
+class TestSQLiteEmbeddingStorage:
+    def test_embeddings_stored_as_float32_blob(self, tmp_path):
+        db_path = tmp_path / "memu.db"
+        store = _build_store(db_path)
+        item = store.memory_item_repo.create_item(
+            resource_id="r",
+            memory_type="profile",
+            summary="likes tea",
+            embedding=[0.25, -1.5, 3.0],
+            user_data={"user_id": "u1"},
+        )
+        store.close()
+
+        with sqlite3.connect(db_path) as conn:
+            blob, raw_json = conn.execute(
+                "SELECT embedding_blob, embedding_json FROM memory_items WHERE id = ?", (item.id,)
+            ).fetchone()
+        assert raw_json is None
+        assert np.frombuffer(blob, dtype="<f4").tolist() == [0.25, -1.5, 3.0]
+
+        reopened = _build_store(db_path)
+        assert reopened.memory_item_repo.list_items()[item.id].embedding == [0.25, -1.5, 3.0]
+        reopened.close()
+
+    def test_legacy_json_rows_are_migrated(self, tmp_path):
+        db_path = tmp_path / "memu.db"
+        store = _build_store(db_path)
+        item = store.memory_item_repo.create_item(
+            resource_id="r",
+            memory_type="profile",
+            summary="likes tea",
+            embedding=[1.0, 2.0],
+            user_data={"user_id": "u1"},
+        )
+        store.close()
+
+        # Rewrite the table to the pre-BLOB layout
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE memory_items SET embedding_json = '[1.0, 2.0]'")
+            conn.execute("ALTER TABLE memory_items DROP COLUMN embedding_blob")
+
+        reopened = _build_store(db_path)
+        assert reopened.memory_item_repo.get_item(item.id).embedding == [1.0, 2.0]
+        reopened.close()
+
+        with sqlite3.connect(db_path) as conn:
+            blob, raw_json = conn.execute("SELECT embedding_blob, embedding_json FROM memory_items").fetchone()
+        assert raw_json is None
+        assert np.frombuffer(blob, dtype="<f4").tolist() == [1.0, 2.0]
+
+
+class TestSQLiteVectorSearch:
+    def test_search_uses_sidecar_matrix(self, tmp_path):
+        db_path = tmp_path / "memu.db"
+        store = _build_store(db_path)
+        repo = store.memory_item_repo
+        a = repo.create_item(
+            resource_id="r", memory_type="profile", summary="a", embedding=[1.0, 0.0], user_data={"user_id": "u1"}
+        )
+        b = repo.create_item(
+            resource_id="r", memory_type="profile", summary="b", embedding=[0.0, 1.0], user_data={"user_id": "u2"}
+        )
+        store.close()
+
+        reopened = _build_store(db_path)
+        repo = reopened.memory_item_repo
+        assert [i for i, _ in repo.vector_search_items([1.0, 0.1], 2)] == [a.id, b.id]
+        assert len(reopened._state.item_vectors) == 2
+
+        # Writes after the first search are picked up by the next one
+        repo.update_item(item_id=b.id, embedding=[1.0, 0.0])
+        assert repo.vector_search_items([1.0, 0.0], 1, where={"user_id": "u2"})[0][0] == b.id
+        repo.delete_item(a.id)
+        assert [i for i, _ in repo.vector_search_items([1.0, 0.0], 5)] == [b.id]
+        reopened.close()
+
+    def test_writes_from_another_connection_reload_the_matrix(self, tmp_path):
+        db_path = tmp_path / "memu.db"
+        reader = _build_store(db_path)
+        writer = _build_store(db_path)
+        a = writer.memory_item_repo.create_item(
+            resource_id="r", memory_type="profile", summary="a", embedding=[1.0, 0.0], user_data={"user_id": "u1"}
+        )
+        repo = reader.memory_item_repo
+        assert [i for i, _ in repo.vector_search_items([1.0, 0.0], 5)] == [a.id]
+
+        b = writer.memory_item_repo.create_item(
+            resource_id="r", memory_type="profile", summary="b", embedding=[0.0, 1.0], user_data={"user_id": "u1"}
+        )
+        assert [i for i, _ in repo.vector_search_items([0.0, 1.0], 5)] == [b.id, a.id]
+
+        writer.memory_item_repo.update_item(item_id=a.id, embedding=[0.0, 1.0])
+        assert repo.vector_search_items([0.0, 1.0], 5)[1] == (a.id, 1.0)
+
+        writer.memory_item_repo.delete_item(b.id)
+        assert [i for i, _ in repo.vector_search_items([0.0, 1.0], 5)] == [a.id]
+        writer.close()
+        reader.close()
+
+    def test_local_writes_patch_the_matrix_without_reloading(self, tmp_path, monkeypatch):
+        store = _build_store(tmp_path / "memu.db")
+        repo = store.memory_item_repo
+        a = repo.create_item(
+            resource_id="r", memory_type="profile", summary="a", embedding=[1.0, 0.0], user_data={"user_id": "u1"}
+        )
+        loads = _count_loads(store, monkeypatch)
+        repo.vector_search_items([1.0, 0.0], 1)
+
+        b, reinforced = (
+            repo.create_item(
+                resource_id="r",
+                memory_type="profile",
+                summary="b",
+                embedding=[0.0, 1.0],
+                user_data={"user_id": "u1"},
+                reinforce=True,
+            )
+            for _ in range(2)
+        )
+        assert reinforced.id == b.id
+        repo.create_items_bulk(
+            resource_id="r",
+            entries=[("profile", "c", [0.5, 0.5]), ("profile", "c", [0.5, 0.5])],
+            user_data={"user_id": "u1"},
+            reinforce=True,
+        )
+        repo.update_item(item_id=a.id, embedding=[0.0, 1.0])
+        repo.delete_item(b.id)
+        repo.clear_items({"summary": "c"})
+        assert [i for i, _ in repo.vector_search_items([0.0, 1.0], 5)] == [a.id]
+        assert loads() == 1
+        store.close()
+
+    def test_foreign_write_between_local_writes_forces_a_reload(self, tmp_path, monkeypatch):
+        db_path = tmp_path / "memu.db"
+        store = _build_store(db_path)
+        repo = store.memory_item_repo
+        a = repo.create_item(
+            resource_id="r", memory_type="profile", summary="a", embedding=[1.0, 0.0], user_data={"user_id": "u1"}
+        )
+        loads = _count_loads(store, monkeypatch)
+        repo.vector_search_items([1.0, 0.0], 1)
+
+        # Any connection bumps the change counter, not only MemU's own repositories
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DELETE FROM memory_items WHERE id = ?", (a.id,))
+        b = repo.create_item(
+            resource_id="r", memory_type="profile", summary="b", embedding=[0.0, 1.0], user_data={"user_id": "u1"}
+        )
+        assert [i for i, _ in repo.vector_search_items([1.0, 0.0], 5)] == [b.id]
+        assert loads() == 2
+        store.close()
+
+
+def _count_loads(store, monkeypatch):
+    """Count full reloads of the store's search matrix."""
+    vectors = store._state.item_vectors
+    clear = vectors.clear
+    loads = 0
+
+    def counting_clear() -> None:
+        nonlocal loads
+        loads += 1
+        clear()
+
+    monkeypatch.setattr(vectors, "clear", counting_clear)
+    return lambda: loads
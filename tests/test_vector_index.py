@@ -0,0 +1,162 @@
+"""
+Tests for the persistent in-memory vector index:
+- Incremental insert / update / delete maintenance
+- Parity with brute-force cosine_topk and scalar salience scoring
+- Repository integration through DatabaseState
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from memu.app.settings import DatabaseConfig, DefaultUserModel
+from memu.database.inmemory import build_inmemory_database
+from memu.database.inmemory.vector import _cosine, cosine_topk, cosine_topk_salience, salience_score
+from memu.database.vector_index import VectorIndex
+
+
+class TestVectorIndex:
+    """Tests for VectorIndex maintenance and search."""
+
+    def test_search_matches_bruteforce(self):
+        """Index search should agree with cosine_topk on ids and scores."""
+        rng = np.random.default_rng(0)
+        corpus = [(f"id{i}", rng.normal(size=16).tolist()) for i in range(300)]
+        index = VectorIndex(initial_capacity=8)
+        index.rebuild(corpus)
+        query = rng.normal(size=16).tolist()
+
+        expected = cosine_topk(query, corpus, k=10)
+        actual = index.search(query, 10)
+
+        assert [i for i, _ in actual] == [i for i, _ in expected]
+        assert np.allclose([s for _, s in actual], [s for _, s in expected], atol=1e-5)
+
+    def test_remove_keeps_rows_packed(self):
+        """Removing a row should move the last row into its slot."""
+        index = VectorIndex()
+        index.upsert("a", [1.0, 0.0])
+        index.upsert("b", [0.0, 1.0])
+        index.upsert("c", [1.0, 1.0])
+
+        index.remove("a")
+
+        assert len(index) == 2
+        assert "a" not in index
+        assert index.row_of("c") == 0
+        assert index.search([1.0, 1.0], 1)[0][0] == "c"
+
+    def test_upsert_replaces_and_none_removes(self):
+        """Upserting an existing id overwrites it; None removes it."""
+        index = VectorIndex()
+        index.upsert("a", [1.0, 0.0])
+        index.upsert("a", [0.0, 1.0])
+        assert len(index) == 1
+        assert index.search([0.0, 1.0], 1)[0][1] > 0.99
+
+        index.upsert("a", None)
+        assert len(index) == 0
+        assert index.search([0.0, 1.0], 1) == []
+
+    def test_candidates_restrict_search(self):
+        """Only candidate ids should be scored when provided."""
+        index = VectorIndex()
+        index.upsert("a", [1.0, 0.0])
+        index.upsert("b", [0.9, 0.1])
+
+        hits = index.search([1.0, 0.0], 5, candidates=["b", "missing"])
+
+        assert [i for i, _ in hits] == ["b"]
+
+
+class TestInMemoryRepositoryIndex:
+    """The in-memory item repository keeps the shared index in sync."""
+
+    def test_crud_keeps_index_in_sync(self):
+        store = build_inmemory_database(config=DatabaseConfig(), user_model=DefaultUserModel)
+        repo = store.memory_item_repo
+        a = repo.create_item(
+            resource_id="r", memory_type="profile", summary="a", embedding=[1.0, 0.0], user_data={"user_id": "u1"}
+        )
+        b = repo.create_item(
+            resource_id="r", memory_type="profile", summary="b", embedding=[0.0, 1.0], user_data={"user_id": "u2"}
+        )
+        assert len(store.state.item_vectors) == 2
+
+        repo.update_item(item_id=b.id, embedding=[1.0, 0.1])
+        assert repo.vector_search_items([1.0, 0.0], 1, where={"user_id": "u2"})[0][0] == b.id
+
+        repo.delete_item(a.id)
+        assert a.id not in store.state.item_vectors
+
+        repo.clear_items({"user_id": "u2"})
+        assert len(store.state.item_vectors) == 0
+        assert store.items is repo.items
+
+
+class TestVectorizedSalience:
+    """Batched salience ranking must agree with the scalar salience_score."""
+
+    def test_cosine_topk_salience_matches_scalar(self):
+        rng = np.random.default_rng(1)
+        now = datetime.now(UTC)
+        corpus = [
+            (
+                f"id{i}",
+                rng.normal(size=8).tolist(),
+                int(rng.integers(1, 20)),
+                None if i % 7 == 0 else now - timedelta(days=float(rng.uniform(0, 90))),
+            )
+            for i in range(200)
+        ]
+        query = rng.normal(size=8).tolist()
+
+        expected = sorted(
+            (
+                (_id, salience_score(_cosine(np.array(query), np.array(vec)), count, ts, 30.0))
+                for _id, vec, count, ts in corpus
+            ),
+            key=lambda x: x[1],
+            reverse=True,
+        )[:10]
+        actual = cosine_topk_salience(query, corpus, k=10, recency_decay_days=30.0)
+
+        assert [i for i, _ in actual] == [i for i, _ in expected]
+        assert np.allclose([s for _, s in actual], [s for _, s in expected], rtol=1e-4)
+
+    def test_repository_salience_uses_reinforcement(self):
+        store = build_inmemory_database(config=DatabaseConfig(), user_model=DefaultUserModel)
+        repo = store.memory_item_repo
+        weak = repo.create_item(
+            resource_id="r",
+            memory_type="profile",
+            summary="likes tea",
+            embedding=[1.0, 0.0],
+            user_data={"user_id": "u1"},
+            reinforce=True,
+        )
+        strong = repo.create_item(
+            resource_id="r",
+            memory_type="profile",
+            summary="likes coffee",
+            embedding=[0.9, 0.1],
+            user_data={"user_id": "u1"},
+            reinforce=True,
+        )
+        for _ in range(5):
+            repo.create_item(
+                resource_id="r",
+                memory_type="profile",
+                summary="likes coffee",
+                embedding=[0.9, 0.1],
+                user_data={"user_id": "u1"},
+                reinforce=True,
+            )
+
+        by_similarity = repo.vector_search_items([1.0, 0.0], 2, where={"user_id": "u1"})
+        by_salience = repo.vector_search_items([1.0, 0.0], 2, where={"user_id": "u1"}, ranking="salience")
+
+        assert by_similarity[0][0] == weak.id
+        assert by_salience[0][0] == strong.id
@@ -0,0 +1,48 @@
+"""
+Tests for the compiled where filter shared by the repositories:
+- It behaves as the cleaned mapping it was built from
+- The Python predicate and SQL clauses agree on field/`__in` semantics
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from memu.app.settings import DatabaseConfig, DefaultUserModel, MetadataStoreConfig
+from memu.database.filters import WhereFilter
+from memu.database.sqlite import build_sqlite_database
+
+
+class TestWhereFilter:
+    def test_mapping_and_predicate(self):
+        where = WhereFilter({"user_id__in": (u for u in ["u1", "u2"]), "agent_id": None})
+
+        assert dict(where) == {"user_id__in": where["user_id__in"]}
+        assert WhereFilter.of(where) is where
+        assert not WhereFilter({"user_id": None})
+        assert where.lookups == [("user_id", tuple(frozenset({"u1", "u2"})))]
+
+        class _Record:
+            user_id = "u2"
+
+        assert where.matches(_Record())
+        assert not WhereFilter({"user_id__in": "u1"}).matches(_Record())
+
+    def test_sql_clauses_filter_sqlite_rows(self, tmp_path):
+        config = DatabaseConfig(metadata_store=MetadataStoreConfig(provider="sqlite", dsn=f"sqlite:///{tmp_path}/m.db"))
+        db = build_sqlite_database(config=config, user_model=DefaultUserModel)
+        for user_id in ("u1", "u2", "u3"):
+            db.resource_repo.create_resource(
+                url=user_id,
+                modality="text",
+                local_path="p",
+                caption=None,
+                embedding=None,
+                user_data={"user_id": user_id},
+            )
+
+        where = WhereFilter({"user_id__in": ["u1", "u3"]})
+        assert sorted(res.url for res in db.resource_repo.list_resources(where).values()) == ["u1", "u3"]
+        with pytest.raises(ValueError, match="Unknown filter field 'agent_id'"):
+            db.resource_repo.list_resources(WhereFilter({"agent_id": "a"}))
+        db.close()